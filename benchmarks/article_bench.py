@@ -0,0 +1,156 @@
+"""
+Article record benchmark - per-article dicts vs. Article records at corpus scale
+
+Articles extracted from the recorded fixture pages are replicated (with
+unique URLs, titles and content) to the requested count, then built both
+ways and serialized to JSON lines:
+  bytes_per_article   tracemalloc bytes retained per record with its keywords and
+                      scraped_at (title/content strings exist beforehand, not counted)
+  build_seconds       building all records (dicts extract keywords eagerly,
+                      Article records on first read)
+  serialize_seconds   json.dumps of every record (keywords resolved here)
+
+Examples:
+  python -m benchmarks.article_bench                  # 100k records
+  python -m benchmarks.article_bench --count 10000 --json article_bench.json
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from config.settings import config
+from config.sources import ALL_SOURCES
+
+FIXTURES_DIR = os.path.join(ROOT_DIR, 'tests', 'fixtures', 'pages')
+DEFAULT_COUNT = 100000
+
+
+def template_articles():
+    """(url, title, content) of every article extracted from the fixture listing pages"""
+    from multi_source_scraper import SimpleConsolidatedScraper
+
+    replay_dir, config.REPLAY_DIR = config.REPLAY_DIR, FIXTURES_DIR
+    templates = []
+    try:
+        for source_config in ALL_SOURCES.values():
+            scraper = SimpleConsolidatedScraper(source_config)
+            for url in source_config['news_urls']:
+                html = scraper.get_page(url)
+                if html:
+                    templates.extend((a.url, a.title, a.content) for a in scraper.process_page(url, html))
+    finally:
+        config.REPLAY_DIR = replay_dir
+    return scraper, templates
+
+
+def corpus(templates, count):
+    """count unique (url, title, content) triples, as a crawl of that size would hold"""
+    return [
+        (f"{url}#{i}", f"{title} {i}", f"{content} {i}")
+        for i, (url, title, content) in ((i, templates[i % len(templates)]) for i in range(count))
+    ]
+
+
+def build_dicts(scraper, rows):
+    source_config = scraper.source_config
+    return [{
+        'url': url,
+        'source': source_config['name'],
+        'category': source_config['category'],
+        'language': source_config['language'],
+        'scraped_at': datetime.now().isoformat(),
+        'title': title,
+        'content': content,
+        'keywords': scraper.extract_keywords(title + " " + content)
+    } for url, title, content in rows]
+
+
+def build_records(scraper, rows):
+    return [scraper.new_article(url, title, content) for url, title, content in rows]
+
+
+def serialize(articles):
+    return [json.dumps(dict(article), ensure_ascii=False) for article in articles]
+
+
+def measure(scraper, rows, build):
+    """Retained bytes per record, build and serialize seconds"""
+    gc.collect()
+    start = time.perf_counter()
+    articles = build(scraper, rows)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    serialize(articles)
+    serialize_seconds = time.perf_counter() - start
+    del articles
+
+    # Memory is traced separately: tracemalloc slows allocation-heavy code down several times
+    gc.collect()
+    tracemalloc.start()
+    articles = build(scraper, rows)
+    for article in articles:
+        article['keywords']  # what every writer reads; resolves lazy keywords
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del articles
+
+    return {
+        'bytes_per_article': round(retained / len(rows)),
+        'build_seconds': round(build_seconds, 4),
+        'serialize_seconds': round(serialize_seconds, 4),
+    }
+
+
+def run_benchmark(count=DEFAULT_COUNT):
+    logging.disable(logging.INFO)
+    try:
+        scraper, templates = template_articles()
+        rows = corpus(templates, count)
+        return {
+            'count': count,
+            'dict': measure(scraper, rows, build_dicts),
+            'article': measure(scraper, rows, build_records),
+        }
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def print_report(report):
+    print(f"\n📦 ARTICLE RECORDS ({report['count']:,} articles)")
+    print("=" * 72)
+    print(f"{'':<12}{'bytes/article':>16}{'build s':>14}{'serialize s':>14}{'total s':>14}")
+    for kind in ('dict', 'article'):
+        stats = report[kind]
+        total = stats['build_seconds'] + stats['serialize_seconds']
+        print(f"{kind:<12}{stats['bytes_per_article']:>16,}{stats['build_seconds']:>14}"
+              f"{stats['serialize_seconds']:>14}{total:>14.4f}")
+    saved = 1 - report['article']['bytes_per_article'] / report['dict']['bytes_per_article']
+    print(f"\nArticle records use {saved:.0%} less memory per article (text excluded)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare per-article dicts with Article records')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help='Articles to build')
+    parser.add_argument('--json', metavar='PATH', help='Also write the results as JSON')
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.count)
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Results written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
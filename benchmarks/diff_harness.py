@@ -0,0 +1,318 @@
+"""
+Differential harness - run two configurations of the extraction pipeline over a
+corpus of saved pages and compare speed, memory and output
+
+A configuration is a comma-separated list of overrides applied by subclassing,
+so scrapers are never modified:
+  parser=<features>          BeautifulSoup backend (html.parser, lxml, html5lib)
+  refine=<module>:<func>     replacement light_refine_content, called as func(scraper, text)
+  scraper=<module>:<Class>   BaseScraper subclass to run (default SimpleConsolidatedScraper)
+
+Examples:
+  python -m benchmarks.diff_harness --b parser=lxml
+  python -m benchmarks.diff_harness --corpus archive --a refine=old_refine:light_refine_content
+  python -m benchmarks.diff_harness --b parser=lxml --match timesofindia --show-diff 5 --json diff.json
+"""
+import argparse
+import difflib
+import gc
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from bs4 import BeautifulSoup
+
+from config.settings import config
+from utils.replay import ReplayCorpus
+
+DEFAULT_CORPUS = os.path.join(ROOT_DIR, 'tests', 'fixtures', 'pages')
+DEFAULT_SCRAPER = 'multi_source_scraper:SimpleConsolidatedScraper'
+DEFAULT_REPEAT = 5
+OPTIONS = ('parser', 'refine', 'scraper')
+
+HARNESS_SOURCE = {
+    "name": "Differential Harness",
+    "base_url": "",
+    "news_urls": [],
+    "category": "news_agriculture",
+    "language": "english",
+    "scrape_method": "synopsis_extraction"
+}
+
+
+def load_object(path):
+    """'package.module:attribute' -> object"""
+    module_name, _, attribute = path.partition(':')
+    if not attribute:
+        raise ValueError(f"Expected module:attribute, got '{path}'")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def parse_spec(spec):
+    """'parser=lxml,refine=mod:func' -> {'parser': 'lxml', 'refine': 'mod:func'}"""
+    options = {}
+    for part in filter(None, (p.strip() for p in (spec or '').split(','))):
+        key, sep, value = part.partition('=')
+        if not sep or key not in OPTIONS:
+            raise ValueError(f"Bad option '{part}', expected one of {', '.join(o + '=...' for o in OPTIONS)}")
+        options[key] = value
+    return options
+
+
+def build_variant(spec):
+    """Scraper subclass with the configuration's overrides applied"""
+    options = parse_spec(spec)
+    base = load_object(options.get('scraper', DEFAULT_SCRAPER))
+    namespace = {}
+
+    features = options.get('parser')
+    if features:
+        def parse_html(self, html_content):
+            self.check_page_limits(html_content)
+            return BeautifulSoup(html_content, features)
+        namespace['parse_html'] = parse_html
+
+    if options.get('refine'):
+        refine = load_object(options['refine'])
+        namespace['light_refine_content'] = lambda self, text: refine(self, text)
+
+    return type(f"Variant{base.__name__}", (base,), namespace)
+
+
+def run_pipeline(scraper, html, url):
+    """parse -> extract -> keywords for one page, as scrape_articles does after the fetch"""
+    with scraper.parsed(html) as soup:
+        extracted = scraper.extract_synopsis_articles(soup, url)
+    return [
+        {
+            'title': item['title'],
+            'content': item['content'],
+            'keywords': scraper.extract_keywords(item['title'] + " " + item['content'])
+        }
+        for item in extracted
+    ]
+
+
+def time_pipeline(scraper, html, url):
+    gc.disable()
+    start = time.perf_counter()
+    try:
+        run_pipeline(scraper, html, url)
+    finally:
+        elapsed = time.perf_counter() - start
+        gc.enable()
+    return elapsed
+
+
+def peak_memory(scraper, html, url):
+    """tracemalloc peak (bytes) and output of one pipeline run"""
+    tracemalloc.start()
+    try:
+        output = run_pipeline(scraper, html, url)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, output
+
+
+def similarity(a, b):
+    if a == b:
+        return 1.0
+    return difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+def article_text(article):
+    return f"{article['title']}\n{article['content']}"
+
+
+def pair_articles(left, right):
+    """[(a or None, b or None)]: same title first, then remaining articles in order"""
+    right_by_title = {}
+    for index, article in enumerate(right):
+        right_by_title.setdefault(article['title'], []).append(index)
+
+    pairs = []
+    used = set()
+    unmatched_left = []
+    for article in left:
+        candidates = right_by_title.get(article['title'])
+        if candidates:
+            index = candidates.pop(0)
+            used.add(index)
+            pairs.append((article, right[index]))
+        else:
+            unmatched_left.append(article)
+
+    unmatched_right = [a for i, a in enumerate(right) if i not in used]
+    for index in range(max(len(unmatched_left), len(unmatched_right))):
+        a = unmatched_left[index] if index < len(unmatched_left) else None
+        b = unmatched_right[index] if index < len(unmatched_right) else None
+        pairs.append((a, b))
+    return pairs
+
+
+def diff_outputs(left, right):
+    """Per-article comparison; missing articles score 0"""
+    rows = []
+    for a, b in pair_articles(left, right):
+        score = similarity(article_text(a), article_text(b)) if a and b else 0.0
+        rows.append({
+            'title_a': a['title'] if a else None,
+            'title_b': b['title'] if b else None,
+            'similarity': round(score, 4),
+            'keywords_equal': bool(a and b and a['keywords'] == b['keywords']),
+            'a': dict(a) if a else None,  # Article records as plain dicts for --json
+            'b': dict(b) if b else None,
+        })
+    return rows
+
+
+@contextmanager
+def quiet_logging():
+    logging.disable(logging.INFO)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def compare_corpus(spec_a, spec_b, corpus_dir=DEFAULT_CORPUS, match=None, repeat=DEFAULT_REPEAT):
+    """Run both configurations on every page in the corpus"""
+    corpus = ReplayCorpus(corpus_dir)
+    urls = [url for url in corpus.urls() if not match or match in url]
+    scraper_a = build_variant(spec_a)(dict(HARNESS_SOURCE))
+    scraper_b = build_variant(spec_b)(dict(HARNESS_SOURCE))
+
+    pages = []
+    with quiet_logging():
+        for url in urls:
+            html = corpus.get(url)
+            if html is None:
+                continue
+
+            # Alternate A/B so drift in machine speed hits both sides equally
+            times_a, times_b = [], []
+            for _ in range(repeat):
+                times_a.append(time_pipeline(scraper_a, html, url))
+                times_b.append(time_pipeline(scraper_b, html, url))
+            peak_a, output_a = peak_memory(scraper_a, html, url)
+            peak_b, output_b = peak_memory(scraper_b, html, url)
+
+            articles = diff_outputs(output_a, output_b)
+            scores = [row['similarity'] for row in articles]
+            pages.append({
+                'url': url,
+                'bytes': len(html),
+                'articles_a': len(output_a),
+                'articles_b': len(output_b),
+                'seconds_a': round(min(times_a), 6),
+                'seconds_b': round(min(times_b), 6),
+                'speedup': round(min(times_a) / min(times_b), 3) if min(times_b) else None,
+                'peak_kb_a': round(peak_a / 1024, 1),
+                'peak_kb_b': round(peak_b / 1024, 1),
+                'similarity': round(sum(scores) / len(scores), 4) if scores else 1.0,
+                'identical': sum(1 for s in scores if s == 1.0),
+                'articles': articles,
+            })
+
+    return {'a': spec_a or 'default', 'b': spec_b or 'default', 'pages': pages, 'summary': summarize(pages)}
+
+
+def summarize(pages):
+    seconds_a = sum(p['seconds_a'] for p in pages)
+    seconds_b = sum(p['seconds_b'] for p in pages)
+    scores = [row['similarity'] for p in pages for row in p['articles']]
+    return {
+        'pages': len(pages),
+        'articles': len(scores),
+        'identical': sum(1 for s in scores if s == 1.0),
+        'similarity': round(sum(scores) / len(scores), 4) if scores else 1.0,
+        'min_similarity': round(min(scores), 4) if scores else 1.0,
+        'speedup': round(seconds_a / seconds_b, 3) if seconds_b else None,
+        'peak_kb_a': max((p['peak_kb_a'] for p in pages), default=0),
+        'peak_kb_b': max((p['peak_kb_b'] for p in pages), default=0),
+    }
+
+
+def print_report(result, show_diff=0):
+    print(f"\n🔬 DIFFERENTIAL RUN   A: {result['a']}   B: {result['b']}")
+    print("=" * 100)
+    print(f"{'page':<46}{'A/B items':>11}{'A ms':>9}{'B ms':>9}{'speedup':>9}{'A KB':>8}{'B KB':>8}{'parity':>8}")
+    print("-" * 100)
+    for page in result['pages']:
+        url = page['url'] if len(page['url']) <= 45 else '…' + page['url'][-44:]
+        items = f"{page['articles_a']}/{page['articles_b']}"
+        speedup = f"{page['speedup']:.2f}x" if page['speedup'] else '-'
+        print(f"{url:<46}{items:>11}{page['seconds_a'] * 1000:>9.2f}{page['seconds_b'] * 1000:>9.2f}"
+              f"{speedup:>9}{page['peak_kb_a']:>8}{page['peak_kb_b']:>8}{page['similarity']:>8.3f}")
+
+    summary = result['summary']
+    print("-" * 100)
+    speedup = f"{summary['speedup']:.2f}x" if summary['speedup'] else '-'
+    print(f"⚡ Speedup (A time / B time): {speedup}")
+    print(f"💾 Peak memory: A {summary['peak_kb_a']} KB, B {summary['peak_kb_b']} KB "
+          f"({summary['peak_kb_b'] - summary['peak_kb_a']:+.1f} KB)")
+    print(f"🧮 Articles identical: {summary['identical']}/{summary['articles']}, "
+          f"mean similarity {summary['similarity']:.4f}, min {summary['min_similarity']:.4f}")
+
+    if not show_diff:
+        return
+    shown = 0
+    for page in result['pages']:
+        for row in page['articles']:
+            if row['similarity'] == 1.0 or shown >= show_diff:
+                continue
+            shown += 1
+            print(f"\n🔍 {page['url']}  similarity {row['similarity']:.3f}")
+            print(f"   A: {row['title_a']}")
+            print(f"   B: {row['title_b']}")
+            a_lines = article_text(row['a']).splitlines() if row['a'] else []
+            b_lines = article_text(row['b']).splitlines() if row['b'] else []
+            for line in list(difflib.unified_diff(a_lines, b_lines, 'A', 'B', lineterm='', n=0))[2:12]:
+                print(f"   {line[:160]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Compare two extraction configurations on saved pages (speed, memory, output parity)'
+    )
+    parser.add_argument('--a', default='', help='Configuration A (default: the scraper as shipped)')
+    parser.add_argument('--b', default='', help='Configuration B')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='Fixture directory or HTML archive')
+    parser.add_argument('--match', help='Only pages whose URL contains this text')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timing repetitions (best is kept)')
+    parser.add_argument('--show-diff', type=int, default=3, metavar='N', help='Print up to N differing articles')
+    parser.add_argument('--fail-below', type=float, metavar='SCORE',
+                        help='Exit 1 if any article similarity is below SCORE (e.g. 1.0 for exact parity)')
+    parser.add_argument('--json', metavar='PATH', help='Also write the full comparison as JSON')
+    args = parser.parse_args(argv)
+
+    # Pages come from the corpus; nothing may reach the network
+    config.REPLAY_DIR = args.corpus
+    try:
+        result = compare_corpus(args.a, args.b, args.corpus, args.match, args.repeat)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+    print_report(result, args.show_diff)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"📝 Comparison written to {args.json}")
+
+    if args.fail_below is not None and result['summary']['min_similarity'] < args.fail_below:
+        print(f"❌ Output parity below {args.fail_below}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
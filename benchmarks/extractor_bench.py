@@ -0,0 +1,297 @@
+"""
+Extractor benchmark - time and allocations per extractor and per pipeline stage
+
+Runs over the recorded pages in tests/fixtures/pages and compares against
+benchmarks/baseline.json. Times are stored relative to a fixed pure-Python
+calibration workload so the baseline carries across machines. The text
+normalization cache is off for the run, so every sample does the full work
+instead of timing cache hits from the previous repetition.
+
+Examples:
+  python -m benchmarks.extractor_bench                    # compare with baseline
+  python -m benchmarks.extractor_bench --update-baseline  # record a new baseline
+  python -m benchmarks.extractor_bench --threshold 0.25   # fail on >25% regressions
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from config.settings import config
+from config.sources import ALL_SOURCES, EXTRA_SOURCES
+from utils.replay import ReplayCorpus
+
+FIXTURES_DIR = os.path.join(ROOT_DIR, 'tests', 'fixtures', 'pages')
+BASELINE_PATH = os.path.join(ROOT_DIR, 'benchmarks', 'baseline.json')
+DEFAULT_THRESHOLD = 0.5  # fail when a stage is more than 50% slower / larger than baseline
+DEFAULT_REPEAT = 20
+
+MATHRUBHUMI_CONFIG = EXTRA_SOURCES['mathrubhumi_agriculture']
+MATHRUBHUMI_ARTICLE_URL = "https://www.mathrubhumi.com/agriculture/news/gac-fruit-farming-kerala-1.9001"
+
+# source key -> listing url, for sources routed through extract_synopsis_articles
+LISTING_SOURCES = {
+    name: ALL_SOURCES[name]['news_urls'][0]
+    for name in ('economic_times_agriculture', 'times_of_india_agriculture', 'testbook_agriculture_schemes')
+}
+
+# extractor name -> (scraper kind, page url, call)
+EXTRACTORS = {
+    'extract_et_complete_articles': (
+        'listing', LISTING_SOURCES['economic_times_agriculture'],
+        lambda s, soup, url: s.extract_et_complete_articles(soup, url)),
+    'extract_toi_complete_articles': (
+        'listing', LISTING_SOURCES['times_of_india_agriculture'],
+        lambda s, soup, url: s.extract_toi_complete_articles(soup, url)),
+    'extract_toi_by_paragraphs': (
+        'listing', LISTING_SOURCES['times_of_india_agriculture'],
+        lambda s, soup, url: s.extract_toi_by_paragraphs(soup, url)),
+    'extract_toi_by_sentences': (
+        'listing', LISTING_SOURCES['times_of_india_agriculture'],
+        lambda s, soup, url: s.extract_toi_by_sentences(soup, url)),
+    'extract_toi_articles': (
+        'listing', LISTING_SOURCES['times_of_india_agriculture'],
+        lambda s, soup, url: s.extract_toi_articles(soup, url)),
+    'extract_testbook_scheme_sections': (
+        'listing', LISTING_SOURCES['testbook_agriculture_schemes'],
+        lambda s, soup, url: s.extract_testbook_scheme_sections(soup)),
+    'extract_testbook_by_headings': (
+        'listing', LISTING_SOURCES['testbook_agriculture_schemes'],
+        lambda s, soup, url: s.extract_testbook_by_headings(soup)),
+    'extract_testbook_by_paragraphs': (
+        'listing', LISTING_SOURCES['testbook_agriculture_schemes'],
+        lambda s, soup, url: s.extract_testbook_by_paragraphs(soup)),
+    'mathrubhumi.find_article_links': (
+        'mathrubhumi', MATHRUBHUMI_CONFIG['news_urls'][0],
+        lambda s, soup, url: s.find_article_links(soup, MATHRUBHUMI_CONFIG['base_url'])),
+    'mathrubhumi.extract_article_title': (
+        'mathrubhumi', MATHRUBHUMI_ARTICLE_URL,
+        lambda s, soup, url: [s.extract_article_title(soup)]),
+    'mathrubhumi.extract_article_content': (
+        'mathrubhumi', MATHRUBHUMI_ARTICLE_URL,
+        lambda s, soup, url: [s.extract_article_content(soup)]),
+    'fixed_mathrubhumi.extract_individual_article_urls': (
+        'fixed_mathrubhumi', MATHRUBHUMI_CONFIG['news_urls'][0],
+        lambda s, soup, url: s.extract_individual_article_urls(soup)),
+}
+
+STAGES = ['parse', 'extract', 'refine', 'keywords']
+
+
+def make_scraper(kind):
+    """Scraper instance for a benchmark kind (no network access is made)"""
+    if kind == 'mathrubhumi':
+        from scrapers.malayalam_media.mathrubhumi import MathrubhumiScraper
+        return MathrubhumiScraper(MATHRUBHUMI_CONFIG)
+    if kind == 'fixed_mathrubhumi':
+        from fixed_mathrubhumi import FixedMathrubhumiScraper
+        return FixedMathrubhumiScraper(MATHRUBHUMI_CONFIG)
+    from multi_source_scraper import SimpleConsolidatedScraper
+    return SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+
+
+def load_page(url):
+    """Recorded HTML for a URL from the fixture corpus"""
+    html = ReplayCorpus.shared(FIXTURES_DIR).get(url)
+    if html is None:
+        raise FileNotFoundError(f"No fixture recorded for {url}")
+    return html
+
+
+def calibrate(rounds=5, size=20000):
+    """Seconds for a fixed pure-Python workload (string + dict churn like the extractors)"""
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        words = {}
+        for i in range(size):
+            text = f"word{i % 500} " * 4
+            for w in text.split():
+                words[w] = words.get(w, 0) + 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure(func, setup=None, repeat=DEFAULT_REPEAT, min_sample=0.005):
+    """Best per-call wall time of func(setup()) plus tracemalloc peak/allocation for one call
+
+    Calls are batched so each timed sample lasts at least min_sample seconds,
+    which keeps sub-millisecond extractors out of timer and scheduler noise.
+    'relative' divides by a calibration run taken right next to the samples,
+    so machine speed drifting mid-run does not show up as a regression.
+    """
+    start = time.perf_counter()
+    result = func(setup() if setup else None)
+    single = max(time.perf_counter() - start, 1e-6)
+    number = max(1, int(min_sample / single))
+
+    best = None
+    calibration = calibrate(rounds=3, size=5000)
+    for _ in range(repeat):
+        args = [setup() if setup else None for _ in range(number)]
+        gc.disable()
+        start = time.perf_counter()
+        for arg in args:
+            func(arg)
+        elapsed = (time.perf_counter() - start) / number
+        gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    calibration = min(calibration, calibrate(rounds=3, size=5000))
+
+    arg = setup() if setup else None
+    tracemalloc.start()
+    func(arg)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': round(best, 6),
+        'relative': round(best / calibration, 4),
+        'peak_kb': round(peak / 1024, 1),
+        'retained_kb': round(current / 1024, 1),
+    }, result
+
+
+def bench_extractors(repeat=DEFAULT_REPEAT):
+    """Per-extractor timings and outputs"""
+    results = {}
+    outputs = {}
+    scrapers = {}
+    for name, (kind, url, call) in EXTRACTORS.items():
+        scraper = scrapers.setdefault(kind, make_scraper(kind))
+        html = load_page(url)
+        stats, output = measure(
+            lambda soup, s=scraper, u=url, c=call: c(s, soup, u),
+            setup=lambda s=scraper, h=html: s.parse_html(h),  # fresh tree: some extractors decompose nodes
+            repeat=repeat
+        )
+        results[name] = stats
+        outputs[name] = output
+    return results, outputs
+
+
+def bench_stages(repeat=DEFAULT_REPEAT):
+    """Per-source timings of parse -> extract -> refine -> keywords"""
+    scraper = make_scraper('listing')
+    results = {}
+    for source, url in LISTING_SOURCES.items():
+        html = load_page(url)
+        parse_stats, soup = measure(lambda _: scraper.parse_html(html), repeat=repeat)
+        extract_stats, articles = measure(
+            lambda tree: scraper.extract_synopsis_articles(tree, url),
+            setup=lambda: scraper.parse_html(html),
+            repeat=repeat
+        )
+        refine_stats, _ = measure(
+            lambda _: [(scraper.light_refine_content(a['title']), scraper.light_refine_content(a['content']))
+                       for a in articles],
+            repeat=repeat
+        )
+        keyword_stats, _ = measure(
+            lambda _: [scraper.extract_keywords(a['title'] + " " + a['content']) for a in articles],
+            repeat=repeat
+        )
+        results[source] = dict(zip(STAGES, [parse_stats, extract_stats, refine_stats, keyword_stats]))
+    return results
+
+
+def run_benchmarks(repeat=DEFAULT_REPEAT):
+    """Full benchmark run; times are also expressed relative to calibration"""
+    logging.disable(logging.INFO)  # extractor INFO logs would dominate the timings
+    cache_size = config.NORMALIZE_CACHE_SIZE
+    config.NORMALIZE_CACHE_SIZE = 0  # repeats would otherwise be served from the normalization cache
+    try:
+        calibration = calibrate()
+        extractors, _ = bench_extractors(repeat)
+        stages = bench_stages(repeat)
+    finally:
+        config.NORMALIZE_CACHE_SIZE = cache_size
+        logging.disable(logging.NOTSET)
+
+    return {'calibration_seconds': round(calibration, 6), 'extractors': extractors, 'stages': stages}
+
+
+def flatten(report):
+    """{'extractors/<name>': stats, 'stages/<source>/<stage>': stats}"""
+    flat = {f"extractors/{name}": stats for name, stats in report['extractors'].items()}
+    for source, stages in report['stages'].items():
+        for stage, stats in stages.items():
+            flat[f"stages/{source}/{stage}"] = stats
+    return flat
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """List of human-readable regressions past the threshold"""
+    regressions = []
+    current = flatten(report)
+    for key, base in flatten(baseline).items():
+        now = current.get(key)
+        if now is None:
+            regressions.append(f"{key}: missing from current run")
+            continue
+        for metric in ('relative', 'peak_kb'):
+            if base.get(metric) and now[metric] > base[metric] * (1 + threshold):
+                change = (now[metric] / base[metric] - 1) * 100
+                regressions.append(f"{key}: {metric} {base[metric]} -> {now[metric]} (+{change:.0f}%)")
+    return regressions
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def print_report(report):
+    print("\n⏱️  EXTRACTOR BENCHMARK")
+    print("=" * 78)
+    print(f"{'name':<56}{'ms':>10}{'peak KB':>12}")
+    print("-" * 78)
+    for key, stats in flatten(report).items():
+        print(f"{key:<56}{stats['seconds'] * 1000:>10.3f}{stats['peak_kb']:>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark extractors against recorded fixtures')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timing repetitions (best is kept)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Allowed regression fraction')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON path')
+    parser.add_argument('--update-baseline', action='store_true', help='Write this run as the new baseline')
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.repeat)
+    print_report(report)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\n📝 Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --update-baseline")
+        return 0
+
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) past {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print(f"\n✅ No regressions past {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
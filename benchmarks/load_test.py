@@ -0,0 +1,233 @@
+"""
+Load test - run the scraping pipeline against the synthetic site and report throughput
+
+Examples:
+  python -m benchmarks.load_test --items 1000
+  python -m benchmarks.load_test --items 100000 --sources economic_times_agriculture
+  python -m benchmarks.load_test --items 500 --latency-ms 50 --error-rate 0.02 --json report.json
+  python -m benchmarks.load_test --items 5000 --pipeline-workers 4   # staged pipeline, 4 extraction processes
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_site import SiteSettings, SyntheticSite, point_source_at
+from config.settings import config
+from config.sources import ALL_SOURCES, EXTRA_SOURCES
+from scrapers.registry import scraper_class
+from utils.file_manager import FileManager
+from utils.pipeline import StagedPipeline
+from utils.staging import StagingArea
+
+def instrumented(scraper_class, latencies, fetched):
+    """Subclass that times every get_page call (URLs go to fetched) and skips politeness sleeps"""
+
+    class LoadTestScraper(scraper_class):
+        def get_page(self, url):
+            fetched.append(url)
+            start = time.perf_counter()
+            try:
+                return super().get_page(url)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+        def rate_limit(self):
+            pass
+
+    LoadTestScraper.__name__ = f"LoadTest{scraper_class.__name__}"
+    return LoadTestScraper
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak /= 1024
+    return peak / 1024.0
+
+
+def check_local(fetched, site):
+    """Fail when any request left the synthetic site: the numbers would measure the internet"""
+    local = urlparse(site.url).netloc
+    foreign = sorted({urlparse(url).netloc for url in fetched} - {local})
+    assert not foreign, f"Load test fetched from outside the synthetic site: {', '.join(foreign)}"
+
+
+def run_pipelined(source_configs, workers, fetched):
+    """Listing sources through the staged pipeline; returns {source: (articles, seconds, latencies)}"""
+    from multi_source_scraper import SimpleConsolidatedScraper
+    per_source = {source_config['name']: [] for source_config in source_configs.values()}
+
+    class PipelineFetchScraper(SimpleConsolidatedScraper):
+        def get_page(self, url):
+            fetched.append(url)
+            start = time.perf_counter()
+            try:
+                return super().get_page(url)
+            finally:
+                per_source[self.source_config['name']].append(time.perf_counter() - start)
+
+        def rate_limit(self):
+            pass
+
+    pipeline = StagedPipeline(SimpleConsolidatedScraper, fetch_class=PipelineFetchScraper, cpu_workers=workers)
+    results = pipeline.run(source_configs)
+    return {
+        name: (result['articles'], result['seconds'], per_source[source_configs[name]['name']])
+        for name, result in results.items()
+    }
+
+
+def run_load_test(settings, source_names, pipeline_workers=None):
+    """Run every selected source against a fresh synthetic site
+
+    pipeline_workers: when set, listing sources run concurrently through the
+    staged pipeline with that many extraction processes
+    """
+    sources = dict(ALL_SOURCES, **EXTRA_SOURCES)
+    results = {}
+    latencies = []
+    fetched = []
+
+    with SyntheticSite(settings) as site, tempfile.TemporaryDirectory() as workdir:
+        config.FRONTIER_DB = os.path.join(workdir, 'frontier.sqlite')  # every run crawls its detail pages
+        config.BREAKER_STATE_FILE = os.path.join(workdir, 'breakers.json')  # injected 503s stay local to the run
+        config.ROBOTS_ENABLED = False  # throughput test: no per-host spacing against the local site
+        staging = StagingArea(None)
+        run_start = time.perf_counter()
+
+        runs = {}
+        if pipeline_workers is not None:
+            listing = {name: point_source_at(name, sources[name], site)
+                       for name in source_names if name not in EXTRA_SOURCES}
+            runs.update(run_pipelined(listing, pipeline_workers, fetched))
+
+        for source_name in source_names:
+            source_config = point_source_at(source_name, sources[source_name], site)
+            if source_name in runs:
+                articles, elapsed, source_latencies = runs[source_name]
+            else:
+                source_latencies = []
+                scraper = instrumented(scraper_class(source_name, source_config), source_latencies, fetched)(source_config)
+
+                start = time.perf_counter()
+                articles = scraper.run()
+                elapsed = time.perf_counter() - start
+
+            staging.add(source_name, source_config, articles)
+            latencies.extend(source_latencies)
+            results[source_name] = {
+                'articles': len(articles),
+                'pages': len(source_latencies),
+                'seconds': round(elapsed, 3),
+                'articles_per_sec': round(len(articles) / elapsed, 1) if elapsed else 0.0,
+                'p50_ms': round(percentile(source_latencies, 50) * 1000, 2),
+                'p99_ms': round(percentile(source_latencies, 99) * 1000, 2),
+            }
+
+        # Consolidated writes are part of the pipeline; keep them out of the repo
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            file_manager = FileManager()
+            file_manager.save_news_consolidated(staging.news_articles)
+            file_manager.save_schemes_consolidated(staging.scheme_articles)
+        finally:
+            os.chdir(cwd)
+
+        total_elapsed = time.perf_counter() - run_start
+        total_articles = len(staging.all_articles)
+        check_local(fetched, site)
+
+        return {
+            'settings': dict(vars(settings), pipeline_workers=pipeline_workers),
+            'sources': results,
+            'total': {
+                'articles': total_articles,
+                'pages': len(latencies),
+                'seconds': round(total_elapsed, 3),
+                'articles_per_sec': round(total_articles / total_elapsed, 1) if total_elapsed else 0.0,
+                'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+                'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+                'peak_rss_mb': round(peak_rss_mb(), 1),
+                'requests_served': site.requests_served,
+                'errors_injected': site.errors_injected,
+            }
+        }
+
+
+def print_report(report):
+    print("\n📊 LOAD TEST REPORT")
+    print("=" * 78)
+    print(f"{'source':<32}{'articles':>10}{'pages':>7}{'sec':>9}{'art/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    print("-" * 78)
+    for name, row in report['sources'].items():
+        print(f"{name:<32}{row['articles']:>10}{row['pages']:>7}{row['seconds']:>9}"
+              f"{row['articles_per_sec']:>10}{row['p50_ms']:>9}{row['p99_ms']:>9}")
+    total = report['total']
+    print("-" * 78)
+    print(f"{'TOTAL':<32}{total['articles']:>10}{total['pages']:>7}{total['seconds']:>9}"
+          f"{total['articles_per_sec']:>10}{total['p50_ms']:>9}{total['p99_ms']:>9}")
+    print(f"\n💾 Peak RSS: {total['peak_rss_mb']} MB")
+    print(f"🌐 Requests served: {total['requests_served']} ({total['errors_injected']} injected errors)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Throughput test against a local synthetic site')
+    parser.add_argument('--items', type=int, default=100, help='Stories/schemes/links per listing page')
+    parser.add_argument('--paragraph-words', type=int, default=60, help='Words per generated paragraph')
+    parser.add_argument('--links', type=int, default=40, help='Extra navigation links per page')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Added latency per response')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Random extra latency per response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of responses that fail with 503')
+    parser.add_argument('--sources', nargs='+', help='Source keys to run (default: all)')
+    parser.add_argument('--pipeline-workers', type=int, metavar='N',
+                        help='Run listing sources through the staged pipeline with N extraction processes')
+    parser.add_argument('--json', metavar='PATH', help='Also write the report as JSON')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    settings = SiteSettings(
+        items=args.items,
+        paragraph_words=args.paragraph_words,
+        links=args.links,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+    )
+    available = list(ALL_SOURCES) + list(EXTRA_SOURCES)
+    source_names = args.sources or available
+    unknown = [name for name in source_names if name not in available]
+    if unknown:
+        parser.error(f"Unknown sources: {', '.join(unknown)}. Available: {', '.join(available)}")
+
+    report = run_load_test(settings, source_names, args.pipeline_workers)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Report written to {args.json}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
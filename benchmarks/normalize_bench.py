@@ -0,0 +1,146 @@
+"""
+Normalization cache benchmark - the replay corpus with and without memoized cleaning
+
+Every source's listing pages (and the detail pages they link to, where the
+corpus has them) run through listing_work / detail_work, and every article's
+keywords are read, the way a worker or a --daemon process handles them.
+The corpus is crawled several times in one process, as recrawls do:
+  cold_seconds   first pass (cache empty: only repeats within the pass hit)
+  warm_seconds   best later pass (unchanged pages are normalized from the cache)
+Both sides start from an empty cache; outputs are checked to be identical.
+
+Examples:
+  python -m benchmarks.normalize_bench
+  python -m benchmarks.normalize_bench --corpus archive --passes 10 --json normalize_bench.json
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from config.settings import config
+from config.sources import ALL_SOURCES, EXTRA_SOURCES
+from utils.text_cache import normalization_cache
+
+DEFAULT_CORPUS = os.path.join(ROOT_DIR, 'tests', 'fixtures', 'pages')
+DEFAULT_PASSES = 5
+SOURCES = dict(ALL_SOURCES, mathrubhumi_agriculture=EXTRA_SOURCES['mathrubhumi_agriculture'])
+
+
+def load_pages(scrapers):
+    """[(scraper, kind, url, html)] for every listing page and its recorded detail pages"""
+    pages = []
+    for scraper in scrapers:
+        for url in scraper.source_config['news_urls']:
+            html = scraper.get_page(url)
+            if not html:
+                continue
+            pages.append((scraper, 'listing', url, html))
+            _, links = scraper.listing_work(url, html)
+            for link in links:
+                detail = scraper.get_page(link)
+                if detail:
+                    pages.append((scraper, 'detail', link, detail))
+    return pages
+
+
+def crawl(pages):
+    """One pass over the corpus: [(url, title, content, keywords)]"""
+    rows = []
+    for scraper, kind, url, html in pages:
+        if kind == 'listing':
+            articles, _ = scraper.listing_work(url, html)
+        else:
+            article = scraper.detail_work(url, html)
+            articles = [article] if article else []
+        rows.extend((article.url, article.title, article.content, article.keywords) for article in articles)
+    return rows
+
+
+def measure(pages, passes):
+    """Cold and best warm pass seconds, with the last pass's output"""
+    normalization_cache.clear()
+    times = []
+    for _ in range(passes):
+        gc.collect()
+        start = time.perf_counter()
+        rows = crawl(pages)
+        times.append(time.perf_counter() - start)
+    warm = min(times[1:]) if len(times) > 1 else times[0]
+    return {'cold_seconds': round(times[0], 4), 'warm_seconds': round(warm, 4)}, rows
+
+
+def run_benchmark(corpus=DEFAULT_CORPUS, passes=DEFAULT_PASSES):
+    from scrapers.registry import create_scraper
+
+    logging.disable(logging.INFO)
+    saved = {name: getattr(config, name) for name in ('REPLAY_DIR', 'NORMALIZE_CACHE_SIZE')}
+    config.REPLAY_DIR = corpus
+    try:
+        scrapers = [create_scraper(name, source_config) for name, source_config in SOURCES.items()]
+        pages = load_pages(scrapers)
+
+        config.NORMALIZE_CACHE_SIZE = 0
+        uncached, rows_uncached = measure(pages, passes)
+        config.NORMALIZE_CACHE_SIZE = saved['NORMALIZE_CACHE_SIZE'] or 20000
+        cached, rows_cached = measure(pages, passes)
+        stats = normalization_cache.stats()
+    finally:
+        normalization_cache.clear()
+        for name, value in saved.items():
+            setattr(config, name, value)
+        logging.disable(logging.NOTSET)
+
+    return {
+        'pages': len(pages),
+        'articles': len(rows_cached),
+        'passes': passes,
+        'uncached': uncached,
+        'cached': cached,
+        'cache': stats,
+        'identical': rows_cached == rows_uncached,
+    }
+
+
+def print_report(report):
+    print(f"\n🧹 NORMALIZATION CACHE ({report['pages']} pages, {report['articles']} articles, "
+          f"{report['passes']} passes)")
+    print("=" * 60)
+    print(f"{'':<12}{'cold s':>16}{'warm s':>16}")
+    for kind in ('uncached', 'cached'):
+        stats = report[kind]
+        print(f"{kind:<12}{stats['cold_seconds']:>16}{stats['warm_seconds']:>16}")
+    for phase in ('cold', 'warm'):
+        cached = report['cached'][f'{phase}_seconds']
+        if cached:
+            print(f"⚡ {phase.capitalize()} speedup: {report['uncached'][f'{phase}_seconds'] / cached:.2f}x")
+    cache = report['cache']
+    print(f"🎯 Hit rate {cache['hit_rate']:.1%} ({cache['hits']:,} hits, {cache['misses']:,} misses, "
+          f"{cache['size']:,} entries, {cache['evictions']:,} evictions)")
+    print(f"{'✅' if report['identical'] else '❌'} Output {'identical' if report['identical'] else 'differs'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Crawl the replay corpus with and without the normalization cache')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='Recorded corpus (archive or fixture dir)')
+    parser.add_argument('--passes', type=int, default=DEFAULT_PASSES, help='Crawls of the corpus per side')
+    parser.add_argument('--json', metavar='PATH', help='Also write the results as JSON')
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.corpus, args.passes)
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Results written to {args.json}")
+    return 0 if report['identical'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Synthetic stand-in for the news sites - local HTTP server for throughput testing
+
+Serves ET / TOI / Testbook / Mathrubhumi-shaped pages generated from templates:
+    /economictimes/news/economy/agriculture        ET listing (.eachStory blocks)
+    /timesofindia/topic/agriculture/news           TOI topic page (paragraph text)
+    /testbook/ias-preparation/agriculture-schemes  Testbook schemes (headings + paragraphs)
+    /mathrubhumi/agriculture                       Mathrubhumi listing (links to detail pages)
+    /mathrubhumi/agriculture/news/<n>              Mathrubhumi article page
+
+Page size, link counts, latency and error rate are configurable.
+"""
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SITE_KINDS = ['economictimes', 'timesofindia', 'testbook', 'mathrubhumi']
+
+LISTING_PATHS = {
+    'economictimes': '/economictimes/news/economy/agriculture',
+    'timesofindia': '/timesofindia/topic/agriculture/news',
+    'testbook': '/testbook/ias-preparation/agriculture-schemes',
+    'mathrubhumi': '/mathrubhumi/agriculture',
+}
+
+WORDS = [
+    'farmers', 'paddy', 'harvest', 'monsoon', 'coconut', 'rubber', 'pepper', 'cardamom',
+    'irrigation', 'fertilizer', 'subsidy', 'market', 'price', 'yield', 'district', 'kerala',
+    'cooperative', 'procurement', 'season', 'rainfall', 'drought', 'dairy', 'organic', 'soil'
+]
+MALAYALAM_WORDS = ['കൃഷി', 'കർഷകർ', 'നെല്ല്', 'തേങ്ങ', 'റബ്ബർ', 'മഴ', 'വിള', 'വിപണി']
+SCHEME_NAMES = ['Pradhan Mantri Kisan Yojana', 'Krishi Vikas Scheme', 'National Farmer Mission', 'PM-Fasal Abhiyan']
+BOILERPLATE = (
+    '<header><nav>' + ''.join(f'<a href="/section/{i}">Section {i}</a>' for i in range(40)) + '</nav></header>'
+    '<div class="ads">Advertisement</div>'
+)
+FOOTER = '<footer>Copyright 2024 All rights reserved. Follow us on social media. Download our app.</footer>'
+
+
+class SiteSettings:
+    """Knobs for the generated pages and the simulated network"""
+
+    def __init__(self, items=100, paragraph_words=60, links=40, latency_ms=0.0,
+                 latency_jitter_ms=0.0, error_rate=0.0, seed=42):
+        self.items = items                      # stories / schemes / article links per listing
+        self.paragraph_words = paragraph_words  # words per generated paragraph
+        self.links = links                      # extra navigation links per page
+        self.latency_ms = latency_ms            # fixed added latency per response
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate            # fraction of responses answered with 503
+        self.seed = seed
+
+
+class PageGenerator:
+    """Deterministic page templates per site kind"""
+
+    def __init__(self, settings):
+        self.settings = settings
+
+    def sentence(self, rng, words=None, vocabulary=WORDS):
+        count = words or self.settings.paragraph_words
+        text = ' '.join(rng.choice(vocabulary) for _ in range(count))
+        return text.capitalize() + '.'
+
+    def nav_links(self, rng):
+        return ''.join(
+            f'<a href="/misc/{rng.randint(0, 10 ** 6)}">link</a>' for _ in range(self.settings.links)
+        )
+
+    def page(self, body):
+        return f'<html><head><title>Agriculture</title></head><body>{BOILERPLATE}{body}{FOOTER}</body></html>'
+
+    def economictimes(self, rng):
+        stories = ''.join(
+            f'<div class="eachStory"><h3>{self.sentence(rng, 8)} {i}</h3>'
+            f'<p>{self.sentence(rng)}</p><span class="date">Jan 01, 2024</span></div>'
+            for i in range(self.settings.items)
+        )
+        return self.page(stories + self.nav_links(rng))
+
+    def timesofindia(self, rng):
+        paras = ''.join(
+            f'<div><p>{self.sentence(rng, 10)} story {i}. {self.sentence(rng)} {self.sentence(rng, 12)}</p></div>\n\n'
+            for i in range(self.settings.items)
+        )
+        return self.page(paras + self.nav_links(rng))
+
+    def testbook(self, rng):
+        sections = ''.join(
+            f'<h2>{rng.choice(SCHEME_NAMES)} {i}</h2>'
+            f'<p>{self.sentence(rng)}</p><p>{self.sentence(rng)}</p>'
+            for i in range(self.settings.items)
+        )
+        return self.page(sections + self.nav_links(rng))
+
+    def mathrubhumi(self, rng):
+        links = ''.join(
+            f'<a href="/mathrubhumi/agriculture/news/{i}">{self.sentence(rng, 5, MALAYALAM_WORDS)}</a>'
+            for i in range(self.settings.items)
+        )
+        return self.page(f'<div class="agriculture-list">{links}</div>' + self.nav_links(rng))
+
+    def mathrubhumi_article(self, rng, number):
+        paras = ''.join(f'<p>{self.sentence(rng, vocabulary=MALAYALAM_WORDS)}</p>' for _ in range(8))
+        return self.page(
+            f'<h1 class="story-headline">{self.sentence(rng, 8, MALAYALAM_WORDS)} {number}</h1>'
+            f'<div class="story-content">{paras}</div>'
+        )
+
+    def render(self, path):
+        """HTML for a request path, or None for unknown paths"""
+        rng = random.Random(f"{self.settings.seed}:{path}")
+        path = path.split('?')[0].rstrip('/')
+        for kind, listing in LISTING_PATHS.items():
+            if path == listing:
+                return getattr(self, kind)(rng)
+        prefix = LISTING_PATHS['mathrubhumi'] + '/news/'
+        if path.startswith(prefix) and path[len(prefix):].isdigit():
+            return self.mathrubhumi_article(rng, int(path[len(prefix):]))
+        return None
+
+
+class SyntheticSite:
+    """Threaded local HTTP server serving generated pages"""
+
+    def __init__(self, settings=None, host='127.0.0.1', port=0):
+        self.settings = settings or SiteSettings()
+        self.generator = PageGenerator(self.settings)
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._lock = threading.Lock()
+        self._error_rng = random.Random(self.settings.seed)
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listing_url(self, kind):
+        return self.url + LISTING_PATHS[kind]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _should_fail(self):
+        with self._lock:
+            self.requests_served += 1
+            if self.settings.error_rate and self._error_rng.random() < self.settings.error_rate:
+                self.errors_injected += 1
+                return True
+        return False
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                delay = site.settings.latency_ms + random.uniform(0, site.settings.latency_jitter_ms)
+                if delay:
+                    time.sleep(delay / 1000.0)
+
+                if site._should_fail():
+                    self.send_error(503, 'Injected failure')
+                    return
+
+                html = site.generator.render(self.path)
+                if html is None:
+                    self.send_error(404)
+                    return
+
+                body = html.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # keep benchmark output clean
+
+        return Handler
+
+
+def site_kind_for(source_name, source_config):
+    """Which synthetic template a configured source should be served from"""
+    haystack = f"{source_name} {source_config.get('base_url', '')}".lower()
+    if 'testbook' in haystack:
+        return 'testbook'
+    if 'timesofindia' in haystack or 'times_of_india' in haystack:
+        return 'timesofindia'
+    if 'mathrubhumi' in haystack:
+        return 'mathrubhumi'
+    return 'economictimes'
+
+
+def point_source_at(source_name, source_config, site):
+    """Copy of an ALL_SOURCES entry whose URLs point at the synthetic site (feeds dropped: they are live URLs)"""
+    kind = site_kind_for(source_name, source_config)
+    pointed = dict(source_config)
+    pointed.pop('feeds', None)
+    pointed['base_url'] = site.url + '/'
+    pointed['news_urls'] = [site.listing_url(kind)]
+    return pointed
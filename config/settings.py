@@ -10,6 +10,8 @@ class Config:
     
     # Scraping Settings
     DEFAULT_DELAY = 2  # seconds between requests
+    MAX_PAGE_BYTES = 5 * 1024 * 1024  # pages larger than this are not parsed
+    MAX_PAGE_NODES = 200000  # upper bound on tags ('<' count) before parsing
     MAX_CONCURRENT_REQUESTS = 5
     REQUEST_TIMEOUT = 30
     RETRY_ATTEMPTS = 3
@@ -18,6 +20,95 @@ class Config:
     OUTPUT_DIR = "output"
     LOGS_DIR = "logs"
     
+    # Logging: queue-based, console + JSON-lines file (file only for CLI entry points)
+    LOG_LEVEL = "INFO"
+    LOG_TO_FILE = True
+    
+    # Per-source snapshots in output/daily (debug/archival only, off by default)
+    SAVE_DAILY_SNAPSHOTS = False
+    
+    # Raw HTML archive (every fetched response, for replay and re-extraction)
+    ARCHIVE_ENABLED = False
+    ARCHIVE_DIR = "archive"
+    ARCHIVE_DICT_SIZE = 64 * 1024  # bytes per trained source dictionary
+    ARCHIVE_DICT_MIN_SAMPLES = 20  # pages per source before a dictionary is trained
+    ARCHIVE_RETENTION_DAYS = 90  # archived responses older than this are pruned after a run (None keeps all)
+    
+    # Offline replay: serve pages from a recorded corpus, no network, no sleeps
+    REPLAY_DIR = None
+    
+    # Prometheus textfile written at the end of every run (node exporter textfile collector)
+    METRICS_FILE = "metrics/scraper.prom"
+    
+    # --profile output (per-source pstats + collapsed flame-graph stacks)
+    PROFILE_DIR = "profiles"
+    
+    # tracemalloc per-source peak memory in the run summary (adds overhead)
+    TRACE_MEMORY = False
+    
+    # JSON run reports (one file per run, files older than the retention are pruned)
+    REPORTS_DIR = "reports"
+    REPORT_RETENTION_DAYS = 30
+    
+    # --daemon: per-source recrawl intervals adapt between these bounds (seconds)
+    DAEMON_MIN_INTERVAL = 15 * 60
+    DAEMON_MAX_INTERVAL = 7 * 24 * 3600
+    DAEMON_DEFAULT_INTERVAL = 3600  # sources without a "recrawl_interval"
+    DAEMON_STATE_FILE = "state/schedule.json"
+    
+    # Detail-page crawlers: persistent URL frontier (None disables; never used in replay)
+    FRONTIER_DB = "state/frontier.sqlite"
+    FRONTIER_MAX_ATTEMPTS = 3
+    MAX_DETAIL_PAGES = 100  # safety cap per listing URL; normally only new links are fetched
+    
+    # Paginated listings (sources with a "pagination" entry) stop at a run of already-ingested items
+    PAGINATION_MAX_PAGES = 10
+    PAGINATION_STOP_AFTER_SEEN = 3
+    
+    # Sources with "feeds" (RSS/Atom/sitemaps) discover articles there before the HTML listing
+    DISCOVERY_MAX_SITEMAPS = 3  # child sitemaps followed from a sitemap index
+    
+    # Listing entries published before a source's watermark (newest date ingested) are not fetched
+    WATERMARK_LOOKBACK = 6 * 3600  # seconds of slack for late-indexed or re-dated stories
+    
+    # Per-host circuit breaker: fail fast for a cooldown after consecutive failures (None disables)
+    BREAKER_STATE_FILE = "state/breakers.json"
+    BREAKER_FAILURE_THRESHOLD = 3
+    BREAKER_COOLDOWN = 10 * 60  # seconds before a half-open probe request
+    
+    # robots.txt: disallowed URLs are skipped, requests to a host are spaced by its Crawl-delay
+    # (DEFAULT_DELAY when none is declared). Off: the fixed DEFAULT_DELAY sleep after each page
+    ROBOTS_ENABLED = True
+    ROBOTS_CACHE_DIR = "state/robots"
+    ROBOTS_TTL = 24 * 3600
+    ROBOTS_ERROR_TTL = 10 * 60  # robots.txt unreachable / 5xx: everything disallowed this long
+    ROBOTS_USER_AGENT = "KeralaAgriNewsScraper"  # product token matched against robots.txt groups
+    
+    # Run budget (--budget): sources run by "priority" (higher first) and stop at their share of the
+    # window, estimated from "expected_seconds". None: no limit. Sources that do not fit are deferred
+    RUN_BUDGET = None  # seconds for the whole multi-source run
+    BUDGET_DEFAULT_PRIORITY = 1
+    BUDGET_DEFAULT_SECONDS = 60
+    BUDGET_MIN_SECONDS = 5  # a source is not started with less than this left
+    
+    # Distributed crawling (distributed.py / --distributed): workers lease listing pages and detail
+    # URLs from a shared queue. "sqlite:<path>" (default backend) needs every node to see the file
+    WORK_QUEUE = "sqlite:state/work_queue.sqlite"
+    WORK_LEASE_SECONDS = 5 * 60  # an item not finished within its lease is handed to another worker
+    WORK_MAX_ATTEMPTS = 3
+    WORK_POLL_INTERVAL = 1.0  # seconds between lease attempts on an empty queue
+    DISTRIBUTED_WORKERS = 2  # local worker processes the coordinator starts
+    
+    # --pipeline: threaded fetches, process-pool extraction (None workers = CPU count)
+    PIPELINE_ENABLED = False
+    PIPELINE_WORKERS = None
+    PIPELINE_MAX_PENDING = None  # fetched pages in flight before fetchers block (default 2 x workers)
+    
+    # clean_text / light_refine_content results memoized per process (LRU, 0 disables);
+    # texts longer than MAX_CHARS are not cached
+    NORMALIZE_CACHE_SIZE = 20000
+    NORMALIZE_CACHE_MAX_CHARS = 2000
+    
     # Kerala Districts
     KERALA_DISTRICTS = [
         "Thiruvananthapuram", "Kollam", "Pathanamthitta", "Alappuzha",
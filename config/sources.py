@@ -9,14 +9,21 @@ ALL_SOURCES = {
         "news_urls": [
             "https://economictimes.indiatimes.com/news/economy/agriculture?from=mdr"
         ],
+        "feeds": [  # tried first; the listing page is the fallback
+            "https://economictimes.indiatimes.com/news/economy/agriculture/rssfeeds/1202099874.cms"
+        ],
         "selectors": {
             "title": "h1, h2, h3, .story-headline, .headline, .artTitle, .eachStory h3",
             "content": ".artText, .story-content, .article-content, .summary, .eachStory, p",
             "date": ".date, .publish-date, .story-date, .time"
         },
+        "pagination": {"next_selector": 'a[rel="next"], link[rel="next"]'},  # older pages until known stories
         "category": "business_agriculture",
         "language": "english",
-        "scrape_method": "requests_bs4"
+        "scrape_method": "requests_bs4",
+        "recrawl_interval": 3600,  # daemon starting interval (seconds), adapted to observed changes
+        "priority": 3,  # --budget runs higher priorities first
+        "expected_seconds": 45  # typical run time, used to share the budget
     },
     
     "times_of_india_agriculture": {
@@ -30,9 +37,13 @@ ALL_SOURCES = {
             "content": ".story-content, .article-content, ._s30J, .ga-headlines, .content, p",
             "date": "time, .publish_on, .date, ._3k8Kt"
         },
+        "pagination": {"next_selector": 'a[rel="next"], link[rel="next"]'},
         "category": "news_agriculture",
         "language": "english",
-        "scrape_method": "requests_bs4"
+        "scrape_method": "requests_bs4",
+        "recrawl_interval": 3600,
+        "priority": 2,
+        "expected_seconds": 45
     },
     
     "testbook_agriculture_schemes": {
@@ -48,7 +59,24 @@ ALL_SOURCES = {
         },
         "category": "government_schemes",
         "language": "english",
-        "scrape_method": "testbook_extractor"
+        "scrape_method": "testbook_extractor",
+        "recrawl_interval": 86400,
+        "priority": 2,
+        "expected_seconds": 15  # one page; runs before the slower Times of India listing
+    }
+}
+
+# Runnable with main.py --source, but not part of the consolidated multi-source run
+EXTRA_SOURCES = {
+    "mathrubhumi_agriculture": {
+        "name": "Mathrubhumi Agriculture",
+        "base_url": "https://www.mathrubhumi.com/",
+        "news_urls": ["https://www.mathrubhumi.com/agriculture"],
+        "pagination": {"next_selector": 'a[rel="next"], link[rel="next"]'},
+        "category": "news_agriculture",
+        "language": "malayalam",
+        "scrape_method": "detail_pages",
+        "expected_seconds": 300
     }
 }
 
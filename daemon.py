@@ -0,0 +1,153 @@
+"""
+Daemon mode - one warm process that recrawls each source on its own adaptive interval
+
+Scrapers (and their HTTP connection pools), the archive/replay handles and the
+imported modules stay loaded between crawls. Each source starts at its
+"recrawl_interval" and the interval then follows how often its content really
+changes (see utils/scheduler.py). output2 files are rewritten only when a
+crawl changed something.
+
+    python main.py --daemon
+    python daemon.py --replay tests/fixtures/pages --max-crawls 3
+"""
+import sys
+import os
+import argparse
+import logging
+import signal
+import threading
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config.settings import config
+from config.sources import ALL_SOURCES
+from multi_source_scraper import prune_archive, write_metrics, write_run_report
+from scrapers.registry import create_scraper
+from utils.file_manager import FileManager
+from utils.logger import default_log_file, setup_logging
+from utils.run_report import RunReport, SourceStats
+from utils.scheduler import AdaptiveSchedule, content_fingerprint
+from utils.staging import StagingArea
+
+
+def format_interval(seconds):
+    return str(timedelta(seconds=int(seconds)))
+
+
+class ScraperDaemon:
+    """Long-running scheduler loop over ALL_SOURCES"""
+
+    def __init__(self, sources=None, schedule=None):
+        self.sources = sources or ALL_SOURCES
+        self.schedule = schedule or AdaptiveSchedule(
+            config.DAEMON_MIN_INTERVAL,
+            config.DAEMON_MAX_INTERVAL,
+            config.DAEMON_DEFAULT_INTERVAL,
+            state_file=config.DAEMON_STATE_FILE
+        )
+        self.file_manager = FileManager()
+        self.staging = StagingArea(self.file_manager)
+        self.scrapers = {}  # source -> warm scraper instance
+        self.stop_event = threading.Event()
+        self.crawls = 0
+        self.logger = logging.getLogger('ScraperDaemon')
+        for source_name, source_config in self.sources.items():
+            self.schedule.add(source_name, source_config.get('recrawl_interval'))
+
+    def scraper_for(self, source_name):
+        """Reuse one scraper per source; only its per-run stats are reset"""
+        scraper = self.scrapers.get(source_name)
+        if scraper is None:
+            scraper = self.scrapers[source_name] = create_scraper(source_name, self.sources[source_name])
+        else:
+            scraper.run_stats = SourceStats()
+        return scraper
+
+    def crawl(self, source_name):
+        """Crawl one source, update its schedule; returns True when output changed"""
+        source_config = self.sources[source_name]
+        report = RunReport()
+        first_crawl = source_name not in self.staging.results
+        self.crawls += 1
+
+        try:
+            with report.track(source_name, source_config) as entry:
+                scraper = entry.scraper = self.scraper_for(source_name)
+                articles = entry.articles = scraper.run()
+        except Exception as e:
+            self.logger.error("Crawl of %s failed: %s", source_name, e)
+            articles = None
+        published = articles is not None
+
+        if not articles:
+            # An empty page is far more often a block or layout break than a real change
+            self.schedule.record_failure(source_name)
+            changed = False
+        else:
+            changed = self.schedule.record(source_name, content_fingerprint(articles), adapt=not first_crawl)
+            self.staging.add(source_name, source_config, articles)
+            if (changed or first_crawl) and not self.write_outputs(source_name, source_config):
+                published = False  # the next crawl queues its detail URLs again
+        if published:
+            scraper.commit_published()
+
+        entry = self.schedule.entries[source_name]
+        print(f"{'🔄' if changed else '💤'} {source_config['name']}: "
+              f"{len(articles or [])} items, {'changed' if changed else 'unchanged'}, "
+              f"next in {format_interval(entry['next_run'] - entry['last_run'])}")
+        write_metrics()
+        write_run_report(report)
+        prune_archive()
+        return changed
+
+    def write_outputs(self, source_name, source_config):
+        """Rewrite the consolidated file the source belongs to; returns its path (None if the write failed)"""
+        if StagingArea.is_scheme_source(source_name, source_config):
+            return self.file_manager.save_schemes_consolidated(self.staging.scheme_articles)
+        return self.file_manager.save_news_consolidated(self.staging.news_articles)
+
+    def run(self, max_crawls=None):
+        """Crawl due sources until stopped (SIGINT/SIGTERM) or max_crawls is reached"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
+            signal.signal(signal.SIGINT, lambda *_: self.stop())
+
+        print(f"🛰️  Daemon started with {len(self.sources)} sources at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        while not self.stop_event.is_set():
+            for source_name in self.schedule.due():
+                if self.stop_event.is_set() or (max_crawls and self.crawls >= max_crawls):
+                    break
+                self.crawl(source_name)
+            if max_crawls and self.crawls >= max_crawls:
+                break
+            wait = self.schedule.seconds_until_next()
+            self.logger.debug("Sleeping %.0fs until the next source is due", wait)
+            self.stop_event.wait(wait)
+        print(f"🛑 Daemon stopped after {self.crawls} crawls")
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def run_daemon(max_crawls=None):
+    setup_logging(
+        level=config.LOG_LEVEL,
+        log_file=default_log_file('daemon', config.LOGS_DIR) if config.LOG_TO_FILE else None
+    )
+    daemon = ScraperDaemon()
+    daemon.run(max_crawls=max_crawls)
+    return daemon
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Recrawl every source on an adaptive schedule')
+    parser.add_argument('--replay', metavar='DIR', help='Serve pages from a recorded corpus instead of the network')
+    parser.add_argument('--max-crawls', type=int, help='Stop after this many crawls (testing)')
+    parser.add_argument('--state-file', metavar='PATH',
+                        help=f'Learned schedule state (default: {config.DAEMON_STATE_FILE})')
+    args = parser.parse_args()
+    if args.replay:
+        config.REPLAY_DIR = args.replay
+    if args.state_file:
+        config.DAEMON_STATE_FILE = args.state_file
+    run_daemon(max_crawls=args.max_crawls)
@@ -0,0 +1,234 @@
+"""
+Distributed crawling - a coordinator queues the work, workers on any node lease and run it
+
+    python distributed.py coordinator --workers 4    # queue a run, start 4 local workers, consolidate
+    python distributed.py coordinator --workers 0    # queue a run, wait for workers started elsewhere
+    python distributed.py worker --queue sqlite:/mnt/shared/work_queue.sqlite
+    python main.py --distributed 4
+
+Work items are the sources' listing pages and the detail URLs found on them
+(see utils/work_queue.py). Workers run each source's own scraper: listing
+pages go through listing_work(), detail pages through detail_work(), and the
+articles go to the queue's result sink. Once nothing of the run is queued or
+leased, the coordinator stages the results per source and writes output2
+through FileManager, like a sequential run.
+
+Each worker process spaces its own requests per host; listing pagination
+and feeds are not used by workers.
+"""
+import sys
+import os
+import argparse
+import logging
+import multiprocessing
+import socket
+import time
+import uuid
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config.settings import config
+from config.sources import ALL_SOURCES
+from scrapers.registry import ScraperResolutionError, all_sources, create_scraper
+from utils.budget import RunPlanner
+from utils.file_manager import FileManager
+from utils.logger import default_log_file, setup_logging
+from utils.staging import StagingArea
+from utils.work_queue import open_queue
+
+
+def open_work_queue(queue_url=None):
+    return open_queue(queue_url or config.WORK_QUEUE, max_attempts=config.WORK_MAX_ATTEMPTS)
+
+
+class ScraperWorker:
+    """Leases items one at a time and runs them with a warm scraper per source"""
+
+    def __init__(self, queue, worker_id=None, sources=None):
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.sources = sources or all_sources()
+        self.scrapers = {}  # source -> scraper instance
+        self.processed = 0
+        self.logger = logging.getLogger('ScraperWorker')
+
+    def scraper_for(self, source_name):
+        if source_name not in self.scrapers:
+            self.scrapers[source_name] = create_scraper(source_name, self.sources[source_name])
+        return self.scrapers[source_name]
+
+    def process(self, item):
+        """Fetch and extract one item; the outcome goes back to the queue"""
+        url = item['url']
+        try:
+            scraper = self.scraper_for(item['source'])
+            html = scraper.get_page(url)
+            if not html:
+                self.queue.fail(item, 'fetch failed')
+                return False
+            if item['kind'] == 'listing':
+                articles, links = scraper.listing_work(url, html)
+                links = [link for link in links if scraper.robots_allowed(link)][:config.MAX_DETAIL_PAGES]
+            else:
+                article = scraper.detail_work(url, html)
+                articles, links = ([article] if article else []), []
+        except (ScraperResolutionError, AttributeError) as e:
+            # Unknown source/class or a scraper bug: another attempt cannot go differently
+            self.logger.error("Work item %s cannot be processed: %s", url, e)
+            self.queue.fail(item, str(e), retry=False)
+            return False
+        except Exception as e:
+            self.logger.error("Work item %s failed: %s", url, e)
+            self.queue.fail(item, str(e))
+            return False
+        if not self.queue.complete(item, articles, links):
+            self.logger.warning("Lease on %s expired before it finished; result dropped", url)
+            return False
+        self.logger.info("%s %s: %d articles, %d detail links", item['kind'], url, len(articles), len(links))
+        return True
+
+    def run(self, exit_when_idle=False, max_items=None):
+        """Lease and process items until stopped; with exit_when_idle, until nothing is queued or leased"""
+        while not max_items or self.processed < max_items:
+            items = self.queue.lease(self.worker_id, limit=1, visibility=config.WORK_LEASE_SECONDS)
+            if not items:
+                if exit_when_idle and not self.queue.pending():
+                    break
+                time.sleep(config.WORK_POLL_INTERVAL)
+                continue
+            for item in items:
+                self.process(item)
+                self.processed += 1
+        return self.processed
+
+
+def run_worker(queue_url=None, worker_id=None, exit_when_idle=False, settings=None):
+    """Worker process entry point; settings are config values to apply first (from the coordinator)"""
+    for name, value in (settings or {}).items():
+        setattr(config, name, value)
+    setup_logging(
+        level=config.LOG_LEVEL,
+        log_file=default_log_file('worker', config.LOGS_DIR) if config.LOG_TO_FILE else None
+    )
+    queue = open_work_queue(queue_url)
+    try:
+        processed = ScraperWorker(queue, worker_id).run(exit_when_idle=exit_when_idle)
+    finally:
+        queue.close()
+    return processed
+
+
+def start_local_workers(count, queue_url=None):
+    """Worker processes on this machine; they exit once the queue is drained"""
+    settings = dict(vars(config))  # command line overrides (replay, limits, ...) carry over
+    context = multiprocessing.get_context()
+    processes = []
+    for index in range(count):
+        process = context.Process(
+            target=run_worker,
+            kwargs={'queue_url': queue_url, 'worker_id': f"{socket.gethostname()}-w{index}",
+                    'exit_when_idle': True, 'settings': settings},
+            name=f"worker-{index}",
+            daemon=True
+        )
+        process.start()
+        processes.append(process)
+    return processes
+
+
+def coordinate(workers=None, sources=None, queue_url=None, timeout=None):
+    """Queue every source's listing pages, wait for the run to drain and write output2
+
+    workers: local worker processes to start (default config.DISTRIBUTED_WORKERS; 0 = remote only)
+    timeout: stop waiting after this many seconds (default config.RUN_BUDGET); items not done
+             stay queued for the next run
+    """
+    workers = config.DISTRIBUTED_WORKERS if workers is None else workers
+    sources = sources or ALL_SOURCES
+    timeout = config.RUN_BUDGET if timeout is None else timeout
+    run = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+    queue = open_work_queue(queue_url)
+
+    print(f"🗂️  Distributed run {run} on {queue_url or config.WORK_QUEUE}")
+    for source_name in RunPlanner(sources).order:  # lease order follows source priority
+        queued = queue.put(run, source_name, 'listing', sources[source_name]['news_urls'])
+        print(f"   📥 {sources[source_name]['name']}: {queued} listing page(s) queued")
+
+    processes = start_local_workers(workers, queue_url) if workers else []
+    if processes:
+        print(f"⚙️  Started {len(processes)} local worker processes")
+    else:
+        print("⏳ Waiting for workers: python distributed.py worker")
+
+    start = time.monotonic()
+    try:
+        while queue.pending(run):
+            if timeout is not None and time.monotonic() - start >= timeout:
+                print(f"⏱️  Budget of {timeout:.0f}s spent; unfinished items stay queued for the next run")
+                break
+            if processes and not any(p.is_alive() for p in processes):
+                print("⚠️  All local workers exited with work still pending")
+                break
+            time.sleep(config.WORK_POLL_INTERVAL)
+    finally:
+        for process in processes:
+            process.join(timeout=0 if queue.pending(run) else config.WORK_POLL_INTERVAL * 5)
+            if process.is_alive():
+                process.terminate()  # its leased items are handed out again after the lease expires
+
+    stats = queue.stats(run)
+    results = queue.results(run)
+    queue.close()
+    print(f"📊 Work items: {stats['done']} done, {stats['failed']} failed, "
+          f"{stats['queued'] + stats['leased']} left")
+    return consolidate(sources, results)
+
+
+def consolidate(sources, results):
+    """Stage the run's articles per source (configured order) and write output2"""
+    file_manager = FileManager()
+    staging = StagingArea(file_manager)
+    for source_name, source_config in sources.items():
+        articles = results.get(source_name, [])
+        if articles:
+            staging.add(source_name, source_config, articles)
+        print(f"{'✅' if articles else '⚠️ '} {source_config['name']}: {len(articles)} items")
+
+    if not staging.all_articles:
+        print("❌ No content found")
+        return None
+    if staging.news_articles:
+        print(f"📰 {file_manager.save_news_consolidated(staging.news_articles)}: "
+              f"{len(staging.news_articles)} news articles")
+    if staging.scheme_articles:
+        print(f"📋 {file_manager.save_schemes_consolidated(staging.scheme_articles)}: "
+              f"{len(staging.scheme_articles)} government schemes")
+    return {
+        'news_articles': staging.news_articles,
+        'scheme_articles': staging.scheme_articles,
+        'total_articles': staging.all_articles
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Crawl with a shared work queue and several workers')
+    parser.add_argument('role', choices=['coordinator', 'worker'])
+    parser.add_argument('--queue', metavar='URL', help=f'Work queue (default: {config.WORK_QUEUE})')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help=f'Coordinator: local worker processes (default: {config.DISTRIBUTED_WORKERS})')
+    parser.add_argument('--exit-when-idle', action='store_true', help='Worker: stop once the queue is drained')
+    parser.add_argument('--budget', type=float, metavar='SECONDS', help='Coordinator: stop waiting after this long')
+    parser.add_argument('--replay', metavar='DIR', help='Serve pages from a recorded corpus instead of the network')
+    args = parser.parse_args()
+    if args.replay:
+        config.REPLAY_DIR = args.replay
+    if args.budget is not None:
+        config.RUN_BUDGET = args.budget
+    if args.role == 'worker':
+        run_worker(args.queue, exit_when_idle=args.exit_when_idle)
+    else:
+        setup_logging(
+            level=config.LOG_LEVEL,
+            log_file=default_log_file('coordinator', config.LOGS_DIR) if config.LOG_TO_FILE else None
+        )
+        coordinate(workers=args.workers, queue_url=args.queue)
@@ -6,7 +6,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from scrapers.base_scraper import BaseScraper
-from datetime import datetime
+from utils.dates import to_utc_iso
 import re
 
 class FixedMathrubhumiScraper(BaseScraper):
@@ -16,6 +16,7 @@ class FixedMathrubhumiScraper(BaseScraper):
     def extract_individual_article_urls(self, soup):
         """Extract individual article URLs from listing page"""
         article_urls = []
+        seen = set()
         
         # Look for agriculture article links - these are the specific patterns used by Mathrubhumi
         selectors = [
@@ -39,20 +40,26 @@ class FixedMathrubhumiScraper(BaseScraper):
                     else:
                         full_url = href
                     
-                    if full_url not in article_urls:
+                    if full_url not in seen:
+                        seen.add(full_url)
                         article_urls.append(full_url)
         
         return article_urls
 
     def extract_full_article(self, article_url):
         """Extract full content from individual article page"""
-        print(f"🔍 Extracting full content from: {article_url}")
+        self.logger.debug("🔍 Extracting full content from: %s", article_url)
         
         html = self.get_page(article_url)
         if not html:
             return None
         
-        soup = self.parse_html(html)
+        with self.parsed(html) as soup:
+            return self.extract_article_fields(soup, article_url)
+    
+    def extract_article_fields(self, soup, article_url):
+        """Title, content and publication date from a parsed article page"""
+        published = self.extract_published(soup)  # before the content cleanup below removes nodes
         
         # Extract title
         title = "No Title"
@@ -100,52 +107,59 @@ class FixedMathrubhumiScraper(BaseScraper):
         return {
             'title': title,
             'content': content,
-            'url': article_url
+            'url': article_url,
+            'published': to_utc_iso(published)
         }
 
+    def full_article(self, url, article_data):
+        """Article record from extracted fields, or None when the content is too short"""
+        if len(article_data['content']) <= 100:
+            return None
+        return self.new_article(
+            article_data['url'],
+            self.discovered.get(url, {}).get('title') or article_data['title'],
+            article_data['content'],
+            date=self.discovered.get(url, {}).get('published') or article_data['published'],
+            author='',
+            images=[]
+        )
+    
+    def listing_work(self, url, html):
+        """No articles on the listing itself, only detail links (for queue workers)"""
+        with self.parsed(html) as soup:
+            return [], self.extract_individual_article_urls(soup)
+    
+    def detail_work(self, url, html):
+        with self.parsed(html) as soup:
+            return self.full_article(url, self.extract_article_fields(soup, url))
+    
     def scrape_articles(self):
         """Main scraping method"""
         articles = []
         
-        # Get the listing page first
-        main_url = "https://www.mathrubhumi.com/agriculture"
-        print(f"📄 Getting article list from: {main_url}")
-        
-        html = self.get_page(main_url)
-        if not html:
+        # Individual article URLs from the source's feeds, else new links on the listing pages
+        article_urls = self.discover_links(self.extract_individual_article_urls)
+        if not article_urls:
             return articles
+        self.logger.info("📋 Found %d individual article URLs", len(article_urls))
         
-        soup = self.parse_html(html)
-        
-        # Extract individual article URLs
-        article_urls = self.extract_individual_article_urls(soup)
-        print(f"📋 Found {len(article_urls)} individual article URLs")
-        
-        # Extract full content from each article
-        for i, url in enumerate(article_urls[:10]):  # Limit to 10 articles
-            print(f"\n📰 Processing article {i+1}/{min(10, len(article_urls))}")
+        # Extract full content from each article not fetched on an earlier run
+        detail_urls = self.detail_urls(article_urls)
+        for i, url in enumerate(detail_urls):
+            self.logger.debug("📰 Processing article %d/%d", i + 1, len(detail_urls))
             
-            article_data = self.extract_full_article(url)
-            if article_data and len(article_data['content']) > 100:
-                full_article = {
-                    'url': article_data['url'],
-                    'source': self.source_config['name'],
-                    'category': self.source_config['category'],
-                    'language': self.source_config['language'],
-                    'scraped_at': datetime.now().isoformat(),
-                    'title': article_data['title'],
-                    'content': article_data['content'],
-                    'date': '',
-                    'author': '',
-                    'images': [],
-                    'keywords': self.extract_keywords(article_data['title'] + " " + article_data['content'])
-                }
-                
+            try:
+                article_data = self.extract_full_article(url)
+            except Exception as e:
+                self.mark_detail(url, ok=False, error=str(e))
+                raise
+            self.mark_detail(url, ok=article_data is not None, error=None if article_data else 'fetch failed')
+            full_article = self.full_article(url, article_data) if article_data else None
+            if full_article:
                 articles.append(full_article)
-                print(f"✅ SUCCESS: {article_data['title'][:60]}...")
-                print(f"   Content length: {len(article_data['content'])} characters")
+                self.logger.debug("✅ SUCCESS: %.60s... (%d characters)", article_data['title'], len(article_data['content']))
             else:
-                print(f"❌ FAILED: Insufficient content")
+                self.logger.debug("❌ FAILED: Insufficient content for %s", url)
             
             # Rate limiting
             self.rate_limit()
@@ -154,13 +168,13 @@ class FixedMathrubhumiScraper(BaseScraper):
 
 # Test the fixed scraper
 if __name__ == "__main__":
-    from config.sources import ALL_SOURCES
+    from config.sources import EXTRA_SOURCES
     from utils.file_manager import FileManager
     
     print("🔧 TESTING FIXED MATHRUBHUMI SCRAPER")
     print("="*50)
     
-    source_config = ALL_SOURCES['mathrubhumi_agriculture']
+    source_config = EXTRA_SOURCES['mathrubhumi_agriculture']
     scraper = FixedMathrubhumiScraper(source_config)
     
     articles = scraper.run()
@@ -171,6 +185,8 @@ if __name__ == "__main__":
         # Save articles
         file_manager = FileManager()
         filename = file_manager.save_articles_to_text(articles, "mathrubhumi_fixed")
+        if filename:
+            scraper.commit_published()
         
         print(f"💾 Saved to: {filename}")
         
@@ -7,24 +7,25 @@ import sys
 import os
 import argparse
 from datetime import datetime
-import logging
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def run_single_scraper(source_name):
-    """Run a single scraper by source name"""
-    from config.sources import ALL_SOURCES
+def run_single_scraper(source_name, profile=None):
+    """Run a single scraper by source name (profile: None, 'cprofile' or 'sampling')"""
+    from config.settings import config
+    from scrapers.registry import ScraperResolutionError, all_sources, create_scraper
     from utils.file_manager import FileManager
-    from multi_source_scraper import AgricultureOnlyScraper
+    from utils.metrics import metrics
     
-    if source_name not in ALL_SOURCES:
+    sources = all_sources()
+    if source_name not in sources:
         print(f"❌ Error: Source '{source_name}' not found in configuration")
-        available_sources = ', '.join(ALL_SOURCES.keys())
+        available_sources = ', '.join(sources.keys())
         print(f"Available sources: {available_sources}")
         return []
     
-    source_config = ALL_SOURCES[source_name]
+    source_config = sources[source_name]
     
     print(f"\n🌾 Starting AGRICULTURE-ONLY scraper for: {source_config['name']}")
     print(f"📰 Category: {source_config['category']}")
@@ -32,16 +33,32 @@ def run_single_scraper(source_name):
     print(f"🔗 URLs: {', '.join(source_config['news_urls'])}")
     
     try:
-        scraper = AgricultureOnlyScraper(source_config)
+        scraper = create_scraper(source_name, source_config)
         
         print("🚀 Starting to scrape agriculture content...")
-        articles = scraper.run()
+        if profile:
+            from utils.profiling import SourceProfiler
+            profiler = SourceProfiler(config.PROFILE_DIR, mode=profile)
+            with profiler.profile(source_name):
+                articles = scraper.run()
+            profiler.print_hotspots(source_name)
+        elif config.TRACE_MEMORY:
+            from utils.memory import MemoryTracker
+            memory = MemoryTracker()
+            with memory.track(source_name):
+                articles = scraper.run()
+            memory.print_summary()
+        else:
+            articles = scraper.run()
         
         if articles:
             file_manager = FileManager()
-            filename = file_manager.save_articles_to_text(articles, source_name)
+            with metrics.timer('write', source=source_config['name']):
+                filename = file_manager.save_articles_to_text(articles, source_name)
             print(f"✅ Successfully scraped {len(articles)} agriculture articles")
             print(f"📝 Output saved to: {filename}")
+            if filename:
+                scraper.commit_published()
             
             # Show sample article
             if articles:
@@ -52,9 +69,13 @@ def run_single_scraper(source_name):
                 print(f"Content: {sample_article.get('content', 'No content')[:200]}...")
         else:
             print("❌ No agriculture-related content found")
+            scraper.commit_published()
         
         return articles
         
+    except ScraperResolutionError as e:
+        print(f"❌ {str(e)}")
+        return []
     except Exception as e:
         print(f"❌ Error running scraper: {str(e)}")
         return []
@@ -84,25 +105,54 @@ def test_agriculture_scraper():
     return articles
 
 def list_agriculture_sources():
-    """List all agriculture sources"""
-    from config.sources import ALL_SOURCES
+    """List all agriculture sources (no scraper modules are imported)"""
+    from scrapers.registry import all_sources, scraper_path
     
     print("📋 AGRICULTURE & WEATHER NEWS SOURCES:")
     print("=" * 45)
     
     categories = {}
-    for name, config in ALL_SOURCES.items():
+    for name, config in all_sources().items():
         cat = config['category']
         if cat not in categories:
             categories[cat] = []
-        categories[cat].append((name, config['name'], config['language']))
+        categories[cat].append((name, config))
     
     for category, sources in categories.items():
         print(f"\n📂 {category.upper().replace('_', ' ')}:")
-        for source_key, source_name, language in sources:
+        for source_key, config in sources:
             print(f"   🌾 {source_key}")
-            print(f"      Name: {source_name}")
-            print(f"      Language: {language}")
+            print(f"      Name: {config['name']}")
+            print(f"      Language: {config['language']}")
+            print(f"      Scraper: {scraper_path(source_key, config)}")
+
+def check_sources(load=False):
+    """Every configured source must resolve to a scraper class path; returns False otherwise
+
+    load: also import each scraper class and check it can run (before a scraping run;
+    --list stays free of scraper imports)
+    """
+    from scrapers.registry import validate_sources
+    problems = validate_sources(load=load)
+    for problem in problems:
+        print(f"❌ {problem}")
+    return not problems
+
+def write_metrics(config):
+    """Export stage timings and counters for the node exporter"""
+    if not config.METRICS_FILE:
+        return
+    from utils.metrics import metrics
+    try:
+        print(f"📈 Metrics written to {metrics.write_prometheus(config.METRICS_FILE)}")
+    except Exception as e:
+        print(f"⚠️  Could not write metrics file: {str(e)}")
+
+def print_banner():
+    print("🌾 KERALA AGRICULTURE & WEATHER NEWS SCRAPER 🌾")
+    print("🔒 STRICT AGRICULTURE/WEATHER FILTERING ENABLED")
+    print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print()
 
 def main():
     """Main function with argument parsing"""
@@ -115,6 +165,9 @@ Examples:
   python main.py --agriculture                       # Scrape ALL agriculture sources
   python main.py --source mathrubhumi_agriculture    # Run specific source
   python main.py --list                              # List agriculture sources
+  python main.py --daemon                            # Keep running, recrawl on adaptive intervals
+  python main.py --distributed 4                     # Crawl with 4 worker processes via the work queue
+  python main.py --source economic_times_agriculture --replay fixtures/  # Offline run
         """
     )
     
@@ -122,9 +175,51 @@ Examples:
     parser.add_argument('--source', type=str, help='Run specific agriculture source')
     parser.add_argument('--test', action='store_true', help='Test agriculture scraper')
     parser.add_argument('--list', action='store_true', help='List all agriculture sources')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Stay running and recrawl each source on its own adaptive interval')
+    parser.add_argument('--distributed', type=int, metavar='WORKERS',
+                        help='Crawl all sources through the work queue with this many local workers (0: remote only)')
+    parser.add_argument('--archive', action='store_true', help='Archive every fetched page for replay')
+    parser.add_argument('--replay', metavar='DIR', help='Serve pages from a recorded corpus instead of the network')
+    parser.add_argument('--metrics-file', metavar='PATH', help='Prometheus textfile written at the end of the run')
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=['cprofile', 'sampling'],
+                        help='Profile each source run (pstats + flame-graph stacks under profiles/)')
+    parser.add_argument('--trace-memory', action='store_true', help='Report peak memory per source (tracemalloc)')
+    parser.add_argument('--budget', type=float, metavar='SECONDS',
+                        help='Time budget for --agriculture; sources run by priority, late ones are deferred')
     
     args = parser.parse_args()
     
+    if args.list:
+        # Config-only: no logging setup, output directories or scraper/HTTP/HTML imports
+        print_banner()
+        list_agriculture_sources()
+        if not check_sources():
+            sys.exit(2)
+        return
+    
+    from config.settings import config
+    from utils.logger import default_log_file, setup_logging
+    setup_logging(
+        level=config.LOG_LEVEL,
+        log_file=default_log_file('scraper', config.LOGS_DIR) if config.LOG_TO_FILE else None
+    )
+    
+    if args.archive:
+        config.ARCHIVE_ENABLED = True
+    if args.replay:
+        config.REPLAY_DIR = args.replay
+    if args.metrics_file:
+        config.METRICS_FILE = args.metrics_file
+    if args.trace_memory:
+        config.TRACE_MEMORY = True
+    if args.budget is not None:
+        config.RUN_BUDGET = args.budget
+    
+    if not check_sources(load=True):
+        print("Fix config/sources.py (scrape_method / scraper) before running.")
+        sys.exit(2)
+    
     # Setup output directories
     os.makedirs('output/daily', exist_ok=True)
     os.makedirs('output/weekly', exist_ok=True) 
@@ -132,20 +227,23 @@ Examples:
     os.makedirs('output/consolidated', exist_ok=True)
     os.makedirs('logs', exist_ok=True)
     
-    print("🌾 KERALA AGRICULTURE & WEATHER NEWS SCRAPER 🌾")
-    print("🔒 STRICT AGRICULTURE/WEATHER FILTERING ENABLED")
-    print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    print_banner()
     
-    if args.list:
-        list_agriculture_sources()
+    if args.daemon:
+        from daemon import run_daemon
+        run_daemon()
+    elif args.distributed is not None:
+        from distributed import coordinate
+        coordinate(workers=args.distributed)
     elif args.test:
         test_agriculture_scraper()
     elif args.source:
-        run_single_scraper(args.source)
+        run_single_scraper(args.source, profile=args.profile)
+        write_metrics(config)
     elif args.agriculture:
-        from multi_source_scraper import scrape_agriculture_only
-        scrape_agriculture_only()
+        # multi_source_scraper.main writes its own metrics file and run report
+        from multi_source_scraper import main as scrape_all_sources
+        scrape_all_sources(profile=args.profile)
     else:
         print("Please specify an option. Use --help for usage information.")
         print("\n🌾 Quick start commands:")
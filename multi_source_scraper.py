@@ -1,136 +1,279 @@
 """
-Agriculture Scraper - Create output2 and delete output folder after consolidation
+Agriculture Scraper - Stage results in memory and consolidate into output2
 - Economic Times Agriculture News
 - Times of India Agriculture News  
 - Testbook Agriculture Schemes
 
-Output: news.txt and schemes.txt in output2 folder, then delete output folder
+Output: news.txt and schemes.txt in output2 folder
+(per-source snapshots in output/daily only with --save-snapshots)
 """
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config.settings import config
 from config.sources import ALL_SOURCES
 from scrapers.base_scraper import BaseScraper
+from scrapers.registry import create_scraper
 from utils.file_manager import FileManager
+from utils.metrics import metrics
+from utils.logger import default_log_file, setup_logging
+from utils.profiling import SourceProfiler
+from utils.memory import MemoryTracker
+from utils.run_report import RunReport, stage_seconds
+from utils.scheduler import article_digest
+from utils.budget import RunPlanner
+from contextlib import nullcontext
+from utils.staging import StagingArea
+from utils.text_cache import normalization_cache
 from datetime import datetime
+import argparse
 import time
 
 class SimpleConsolidatedScraper(BaseScraper):
     """Scraper that creates simple consolidated files"""
     
     def scrape_articles(self):
-        """Scrape using site-specific methods"""
-        articles = []
+        """Scrape from the source's feeds, else its listing pages with site-specific methods"""
+        articles = self.feed_articles()
+        if articles:
+            return articles
         
         for news_url in self.source_config['news_urls']:
             try:
-                self.logger.info(f"🔍 Processing: {news_url}")
-                
-                html = self.get_page(news_url)
-                if not html:
-                    continue
-                
-                soup = self.parse_html(html)
+                self.logger.debug("🔍 Processing: %s", news_url)
                 
-                # Extract using site-specific methods
-                extracted_content = self.extract_synopsis_articles(soup, news_url)
-                
-                for content_data in extracted_content:
-                    article = {
-                        'url': news_url,
-                        'source': self.source_config['name'],
-                        'category': self.source_config['category'],
-                        'language': self.source_config['language'],
-                        'scraped_at': datetime.now().isoformat(),
-                        'title': content_data['title'],
-                        'content': content_data['content'],
-                        'keywords': self.extract_keywords(content_data['title'] + " " + content_data['content'])
-                    }
-                    articles.append(article)
+                # Older pages (paginated sources) are read only while they still have unseen items
+                with self.listing_walk(news_url, by_content=True) as walk:
+                    for page_url, html in walk:
+                        page_articles = self.process_page(page_url, html, walk)
+                        new = set(walk.observe([article_digest(a) for a in page_articles]))
+                        if walk.pages > 1:
+                            page_articles = [a for a in page_articles if article_digest(a) in new]
+                        articles.extend(page_articles)
+                        del html
                 
                 self.rate_limit()
                 
             except Exception as e:
-                self.logger.error(f"Error processing {news_url}: {str(e)}")
+                self.logger.error("Error processing %s: %s", news_url, e)
+                continue
+        
+        return articles
+    
+    def feed_articles(self):
+        """Articles built straight from feed entries (title, link, date, summary), no HTML parsing"""
+        articles = []
+        for entry in self.feed_entries():
+            title = self.light_refine_content(entry['title'])
+            content = self.light_refine_content(entry['summary'])
+            is_valid, _ = self.is_meaningful_content(title, content)
+            if not is_valid:
                 continue
+            articles.append(self.new_article(entry['url'], title, content, date=entry['published']))
+        if articles:
+            self.run_stats.record_extractor('feed', len(articles))
+        return articles
+    
+    def listing_work(self, url, html):
+        """Listing articles for a distributed worker (no detail pages)"""
+        return self.process_page(url, html), []
+    
+    def detail_work(self, url, html):
+        """Listing sources queue no detail pages"""
+        return None
+    
+    def process_page(self, news_url, html, walk=None):
+        """Parse, extract and build articles for one fetched page (CPU-only, no I/O)"""
+        articles = []
+        
+        # Extract using site-specific methods; the tree is released right after
+        with self.parsed(html) as soup:
+            if walk:
+                walk.follow(soup, news_url)
+            extracted_content = self.extract_synopsis_articles(soup, news_url)
+        
+        for content_data in extracted_content:
+            articles.append(self.new_article(news_url, content_data['title'], content_data['content']))
         
         return articles
 
-def main():
-    """Main function with output2 folder and output folder deletion"""
+def print_source_header(source_name, source_config):
+    print(f"\n📊 Processing: {source_config['name']}")
+    print(f"🔗 URL: {source_config['news_urls'][0]}")
+    
+    if StagingArea.is_scheme_source(source_name, source_config):
+        print("📋 SCHEMES → will go to output2/schemes.txt")
+    else:
+        print("📰 NEWS → will go to output2/news.txt")
+
+def stage_source(staging, source_name, source_config, articles):
+    """Stage one source's articles and print its summary"""
+    if not articles:
+        print("⚠️  No content extracted")
+        return
+    
+    with metrics.timer('write', source=source_config['name']):
+        snapshot = staging.add(source_name, source_config, articles)
+    
+    if StagingArea.is_scheme_source(source_name, source_config):
+        print(f"✅ SUCCESS: {len(articles)} SCHEMES extracted")
+    else:
+        print(f"✅ SUCCESS: {len(articles)} NEWS articles extracted")
+    
+    total_chars = sum(len(a.get('content', '')) for a in articles)
+    avg_chars = total_chars // len(articles)
+    
+    print(f"📊 Total content: {total_chars:,} characters")
+    print(f"📊 Average per item: {avg_chars} characters")
+    
+    if snapshot:
+        print(f"💾 Snapshot file: {snapshot}")
+    
+    # Show samples
+    print(f"📋 Sample content:")
+    for i, article in enumerate(articles[:2], 1):
+        title = article.get('title', '')[:70]
+        content_len = len(article.get('content', ''))
+        
+        print(f"   {i}. {title}...")
+        print(f"      📊 {content_len} characters")
+    print()
+
+def run_pipelined(staging, report, planner):
+    """All sources at once: threaded fetches, process-pool extraction, serialized staging
+
+    With a run budget every fetcher stops at the end of the whole window
+    (sources run concurrently, so there is no per-source share).
+    """
+    from utils.pipeline import StagedPipeline
+    
+    before = {name: stage_seconds(cfg['name']) for name, cfg in ALL_SOURCES.items()}
+    
+    def write(source_name, articles):
+        print_source_header(source_name, ALL_SOURCES[source_name])
+        stage_source(staging, source_name, ALL_SOURCES[source_name], articles)
+    
+    pipeline = StagedPipeline(
+        SimpleConsolidatedScraper,
+        cpu_workers=config.PIPELINE_WORKERS,
+        max_pending=config.PIPELINE_MAX_PENDING,
+        writer=write,
+        deadline=planner.started_at + planner.budget if planner.budget is not None else None
+    )
+    print(f"⚙️  Pipelined run: {pipeline.cpu_workers} extraction processes, "
+          f"up to {pipeline.max_pending} pages in flight")
+    results = pipeline.run({name: ALL_SOURCES[name] for name in planner.order})
+    staging.reorder(ALL_SOURCES)
+    
+    for source_name, result in results.items():
+        if result['scraper']:
+            staging.hold(source_name, result['scraper'])
+        if result['error']:
+            print(f"❌ ERROR ({source_name}): {result['error']}")
+        report.add(
+            source_name, ALL_SOURCES[source_name], result['articles'],
+            run_stats=result['run_stats'],
+            wall_seconds=result['seconds'],
+            stages_before=before[source_name],
+            error=result['error']
+        )
+    return results
+
+def run_source(staging, report, planner, source_name, source_config, profiler=None, memory=None):
+    """Run one source within its share of the budget; deferred sources are reported, not run"""
+    print_source_header(source_name, source_config)
+    
+    deadline = planner.start(source_name)
+    if planner.is_deferred(source_name):
+        print(f"⏭️  DEFERRED: run budget spent ({planner.remaining():.0f}s left), next run will pick it up")
+        metrics.inc('sources_deferred', source=source_config['name'])
+        report.add(source_name, source_config, None, deferred=True)
+        return
+    if deadline is not None:
+        print(f"⏱️  Budget share: {planner.allowances[source_name]:.0f}s")
+    
+    try:
+        with report.track(source_name, source_config) as entry:
+            scraper = entry.scraper = create_scraper(source_name, source_config)
+            scraper.deadline = deadline
+            with profiler.profile(source_name) if profiler else nullcontext(), \
+                    memory.track(source_name) if memory else nullcontext():
+                articles = entry.articles = scraper.run()
+        staging.hold(source_name, scraper)
+        if profiler:
+            profiler.print_hotspots(source_name)
+        if scraper.budget_exhausted():
+            print("⏱️  Budget share used up: keeping what was scraped so far")
+        
+        stage_source(staging, source_name, source_config, articles)
+            
+    except Exception as e:
+        print(f"❌ ERROR: {str(e)}")
+        print("🔍 Continuing to next source...")
+    finally:
+        planner.finish(source_name)
+
+def main(save_snapshots=None, profile=None, pipeline=None, budget=None):
+    """Main function - stage per-source results in memory, write output2 once
+
+    profile: None, 'cprofile' or 'sampling' - profile each source run separately
+    pipeline: fetch/extract all sources concurrently (default config.PIPELINE_ENABLED)
+    budget: seconds for the whole run, sources by priority (default config.RUN_BUDGET)
+    """
+    if budget is None:
+        budget = config.RUN_BUDGET
+    if save_snapshots is None:
+        save_snapshots = config.SAVE_DAILY_SNAPSHOTS
+    if pipeline is None:
+        pipeline = config.PIPELINE_ENABLED
+    if pipeline and (profile or config.TRACE_MEMORY):
+        print("⚠️  Per-source profiling/memory tracing needs a sequential run; pipeline disabled")
+        pipeline = False
+    
+    setup_logging(
+        level=config.LOG_LEVEL,
+        log_file=default_log_file('scraper', config.LOGS_DIR) if config.LOG_TO_FILE else None
+    )
+    
     print("📚 AGRICULTURE SCRAPER - CLEAN OUTPUT")
     print("📰 News: Economic Times + Times of India")
     print("📋 Schemes: Testbook Government Schemes")
     print("📁 Final Output: output2/ folder only")
-    print("🗑️  Temporary files will be cleaned up")
+    if save_snapshots:
+        print("💾 Per-source snapshots will be kept in output/daily")
+    if budget is not None:
+        print(f"⏱️  Run budget: {budget:.0f}s, sources by priority")
     print("=" * 70)
     print(f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    all_articles = []
-    news_articles = []  # For ET + TOI
-    scheme_articles = []  # For Testbook schemes
-    successful_sources = 0
+    file_manager = FileManager()
+    staging = StagingArea(file_manager, save_snapshots=save_snapshots)
+    profiler = SourceProfiler(config.PROFILE_DIR, mode=profile) if profile else None
+    memory = MemoryTracker() if config.TRACE_MEMORY else None
+    report = RunReport()
+    planner = RunPlanner(ALL_SOURCES, budget=budget)
     
-    for source_name, source_config in ALL_SOURCES.items():
-        print(f"\n📊 Processing: {source_config['name']}")
-        print(f"🔗 URL: {source_config['news_urls'][0]}")
-        
-        if 'testbook' in source_name.lower():
-            print("📋 SCHEMES → will go to output2/schemes.txt")
-        else:
-            print("📰 NEWS → will go to output2/news.txt")
-        
-        try:
-            scraper = SimpleConsolidatedScraper(source_config)
-            articles = scraper.run()
-            
-            if articles:
-                all_articles.extend(articles)
-                successful_sources += 1
-                
-                # Separate articles by type
-                if 'testbook' in source_name.lower() or source_config.get('category') == 'government_schemes':
-                    scheme_articles.extend(articles)
-                    print(f"✅ SUCCESS: {len(articles)} SCHEMES extracted")
-                else:
-                    news_articles.extend(articles)
-                    print(f"✅ SUCCESS: {len(articles)} NEWS articles extracted")
-                
-                total_chars = sum(len(a.get('content', '')) for a in articles)
-                avg_chars = total_chars // len(articles)
-                
-                print(f"📊 Total content: {total_chars:,} characters")
-                print(f"📊 Average per item: {avg_chars} characters")
-                
-                # Save individual file temporarily in output/daily
-                file_manager = FileManager()
-                filename = file_manager.save_articles_to_text(articles, source_name)
-                print(f"💾 Temporary file: {filename}")
-                
-                # Show samples
-                print(f"📋 Sample content:")
-                for i, article in enumerate(articles[:2], 1):
-                    title = article.get('title', '')[:70]
-                    content_len = len(article.get('content', ''))
-                    
-                    print(f"   {i}. {title}...")
-                    print(f"      📊 {content_len} characters")
-                print()
-            else:
-                print("⚠️  No content extracted")
-                
-        except Exception as e:
-            print(f"❌ ERROR: {str(e)}")
-            print("🔍 Continuing to next source...")
-        
-        time.sleep(2)
+    if pipeline:
+        run_pipelined(staging, report, planner)
+    
+    for index, source_name in enumerate([] if pipeline else planner.order):
+        if index and not config.REPLAY_DIR and planner.remaining() != 0:
+            time.sleep(2)
+        run_source(staging, report, planner, source_name, ALL_SOURCES[source_name], profiler, memory)
     
-    # Create consolidated files and clean up
+    # Consolidated files keep the configured source order, whatever order the sources ran in
+    staging.reorder(ALL_SOURCES)
+    
+    all_articles = staging.all_articles
+    news_articles = staging.news_articles
+    scheme_articles = staging.scheme_articles
+    
+    # Create consolidated files
     if all_articles:
         print(f"\n🎉 SCRAPING COMPLETE!")
-        print(f"✅ Successful sources: {successful_sources}/{len(ALL_SOURCES)}")
+        print(f"✅ Successful sources: {staging.successful_sources}/{len(ALL_SOURCES)}")
         print(f"📊 Total items: {len(all_articles)}")
         
         # Show breakdown
@@ -138,19 +281,21 @@ def main():
         print(f"   📰 News Articles: {len(news_articles)}")
         print(f"   📋 Government Schemes: {len(scheme_articles)}")
         
-        file_manager = FileManager()
+        if memory:
+            memory.print_summary()
         
         # Create consolidated files in output2
         print(f"\n📁 CREATING CONSOLIDATED FILES IN OUTPUT2...")
+        news_file = schemes_file = None
         
         # Create NEWS consolidated file → output2/news.txt
         if news_articles:
             print(f"📰 Creating news.txt...")
             
-            news_file = file_manager.save_news_consolidated(news_articles)
+            with metrics.timer('write', source='consolidated'):
+                news_file = file_manager.save_news_consolidated(news_articles)
             
             news_total_chars = sum(len(a.get('content', '')) for a in news_articles)
-            news_avg_chars = news_total_chars // len(news_articles)
             
             print(f"✅ NEWS FILE CREATED:")
             print(f"   📁 File: {news_file}")
@@ -162,10 +307,10 @@ def main():
         if scheme_articles:
             print(f"📋 Creating schemes.txt...")
             
-            schemes_file = file_manager.save_schemes_consolidated(scheme_articles)
+            with metrics.timer('write', source='consolidated'):
+                schemes_file = file_manager.save_schemes_consolidated(scheme_articles)
             
             schemes_total_chars = sum(len(a.get('content', '')) for a in scheme_articles)
-            schemes_avg_chars = schemes_total_chars // len(scheme_articles)
             
             print(f"✅ SCHEMES FILE CREATED:")
             print(f"   📁 File: {schemes_file}")
@@ -173,23 +318,21 @@ def main():
             print(f"   📊 Total content: {schemes_total_chars:,} characters")
             print(f"   📋 Source: Testbook Government Schemes")
         
-        # DELETE THE OUTPUT FOLDER
-        print(f"\n🗑️  CLEANING UP TEMPORARY FILES...")
-        deletion_success = file_manager.delete_output_folder()
-        
-        if deletion_success:
-            print(f"✅ Cleanup complete! Only output2/ folder remains.")
-        else:
-            print(f"⚠️  Cleanup had issues, but consolidated files are ready.")
-        
         # Show final result
         print(f"\n🚀 FINAL RESULT:")
         print(f"📁 Folder: output2/ (same directory as config/)")
         print(f"📰 output2/news.txt - {len(news_articles)} news articles")
         print(f"📋 output2/schemes.txt - {len(scheme_articles)} government schemes")
-        print(f"🗑️  Temporary 'output' folder deleted")
+        if save_snapshots:
+            print(f"💾 Per-source snapshots kept in output/daily")
         print(f"💼 Clean setup ready for your farmer app!")
         
+        # Only now are this run's detail URLs done; a failed write leaves them to the next run
+        if (news_file or not news_articles) and (schemes_file or not scheme_articles):
+            staging.published()
+        write_metrics()
+        write_run_report(report, planner)
+        prune_archive()
         return {
             'news_articles': news_articles,
             'scheme_articles': scheme_articles,
@@ -198,7 +341,105 @@ def main():
     
     else:
         print("❌ No content found")
+        staging.published()  # nothing to write, nothing to lose
+        write_metrics()
+        write_run_report(report, planner)
+        prune_archive()
         return None
 
+def write_metrics():
+    """Export this run's stage timings and counters for the node exporter"""
+    if not config.METRICS_FILE:
+        return None
+    normalization_cache.export_metrics(metrics)
+    try:
+        path = metrics.write_prometheus(config.METRICS_FILE)
+        print(f"📈 Metrics written to {path}")
+        return path
+    except Exception as e:
+        print(f"⚠️  Could not write metrics file: {str(e)}")
+        return None
+
+def prune_archive():
+    """Drop archived responses past the retention window (runs that archive pages only)"""
+    if not config.ARCHIVE_ENABLED or config.REPLAY_DIR or not config.ARCHIVE_RETENTION_DAYS:
+        return 0
+    from utils.html_archive import HtmlArchive
+    try:
+        archive = HtmlArchive.shared(
+            config.ARCHIVE_DIR,
+            dict_size=config.ARCHIVE_DICT_SIZE,
+            dict_min_samples=config.ARCHIVE_DICT_MIN_SAMPLES
+        )
+        removed = archive.prune(config.ARCHIVE_RETENTION_DAYS)
+        if removed:
+            print(f"🗑️  Archive: {removed} bodies older than {config.ARCHIVE_RETENTION_DAYS} days pruned")
+        return removed
+    except Exception as e:
+        print(f"⚠️  Could not prune archive: {str(e)}")
+        return 0
+
+def write_run_report(report, planner=None):
+    """Persist this run's per-source report under the rolling reports directory"""
+    if not config.REPORTS_DIR:
+        return None
+    try:
+        extra = {'budget': planner.summary()} if planner and planner.budget is not None else {}
+        path = report.write(
+            config.REPORTS_DIR,
+            retention_days=config.REPORT_RETENTION_DAYS,
+            replay=bool(config.REPLAY_DIR),
+            normalize_cache=normalization_cache.stats(),
+            **extra
+        )
+        print(f"🧾 Run report written to {path}")
+        return path
+    except Exception as e:
+        print(f"⚠️  Could not write run report: {str(e)}")
+        return None
+
+def parse_args(argv=None):
+    """Command line options for the multi-source run"""
+    parser = argparse.ArgumentParser(description='Agriculture multi-source scraper')
+    parser.add_argument('--save-snapshots', action='store_true',
+                        help='Also write per-source snapshot files to output/daily (debug/archival)')
+    parser.add_argument('--archive', action='store_true',
+                        help=f'Archive every fetched page under {config.ARCHIVE_DIR}/ for replay')
+    parser.add_argument('--replay', metavar='DIR',
+                        help='Serve pages from a recorded corpus (archive or fixture dir) instead of the network')
+    parser.add_argument('--metrics-file', metavar='PATH',
+                        help=f'Prometheus textfile to write at the end of the run (default: {config.METRICS_FILE})')
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=SourceProfiler.MODES,
+                        help=f'Profile each source separately (default cprofile); output under {config.PROFILE_DIR}/')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Report per-source peak memory (tracemalloc) in the run summary')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Fetch all sources concurrently and extract in a process pool')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='Extraction processes for --pipeline (default: CPU count, 0 = in-process)')
+    parser.add_argument('--budget', type=float, metavar='SECONDS',
+                        help='Time budget for the whole run; sources run by priority, late ones are deferred')
+    parser.add_argument('--report-dir', metavar='DIR',
+                        help=f'Directory for the JSON run report (default: {config.REPORTS_DIR})')
+    parser.add_argument('--no-report', action='store_true', help='Do not write a JSON run report')
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.replay:
+        config.REPLAY_DIR = args.replay
+    if args.metrics_file:
+        config.METRICS_FILE = args.metrics_file
+    if args.trace_memory:
+        config.TRACE_MEMORY = True
+    if args.report_dir:
+        config.REPORTS_DIR = args.report_dir
+    if args.no_report:
+        config.REPORTS_DIR = None
+    if args.archive:
+        config.ARCHIVE_ENABLED = True
+    if args.workers is not None:
+        config.PIPELINE_WORKERS = args.workers
+    if args.budget is not None:
+        config.RUN_BUDGET = args.budget
+    main(save_snapshots=args.save_snapshots or None, profile=args.profile, pipeline=args.pipeline or None)
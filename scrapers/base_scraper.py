@@ -1,24 +1,109 @@
 """
 Enhanced Scraper with Testbook Agriculture Schemes Extraction
+
+requests, bs4 and the SQLite-backed stores are imported when a scraper first
+needs them, so importing this module (registry, --list, --help) stays cheap.
 """
-import requests
 import time
 import random
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
 import re
-from urllib.parse import urljoin
+from contextlib import contextmanager
+from urllib.parse import urljoin, urlparse
+from config.settings import config
+from utils.metrics import metrics, source_label, timed
+from utils.logger import log_context, setup_logging
+from utils.profiling import paused
+from utils.run_report import SourceStats
+from utils.dates import parse_date, to_utc_iso
+from utils.article import Article
+from utils.text_cache import normalization_cache
+
+DEFAULT_DATE_SELECTOR = "time, .date, .publish-date, .story-date"
+PUBLISHED_META = (
+    {'property': 'article:published_time'},
+    {'itemprop': 'datePublished'},
+    {'name': 'publish-date'},
+    {'name': 'pubdate'},
+)
+
+
+def host_failure(status):
+    """Whether a failed response counts against its host: no answer, 5xx, or throttling/blocking"""
+    return status is None or status >= 500 or status in (403, 429)
+
+
+class PageTooLargeError(Exception):
+    """Page exceeds MAX_PAGE_BYTES / MAX_PAGE_NODES and was not parsed"""
+
+
+def clean_text(text):
+    """Basic text cleaning (uncached; see BaseScraper.clean_text)"""
+    text = text.replace('*agriculture*', 'agriculture')
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+
+    return text
+
+
+def refine_text(text):
+    """Light content refinement (uncached; see BaseScraper.light_refine_content)"""
+    # Remove obvious junk
+    light_junk_patterns = [
+        r'Advertisement',
+        r'Must Watch',
+        r'Subscribe now',
+        r'Follow us on',
+        r'Share this',
+        r'Read more about',
+        r'Also read:',
+        r'Copyright.*?reserved',
+        r'\(Reuters\)|\(PTI\)|\(ANI\)',
+        r'Last Modified\s*:.*',
+        r'Published\s*:.*',
+        r'Updated\s*:.*',
+        r'Download.*?app.*',
+        r'Get.*?SuperCoaching.*',
+        r'Scan this QR code.*',
+        r'₹\d+.*Your Total Savings.*'
+    ]
+
+    for pattern in light_junk_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+
+    # Clean up spacing
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+
+    return text
+
 
 class BaseScraper(ABC):
     """Enhanced scraper with Testbook scheme extraction"""
     
     def __init__(self, source_config):
+        import requests
         self.source_config = source_config
         self.session = requests.Session()
         self.setup_session()
         self.setup_logging()
+        self.replay = self.setup_replay()
+        self.archive = self.setup_archive()
+        self._frontier = None
+        self.breaker = self.setup_breaker()
+        self.robots = self.setup_robots()
+        self.blocked_urls = set()  # not requested this run: open circuit or budget spent (not real failures)
+        self.last_fetch_blocked = False
+        self.deadline = None  # time.monotonic() after which no request goes out (run budget)
+        self.discovered = {}  # url -> feed entry (title, published, summary) from feed_entries
+        self._keyword_extractor = None  # one bound extract_keywords shared by this scraper's articles
+        self.run_stats = SourceStats()
+        # Frontier writes held until this run's articles are published (see commit_published)
+        self.pending_done = []      # extracted detail URLs
+        self.pending_items = []     # content digests of new listing items
+        self.pending_articles = []  # articles whose dates advance the watermark
         
     def setup_session(self):
         """Configure requests session"""
@@ -31,130 +116,455 @@ class BaseScraper(ABC):
         self.session.timeout = 30
         
     def setup_logging(self):
-        """Setup logging"""
-        logging.basicConfig(level=logging.INFO)
+        """Shared queue-based logging (configured once per process)"""
+        setup_logging(level=config.LOG_LEVEL)
         self.logger = logging.getLogger(self.__class__.__name__)
     
-    def get_page(self, url):
-        """Fetch webpage with retries"""
-        for attempt in range(2):
+    def setup_replay(self):
+        """Shared replay corpus when REPLAY_DIR is set"""
+        if not config.REPLAY_DIR:
+            return None
+        from utils.replay import ReplayCorpus
+        return ReplayCorpus.shared(config.REPLAY_DIR)
+    
+    def setup_archive(self):
+        """Shared raw HTML archive, if enabled (never while replaying)"""
+        if not config.ARCHIVE_ENABLED or self.replay:
+            return None
+        from utils.html_archive import HtmlArchive
+        return HtmlArchive.shared(
+            config.ARCHIVE_DIR,
+            dict_size=config.ARCHIVE_DICT_SIZE,
+            dict_min_samples=config.ARCHIVE_DICT_MIN_SAMPLES
+        )
+    
+    def setup_breaker(self):
+        """Shared per-host circuit breaker (off while replaying)"""
+        if not config.BREAKER_STATE_FILE or self.replay:
+            return None
+        from utils.circuit_breaker import CircuitBreaker
+        return CircuitBreaker.shared(
+            config.BREAKER_STATE_FILE,
+            failure_threshold=config.BREAKER_FAILURE_THRESHOLD,
+            cooldown=config.BREAKER_COOLDOWN
+        )
+    
+    def setup_robots(self):
+        """Shared robots.txt cache (off while replaying)"""
+        if not config.ROBOTS_ENABLED or self.replay:
+            return None
+        from utils.robots import RobotsCache
+        return RobotsCache.shared(
+            config.ROBOTS_CACHE_DIR,
+            ttl=config.ROBOTS_TTL,
+            error_ttl=config.ROBOTS_ERROR_TTL,
+            user_agent=config.ROBOTS_USER_AGENT
+        )
+    
+    def fetch_robots(self, url):
+        """(status, body) of a robots.txt, single attempt"""
+        response = self.session.get(url, timeout=10)
+        return response.status_code, response.text
+    
+    def robots_allowed(self, url):
+        if not self.robots or self.robots.allowed(url, self.fetch_robots):
+            return True
+        metrics.inc('robots_disallowed', source=source_label(self))
+        return False
+    
+    def request_delay(self, url):
+        """Seconds between requests to url's host: its robots.txt Crawl-delay, else DEFAULT_DELAY"""
+        delay = self.robots.crawl_delay(url, self.fetch_robots) if self.robots else None
+        return config.DEFAULT_DELAY if delay is None else delay
+    
+    def budget_exhausted(self, after=0):
+        """Whether the run budget deadline has passed (or will within after seconds)"""
+        return self.deadline is not None and time.monotonic() + after >= self.deadline
+    
+    def request_timeout(self):
+        """Per-request timeout: none by default, at most what is left of the run budget"""
+        if self.deadline is None:
+            return None
+        return max(1.0, min(config.REQUEST_TIMEOUT, self.deadline - time.monotonic()))
+    
+    @property
+    def frontier(self):
+        """Shared persistent URL frontier for detail pages, opened on first use (off while replaying)"""
+        if self._frontier is None and config.FRONTIER_DB and not self.replay:
+            from utils.frontier import CrawlFrontier
+            self._frontier = CrawlFrontier.shared(config.FRONTIER_DB, max_attempts=config.FRONTIER_MAX_ATTEMPTS)
+        return self._frontier
+    
+    def listing_walk(self, news_url, by_content=False):
+        """ListingWalk over a listing URL; seen keys are detail URLs, or content digests (by_content)"""
+        from utils.pagination import ListingWalk
+        if not self.frontier:
+            return ListingWalk(self, news_url)
+        source = source_label(self)
+        if by_content:
+            return ListingWalk(self, news_url,
+                               is_seen=lambda digest: self.frontier.seen_item(source, digest),
+                               record=lambda digests: self.pending_items.extend(digests))
+        return ListingWalk(self, news_url, is_seen=lambda url: self.frontier.seen(source, url))
+    
+    def listing_links(self, news_url, find_links):
+        """New article links from a listing and its older pages, newest first; find_links(soup) -> [url]
+
+        Links whose listing entry is dated before the watermark are dropped (and count as seen).
+        """
+        cutoff = self.watermark_cutoff()
+        links = []
+        with self.listing_walk(news_url) as walk:
+            for page_url, html in walk:
+                old = set()
+                with self.parsed(html) as soup:
+                    walk.follow(soup, page_url)
+                    page_links = find_links(soup)
+                    if cutoff:
+                        dates = self.listing_dates(soup, page_url)
+                        old = {url for url in page_links if url in dates and dates[url] < cutoff}
+                if old:
+                    metrics.inc('watermark_skipped', len(old), source=source_label(self))
+                links.extend(walk.observe(page_links, seen=old))
+        return links
+    
+    def date_selector(self):
+        return self.source_config.get('selectors', {}).get('date') or DEFAULT_DATE_SELECTOR
+    
+    def listing_dates(self, soup, page_url):
+        """{article url: UTC datetime} for listing entries that show a date next to their link"""
+        dates = {}
+        for element in soup.select(self.date_selector()):
+            published = parse_date(element.get('datetime') or element.get_text(' ', strip=True))
+            if not published:
+                continue
+            container = element
+            for _ in range(4):  # the entry's card: nearest ancestor holding a link
+                container = container.parent
+                if container is None:
+                    break
+                link = container.find('a', href=True)
+                if link:
+                    dates.setdefault(urljoin(page_url, link['href']), published)
+                    break
+        return dates
+    
+    def extract_published(self, soup):
+        """Publication date of an article page (UTC datetime) from meta tags, <time> or the date selector"""
+        for attrs in PUBLISHED_META:
+            meta = soup.find('meta', attrs=attrs)
+            published = parse_date(meta.get('content')) if meta else None
+            if published:
+                return published
+        for element in soup.select(self.date_selector()):
+            published = parse_date(element.get('datetime') or element.get_text(' ', strip=True))
+            if published:
+                return published
+        return None
+    
+    def watermark_cutoff(self):
+        """Entries published before this (UTC datetime) were covered by earlier runs; None without a watermark"""
+        if not self.frontier:
+            return None
+        watermark = self.frontier.watermark(source_label(self))
+        if not watermark:
+            return None
+        return datetime.fromisoformat(watermark) - timedelta(seconds=config.WATERMARK_LOOKBACK)
+    
+    def advance_watermark(self, articles):
+        """Raise the source watermark to the newest article date of this run"""
+        if not self.frontier:
+            return
+        dates = [parse_date(article.get('date')) for article in articles]
+        dates = [published for published in dates if published]
+        if dates:
+            self.frontier.advance_watermark(source_label(self), to_utc_iso(max(dates)))
+    
+    def feed_entries(self):
+        """Entries from the source's RSS/Atom feeds and sitemaps, newest first ([] without feeds)"""
+        feeds = self.source_config.get('feeds')
+        if not feeds:
+            return []
+        from utils.discovery import discover
+        entries = discover(self.get_page, feeds, max_sitemaps=config.DISCOVERY_MAX_SITEMAPS)
+        self.discovered.update((entry['url'], entry) for entry in entries)
+        self.logger.info("Feeds: %d entries from %d feed(s)%s", len(entries), len(feeds),
+                         "" if entries else ", falling back to HTML listings")
+        return entries
+    
+    def discover_links(self, find_links):
+        """Article links for the source: from its feeds when they have entries, else its HTML listings"""
+        entries = self.feed_entries()
+        if entries:
+            cutoff = self.watermark_cutoff()
+            fresh = [entry for entry in entries
+                     if not (cutoff and entry['published'] and datetime.fromisoformat(entry['published']) < cutoff)]
+            if len(fresh) < len(entries):
+                metrics.inc('watermark_skipped', len(entries) - len(fresh), source=source_label(self))
+            return [entry['url'] for entry in fresh]
+        links = []
+        for news_url in self.source_config['news_urls']:
             try:
-                self.logger.info(f"Fetching: {url}")
-                response = self.session.get(url)
-                response.raise_for_status()
-                response.encoding = 'utf-8'
-                return response.text
+                self.logger.info("Processing listing page: %s", news_url)
+                links.extend(self.listing_links(news_url, find_links))
             except Exception as e:
-                self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
-                if attempt < 1:
-                    time.sleep(3)
-        return None
+                self.logger.error("Error reading listing page %s: %s", news_url, e)
+        return links
+    
+    def detail_urls(self, links, limit=None):
+        """Detail URLs to fetch this run: new links join the frontier, fetched ones are skipped"""
+        limit = limit or config.MAX_DETAIL_PAGES
+        links = [link for link in links if self.robots_allowed(link)]  # never queue disallowed URLs
+        if not self.frontier:
+            return links[:limit]
+        source = source_label(self)
+        added = self.frontier.add_many(source, links)
+        urls = self.frontier.claim(source, limit)
+        self.logger.info("Frontier: %d new of %d links, fetching %d", added, len(links), len(urls))
+        return urls
     
+    def mark_detail(self, url, ok=True, error=None):
+        """Record a detail URL's outcome in the frontier (done only once the output is published)"""
+        if not self.frontier:
+            return
+        if ok:
+            self.pending_done.append(url)
+        elif url in self.blocked_urls:
+            self.frontier.release(source_label(self), [url])  # never requested; keep its attempts
+        else:
+            self.frontier.mark_failed(source_label(self), url, error=error)
+    
+    def commit_published(self):
+        """Record this run in the frontier once the files holding its articles are written
+
+        Until then its detail URLs stay in_progress, so a crash or SIGTERM before the
+        write queues them again on the next start instead of skipping them for good.
+        """
+        if self.frontier:
+            source = source_label(self)
+            for url in self.pending_done:
+                self.frontier.mark_done(source, url)
+            if self.pending_items:
+                self.frontier.add_items(source, self.pending_items)
+        self.advance_watermark(self.pending_articles)
+        self.pending_done, self.pending_items, self.pending_articles = [], [], []
+    
+    def release_unpublished(self):
+        """Queue again the detail URLs of an earlier run whose output was never written"""
+        if self.frontier and self.pending_done:
+            self.frontier.release(source_label(self), self.pending_done)
+        self.pending_done, self.pending_items, self.pending_articles = [], [], []
+    
+    @timed('fetch')
+    def get_page(self, url):
+        """Fetch webpage with retries"""
+        with log_context(url=url, stage='fetch'):
+            source = source_label(self)
+            start = time.perf_counter()
+            if self.replay:
+                html = self.replay.get(url)
+                if html is None:
+                    self.logger.warning("Not in replay corpus: %s", url)
+                    self.run_stats.record_fetch(url, None, 0, time.perf_counter() - start,
+                                                replay=True, error='not in replay corpus')
+                else:
+                    size = len(html.encode('utf-8'))
+                    metrics.inc('cache_hits', source=source, cache='replay')
+                    metrics.inc('pages_fetched', source=source)
+                    metrics.inc('bytes_fetched', size, source=source)
+                    self.run_stats.record_fetch(url, 200, size, time.perf_counter() - start, replay=True)
+                return html
+            
+            if self.budget_exhausted():
+                self.logger.warning("Run budget spent, not fetching %s", url)
+                metrics.inc('budget_skipped', source=source)
+                self.blocked_urls.add(url)
+                self.last_fetch_blocked = True
+                self.run_stats.record_fetch(url, None, 0, time.perf_counter() - start, error='run budget spent')
+                return None
+            
+            if not self.robots_allowed(url):
+                self.logger.info("robots.txt disallows %s", url)
+                self.last_fetch_blocked = True
+                self.run_stats.record_fetch(url, None, 0, time.perf_counter() - start, error='disallowed by robots.txt')
+                return None
+            
+            host = urlparse(url).hostname
+            # Last check before the request: in half-open state allow() hands out the one probe
+            if self.breaker and not self.breaker.allow(host):
+                self.logger.warning("Circuit open for %s, skipping %s", host, url)
+                metrics.inc('circuit_rejected', source=source, host=host)
+                self.blocked_urls.add(url)
+                self.last_fetch_blocked = True
+                self.run_stats.record_fetch(url, None, 0, time.perf_counter() - start, error='circuit open')
+                return None
+            
+            self.last_fetch_blocked = False
+            error = None
+            waited = 0  # Crawl-delay spacing and retry back-off are not fetch latency
+            for attempt in range(2):
+                status = None
+                if self.robots:
+                    from utils.robots import throttle
+                    with metrics.timer('sleep', source=source):
+                        waited += throttle.wait(host, self.request_delay(url))
+                try:
+                    self.logger.debug("Fetching: %s", url)
+                    response = self.session.get(url, timeout=self.request_timeout())
+                    status = response.status_code
+                    response.raise_for_status()
+                    response.encoding = 'utf-8'
+                    if self.breaker:
+                        self.breaker.record_success(host)
+                    metrics.inc('pages_fetched', source=source)
+                    metrics.inc('bytes_fetched', len(response.content), source=source)
+                    self.run_stats.record_fetch(url, status, len(response.content),
+                                                time.perf_counter() - start - waited, attempts=attempt + 1)
+                    if self.archive:
+                        try:
+                            self.archive.store_response(url, response, self.source_config['name'])
+                        except Exception as e:
+                            self.logger.warning("Could not archive %s: %s", url, e)
+                    return response.text
+                except Exception as e:
+                    self.logger.warning("Attempt %d failed for %s: %s", attempt + 1, url, e)
+                    metrics.inc('fetch_errors', source=source)
+                    error = str(e)
+                    if self.breaker and host_failure(status):
+                        if self.breaker.record_failure(host):
+                            self.logger.warning("Circuit opened for %s after repeated failures", host)
+                            break
+                    elif self.breaker:
+                        self.breaker.record_success(host)  # the host answered; the URL is bad
+                    if attempt < 1:
+                        if self.budget_exhausted(after=3):
+                            break
+                        back_off = time.perf_counter()
+                        with metrics.timer('sleep', source=source), paused():
+                            time.sleep(3)
+                        waited += time.perf_counter() - back_off
+            self.run_stats.record_fetch(url, status, 0, time.perf_counter() - start - waited,
+                                        attempts=attempt + 1, error=error)
+            return None
+    
+    @timed('parse')
     def parse_html(self, html_content):
-        """Parse HTML"""
+        """Parse HTML (pathological pages are rejected before a tree is built)"""
+        from bs4 import BeautifulSoup
+        self.check_page_limits(html_content)
+        metrics.inc('pages_parsed', source=source_label(self))
         return BeautifulSoup(html_content, 'html.parser')
     
+    def check_page_limits(self, html_content):
+        """Raise PageTooLargeError for pages over the configured size or node budget"""
+        size = len(html_content)
+        if size > config.MAX_PAGE_BYTES:
+            metrics.inc('pages_rejected', source=source_label(self), reason='size')
+            raise PageTooLargeError(f"Page too large ({size:,} chars > {config.MAX_PAGE_BYTES:,})")
+        
+        # Every element starts with '<'; counting is C-speed and needs no tree
+        nodes = html_content.count('<')
+        if nodes > config.MAX_PAGE_NODES:
+            metrics.inc('pages_rejected', source=source_label(self), reason='nodes')
+            raise PageTooLargeError(f"Too many nodes (~{nodes:,} > {config.MAX_PAGE_NODES:,})")
+    
+    def release_tree(self, soup):
+        """Free a parsed tree now instead of waiting for the cycle collector"""
+        if soup is not None:
+            soup.decompose()
+    
+    @contextmanager
+    def parsed(self, html_content):
+        """Parse a page for the duration of the block, then release the tree"""
+        soup = self.parse_html(html_content)
+        try:
+            yield soup
+        finally:
+            self.release_tree(soup)
+    
     def clean_text(self, text):
-        """Basic text cleaning"""
+        """Basic text cleaning (memoized)"""
         if not text:
             return ""
-        
-        text = text.replace('*agriculture*', 'agriculture')
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
+        return normalization_cache.get('clean', text, clean_text)
     
+    @timed('refine')
     def light_refine_content(self, text):
-        """Light content refinement"""
+        """Light content refinement (memoized)"""
         if not text:
             return ""
-        
-        # Remove obvious junk
-        light_junk_patterns = [
-            r'Advertisement',
-            r'Must Watch',
-            r'Subscribe now',
-            r'Follow us on',
-            r'Share this',
-            r'Read more about',
-            r'Also read:',
-            r'Copyright.*?reserved',
-            r'\(Reuters\)|\(PTI\)|\(ANI\)',
-            r'Last Modified\s*:.*',
-            r'Published\s*:.*',
-            r'Updated\s*:.*',
-            r'Download.*?app.*',
-            r'Get.*?SuperCoaching.*',
-            r'Scan this QR code.*',
-            r'₹\d+.*Your Total Savings.*'
-        ]
-        
-        for pattern in light_junk_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # Clean up spacing
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
+        return normalization_cache.get('refine', text, refine_text)
     
     def is_meaningful_content(self, title, content):
         """Content validation"""
+        source = source_label(self)
+        metrics.inc('candidates', source=source)
+        
         if not title or not content:
-            return False, "Empty content"
+            return self.reject_candidate('empty', "Empty content")
         
         if len(content) < 50:  # Increased minimum for schemes
-            return False, f"Content too short ({len(content)} chars)"
+            return self.reject_candidate('content_too_short', f"Content too short ({len(content)} chars)")
         
         if len(title) < 15:
-            return False, f"Title too short ({len(title)} chars)"
+            return self.reject_candidate('title_too_short', f"Title too short ({len(title)} chars)")
         
+        metrics.inc('candidates_accepted', source=source)
+        self.run_stats.record_candidate()
         return True, "Content accepted"
     
+    def reject_candidate(self, code, message):
+        """Count a rejection by reason code; returns the (False, message) result"""
+        metrics.inc('candidates_rejected', source=source_label(self), reason=code)
+        self.run_stats.record_candidate(code)
+        return False, message
+    
+    @timed('extract')
     def extract_synopsis_articles(self, soup, url):
         """Main extraction router"""
         articles = []
         
-        self.logger.info(f"🔍 Processing: {url}")
-        
-        if 'testbook' in url.lower():
-            self.logger.info("📚 Using TESTBOOK SCHEME extraction")
-            articles = self.extract_testbook_schemes(soup, url)
+        with log_context(url=url, stage='extract'):
+            self.logger.debug("🔍 Processing: %s", url)
             
-        elif 'timesofindia' in url.lower():
-            self.logger.info("📰 Using TOI extraction methods")
-            articles = self.extract_toi_articles(soup, url)
+            if 'testbook' in url.lower():
+                self.logger.debug("📚 Using TESTBOOK SCHEME extraction")
+                articles = self.extract_testbook_schemes(soup, url)
+                
+            elif 'timesofindia' in url.lower():
+                self.logger.debug("📰 Using TOI extraction methods")
+                articles = self.extract_toi_articles(soup, url)
+                
+            else:
+                self.logger.debug("📈 Using Economic Times extraction")
+                articles = self.extract_et_complete_articles(soup, url)
+                self.run_stats.record_extractor('extract_et_complete_articles', len(articles))
             
-        else:
-            self.logger.info("📈 Using Economic Times extraction")
-            articles = self.extract_et_complete_articles(soup, url)
-        
-        self.logger.info(f"🎯 TOTAL ARTICLES FOUND: {len(articles)}")
+            self.logger.info("🎯 TOTAL ARTICLES FOUND: %d", len(articles))
         return articles
     
     def extract_testbook_schemes(self, soup, url):
         """Extract agriculture schemes from Testbook"""
         schemes = []
         
-        self.logger.info("📚 Starting Testbook agriculture schemes extraction...")
+        self.logger.debug("📚 Starting Testbook agriculture schemes extraction...")
         
         try:
             # Method 1: Extract scheme sections based on the content structure
-            schemes = self.extract_testbook_scheme_sections(soup)
-            
             # Method 2: If scheme sections not found, try heading-based extraction
-            if not schemes:
-                schemes = self.extract_testbook_by_headings(soup)
-            
             # Method 3: Fallback to paragraph-based extraction
-            if not schemes:
-                schemes = self.extract_testbook_by_paragraphs(soup)
+            for method in (self.extract_testbook_scheme_sections,
+                           self.extract_testbook_by_headings,
+                           self.extract_testbook_by_paragraphs):
+                schemes = method(soup)
+                if schemes:
+                    self.run_stats.record_extractor(method.__name__, len(schemes))
+                    break
             
         except Exception as e:
-            self.logger.error(f"❌ Error in Testbook extraction: {str(e)}")
+            self.logger.error("❌ Error in Testbook extraction: %s", e)
         
-        self.logger.info(f"📚 TESTBOOK RESULT: {len(schemes)} schemes extracted")
+        self.logger.info("📚 TESTBOOK RESULT: %d schemes extracted", len(schemes))
         return schemes
     
     def extract_testbook_scheme_sections(self, soup):
@@ -212,7 +622,7 @@ class BaseScraper(ABC):
                             'title': heading_text,
                             'content': content
                         })
-                        self.logger.info(f"✅ Scheme: {heading_text}")
+                        self.logger.debug("✅ Scheme: %s", heading_text)
         
         return schemes
     
@@ -368,9 +778,10 @@ class BaseScraper(ABC):
                     existing_titles = {article['title'].lower() for article in articles}
                     new_articles = [a for a in method_articles if a['title'].lower() not in existing_titles]
                     articles.extend(new_articles)
-                    self.logger.info(f"✅ TOI Method {i} found {len(new_articles)} new articles")
+                    self.run_stats.record_extractor(method.__name__, len(new_articles))
+                    self.logger.debug("✅ TOI Method %d found %d new articles", i, len(new_articles))
             except Exception as e:
-                self.logger.debug(f"TOI Method {i} failed: {str(e)}")
+                self.logger.debug("TOI Method %d failed: %s", i, e)
                 continue
         
         return articles
@@ -493,6 +904,13 @@ class BaseScraper(ABC):
         
         return articles
     
+    def new_article(self, url, title, content, **fields):
+        """Article record for this source; keywords are extracted when first read"""
+        if self._keyword_extractor is None:
+            self._keyword_extractor = self.extract_keywords
+        return Article(url, self.source_config, title, content, keywords=self._keyword_extractor, **fields)
+    
+    @timed('keywords')
     def extract_keywords(self, text):
         """Extract keywords"""
         refined_text = self.light_refine_content(text)
@@ -505,17 +923,35 @@ class BaseScraper(ABC):
         
         return list(dict.fromkeys(keywords))[:8]
     
+    @timed('sleep')
     def rate_limit(self):
-        """Rate limiting"""
-        time.sleep(2)
+        """Fixed pause between pages; with robots.txt on, get_page spaces requests per host instead"""
+        if self.replay or self.robots or self.last_fetch_blocked or self.budget_exhausted():
+            return
+        with paused():
+            time.sleep(config.DEFAULT_DELAY)
     
     @abstractmethod
     def scrape_articles(self):
         pass
     
+    @abstractmethod
+    def listing_work(self, url, html):
+        """(articles, detail links) from one fetched listing page, for distributed workers"""
+    
+    @abstractmethod
+    def detail_work(self, url, html):
+        """Article dict (or None) from one fetched detail page, for distributed workers"""
+    
     def run(self):
         """Run scraper"""
-        self.logger.info(f"Starting scraper for {self.source_config['name']}")
-        articles = self.scrape_articles()
-        self.logger.info(f"Found {len(articles)} articles/schemes")
+        source = source_label(self)
+        with log_context(source=source):
+            self.logger.info("Starting scraper for %s", self.source_config['name'])
+            self.release_unpublished()
+            with metrics.timer('run', source=source):
+                articles = self.scrape_articles()
+            self.pending_articles = articles
+            metrics.inc('articles', len(articles), source=source)
+            self.logger.info("Found %d articles/schemes", len(articles))
         return articles
@@ -6,39 +6,42 @@ from scrapers.base_scraper import BaseScraper
 class ManoramaScraper(BaseScraper):
     """Scraper for Malayala Manorama agriculture news"""
     
+    def listing_work(self, url, html):
+        """No articles on the listing itself, only detail links (for queue workers)"""
+        with self.parsed(html) as soup:
+            return [], self.find_article_links(soup, self.source_config['base_url'])
+    
+    def detail_work(self, url, html):
+        """Article data from a fetched detail page, or None without meaningful content"""
+        with self.parsed(html) as article_soup:
+            article_data = self.extract_article_data(article_soup, url)
+        if len(article_data['title']) > 10 and len(article_data['content']) > 100:
+            return article_data
+        return None
+    
     def scrape_articles(self):
         """Scrape articles from Manorama agriculture section"""
         articles = []
         
-        for news_url in self.source_config['news_urls']:
+        # Article links: from the source's feeds, else new links on its listing pages
+        article_links = self.discover_links(
+            lambda soup: self.find_article_links(soup, self.source_config['base_url'])
+        )
+        
+        self.logger.info("Found %d article links", len(article_links))
+        
+        # Scrape each article not fetched on an earlier run
+        for link in self.detail_urls(article_links):
             try:
-                # Get the main page
-                html_content = self.get_page(news_url)
-                if not html_content:
-                    continue
-                
-                soup = self.parse_html(html_content)
-                
-                # Find article links
-                article_links = self.find_article_links(soup, self.source_config['base_url'])
-                
-                self.logger.info(f"Found {len(article_links)} article links")
-                
-                # Scrape each article
-                for link in article_links[:10]:  # Limit to 10 articles per run
-                    article_html = self.get_page(link)
-                    if article_html:
-                        article_soup = self.parse_html(article_html)
-                        article_data = self.extract_article_data(article_soup, link)
-                        
-                        # Only add if we got meaningful content
-                        if len(article_data['title']) > 10 and len(article_data['content']) > 100:
-                            articles.append(article_data)
-                    
-                    # Rate limiting
-                    self.rate_limit()
-                
+                article_html = self.get_page(link)
+                self.mark_detail(link, ok=bool(article_html), error=None if article_html else 'fetch failed')
+                article_data = self.detail_work(link, article_html) if article_html else None
+                if article_data:
+                    articles.append(article_data)
             except Exception as e:
-                self.logger.error(f"Error scraping {news_url}: {str(e)}")
+                self.logger.error("Error scraping %s: %s", link, e)
+            
+            # Rate limiting
+            self.rate_limit()
         
         return articles
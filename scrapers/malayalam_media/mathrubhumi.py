@@ -2,7 +2,7 @@
 Mathrubhumi Agriculture news scraper - CORRECTED VERSION
 """
 from scrapers.base_scraper import BaseScraper
-from datetime import datetime
+from utils.dates import to_utc_iso
 
 class MathrubhumiScraper(BaseScraper):
     """Scraper for Mathrubhumi agriculture news - extracts individual articles"""
@@ -10,6 +10,7 @@ class MathrubhumiScraper(BaseScraper):
     def find_article_links(self, soup, base_url):
         """Find individual article URLs from listing page - UPDATED SELECTORS"""
         article_links = []
+        seen = set()
         
         # Updated selectors based on actual website structure
         selectors = [
@@ -40,7 +41,8 @@ class MathrubhumiScraper(BaseScraper):
                 if href and ('/news/' in href or '/agriculture/' in href):
                     if href.startswith('/'):
                         full_url = base_url.rstrip('/') + href
-                        if full_url not in article_links:
+                        if full_url not in seen:
+                            seen.add(full_url)
                             article_links.append(full_url)
         
         # If no specific selectors work, try general approach
@@ -65,7 +67,8 @@ class MathrubhumiScraper(BaseScraper):
                     else:
                         continue
                     
-                    if full_url not in article_links and len(article_links) < 15:
+                    if full_url not in seen and len(article_links) < 15:
+                        seen.add(full_url)
                         article_links.append(full_url)
         
         return article_links
@@ -148,77 +151,71 @@ class MathrubhumiScraper(BaseScraper):
         
         return "No Title"
     
+    def article_from_page(self, article_url, article_html):
+        """Article from a fetched detail page, or None when it has too little content"""
+        # Extract title and content (feed entries already carry the title and date)
+        feed_entry = self.discovered.get(article_url, {})
+        with self.parsed(article_html) as article_soup:
+            title = feed_entry.get('title') or self.extract_article_title(article_soup)
+            published = feed_entry.get('published') or to_utc_iso(self.extract_published(article_soup))
+            content = self.extract_article_content(article_soup)
+        
+        self.logger.debug("Extracted - Title: %.50s... | Content length: %d", title, len(content))
+        
+        if len(title) <= 5 or len(content) <= 50:
+            self.logger.warning("⚠️ Insufficient content - Title len: %d, Content len: %d", len(title), len(content))
+            return None
+        return self.new_article(article_url, title, content, date=published, author='', images=[])
+    
+    def listing_work(self, url, html):
+        """No articles on the listing itself, only detail links (for queue workers)"""
+        with self.parsed(html) as soup:
+            return [], self.find_article_links(soup, self.source_config['base_url'])
+    
+    def detail_work(self, url, html):
+        return self.article_from_page(url, html)
+    
     def scrape_articles(self):
         """Scrape individual articles from Mathrubhumi agriculture section"""
         articles = []
         
-        for news_url in self.source_config['news_urls']:
+        # New individual article links: from the source's feeds, else its listing pages
+        article_links = self.discover_links(
+            lambda soup: self.find_article_links(soup, self.source_config['base_url'])
+        )
+        
+        self.logger.info("Found %d individual article links", len(article_links))
+        
+        # Print found links for debugging
+        for i, link in enumerate(article_links[:5], 1):
+            self.logger.debug("  %d. %s", i, link)
+        
+        # Scrape each individual article not fetched on an earlier run
+        detail_urls = self.detail_urls(article_links)
+        for i, article_url in enumerate(detail_urls):
             try:
-                self.logger.info(f"Processing listing page: {news_url}")
+                self.logger.debug("Scraping article %d/%d: %s", i + 1, len(detail_urls), article_url)
                 
-                # Get the listing page
-                html_content = self.get_page(news_url)
-                if not html_content:
+                # Get individual article page
+                article_html = self.get_page(article_url)
+                if not article_html:
+                    self.mark_detail(article_url, ok=False, error='fetch failed')
                     continue
                 
-                soup = self.parse_html(html_content)
-                
-                # Find individual article links
-                article_links = self.find_article_links(soup, self.source_config['base_url'])
+                article_data = self.article_from_page(article_url, article_html)
+                del article_html
+                if article_data:
+                    articles.append(article_data)
+                    self.logger.debug("✅ Successfully added article: %.50s...", article_data['title'])
+                self.mark_detail(article_url)
                 
-                self.logger.info(f"Found {len(article_links)} individual article links")
-                
-                # Print found links for debugging
-                for i, link in enumerate(article_links[:5], 1):
-                    self.logger.info(f"  {i}. {link}")
-                
-                # Scrape each individual article
-                for i, article_url in enumerate(article_links[:10]):  # Limit to 10 articles
-                    try:
-                        self.logger.info(f"Scraping article {i+1}/{min(10, len(article_links))}: {article_url}")
-                        
-                        # Get individual article page
-                        article_html = self.get_page(article_url)
-                        if not article_html:
-                            continue
-                        
-                        article_soup = self.parse_html(article_html)
-                        
-                        # Extract title and content
-                        title = self.extract_article_title(article_soup)
-                        content = self.extract_article_content(article_soup)
-                        
-                        self.logger.info(f"Extracted - Title: {title[:50]}... | Content length: {len(content)}")
-                        
-                        if len(title) > 5 and len(content) > 50:
-                            article_data = {
-                                'url': article_url,
-                                'source': self.source_config['name'],
-                                'category': self.source_config['category'],
-                                'language': self.source_config['language'],
-                                'scraped_at': datetime.now().isoformat(),
-                                'title': title,
-                                'content': content,
-                                'date': '',
-                                'author': '',
-                                'images': [],
-                                'keywords': self.extract_keywords(title + " " + content)
-                            }
-                            
-                            articles.append(article_data)
-                            self.logger.info(f"✅ Successfully added article: {title[:50]}...")
-                        else:
-                            self.logger.warning(f"⚠️ Insufficient content - Title len: {len(title)}, Content len: {len(content)}")
-                        
-                        # Rate limiting
-                        self.rate_limit()
-                        
-                    except Exception as e:
-                        self.logger.error(f"❌ Error processing {article_url}: {str(e)}")
-                        continue
+                # Rate limiting
+                self.rate_limit()
                 
             except Exception as e:
-                self.logger.error(f"❌ Error processing listing page {news_url}: {str(e)}")
+                self.logger.error("❌ Error processing %s: %s", article_url, e)
+                self.mark_detail(article_url, ok=False, error=str(e))
+                continue
         
-        self.logger.info(f"📊 Total articles extracted: {len(articles)}")
+        self.logger.info("📊 Total articles extracted: %d", len(articles))
         return articles
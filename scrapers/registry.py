@@ -0,0 +1,148 @@
+"""
+Scraper registry - which scraper class runs a source, imported only when it runs
+
+A source picks its class with an explicit "scraper": "module:Class" entry, or
+through its "scrape_method" (see SCRAPE_METHODS). Classes are given as dotted
+paths so listing or validating sources never imports scraper modules or their
+parser dependencies. validate_sources(load=True) does import them, to check
+that each class is concrete and defines every self.method() it calls.
+"""
+import dis
+import importlib
+import importlib.util
+import inspect
+
+from config.sources import ALL_SOURCES, EXTRA_SOURCES
+
+SCRAPE_METHODS = {
+    'requests_bs4': 'multi_source_scraper:SimpleConsolidatedScraper',
+    'testbook_extractor': 'multi_source_scraper:SimpleConsolidatedScraper',
+    'synopsis_extraction': 'multi_source_scraper:SimpleConsolidatedScraper',
+    'detail_pages': 'scrapers.malayalam_media.mathrubhumi:MathrubhumiScraper',
+    'mathrubhumi_full_articles': 'fixed_mathrubhumi:FixedMathrubhumiScraper',
+}
+
+_classes = {}  # dotted path -> imported class
+
+
+class ScraperResolutionError(Exception):
+    """A source has no scraper class, or its class cannot be imported"""
+
+
+def all_sources():
+    """Every runnable source: the consolidated run's ALL_SOURCES plus EXTRA_SOURCES"""
+    return dict(ALL_SOURCES, **EXTRA_SOURCES)
+
+
+def get_source(source_name):
+    sources = all_sources()
+    if source_name not in sources:
+        raise ScraperResolutionError(
+            f"Source '{source_name}' not found in configuration. Available sources: {', '.join(sources)}"
+        )
+    return sources[source_name]
+
+
+def scraper_path(source_name, source_config):
+    """'module:Class' for a source (no import)"""
+    path = source_config.get('scraper') or SCRAPE_METHODS.get(source_config.get('scrape_method'))
+    if not path:
+        raise ScraperResolutionError(
+            f"Source '{source_name}' has scrape_method '{source_config.get('scrape_method')}' "
+            f"with no scraper; known methods: {', '.join(SCRAPE_METHODS)}"
+        )
+    return path
+
+
+def scraper_class(source_name, source_config):
+    """Import (once) and return the scraper class for a source"""
+    path = scraper_path(source_name, source_config)
+    if path not in _classes:
+        module_name, _, class_name = path.partition(':')
+        try:
+            _classes[path] = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise ScraperResolutionError(f"Cannot load scraper {path} for '{source_name}': {e}") from e
+    return _classes[path]
+
+
+def create_scraper(source_name, source_config=None):
+    """Scraper instance for a source key"""
+    source_config = source_config or get_source(source_name)
+    return scraper_class(source_name, source_config)(source_config)
+
+
+def _code_objects(code):
+    yield code
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            yield from _code_objects(const)
+
+
+def missing_methods(cls):
+    """Attributes a scraper class reads off self that neither the class nor its methods define"""
+    loads, stores = set(), set()
+    for klass in cls.__mro__:
+        for value in vars(klass).values():
+            func = value.fget if isinstance(value, property) else getattr(value, '__func__', value)
+            code = getattr(inspect.unwrap(func) if callable(func) else func, '__code__', None)
+            if code is None:
+                continue
+            for inner in _code_objects(code):
+                previous = None
+                for instruction in dis.get_instructions(inner):
+                    if previous and previous.opname.startswith('LOAD_') and previous.argval == 'self':
+                        if instruction.opname in ('LOAD_ATTR', 'LOAD_METHOD'):
+                            loads.add(instruction.argval)
+                        elif instruction.opname == 'STORE_ATTR':
+                            stores.add(instruction.argval)
+                    previous = instruction
+    return sorted(name for name in loads - stores if not hasattr(cls, name))
+
+
+def class_problems(label, path):
+    """Why the class at path cannot run (imports it): abstract methods left, or methods it calls missing"""
+    try:
+        cls = scraper_class(label, {'scraper': path})
+    except ScraperResolutionError as e:
+        return [str(e)]
+    problems = []
+    if inspect.isabstract(cls):
+        problems.append(f"{label}: {path} leaves abstract methods {', '.join(sorted(cls.__abstractmethods__))}")
+    missing = missing_methods(cls)
+    if missing:
+        problems.append(f"{label}: {path} calls undefined {', '.join(missing)}")
+    return problems
+
+
+def validate_sources(sources=None, load=False):
+    """Problems with configured sources; checked without importing any scraper module unless load
+
+    With load, every class a source or scrape_method resolves to is imported and checked as well.
+    """
+    problems = []
+    paths = {}  # class path -> first source or method naming it
+    for source_name, source_config in (sources or all_sources()).items():
+        try:
+            path = scraper_path(source_name, source_config)
+        except ScraperResolutionError as e:
+            problems.append(str(e))
+            continue
+        module_name, sep, class_name = path.partition(':')
+        if not sep or not class_name:
+            problems.append(f"Source '{source_name}': scraper '{path}' is not 'module:Class'")
+            continue
+        try:
+            found = importlib.util.find_spec(module_name) is not None
+        except ImportError:
+            found = False
+        if not found:
+            problems.append(f"Source '{source_name}': module '{module_name}' not found")
+            continue
+        paths.setdefault(path, f"Source '{source_name}'")
+    if load:
+        for method, path in SCRAPE_METHODS.items():
+            paths.setdefault(path, f"scrape_method '{method}'")
+        for path, label in paths.items():
+            problems.extend(class_problems(label, path))
+    return problems
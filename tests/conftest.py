@@ -0,0 +1,30 @@
+"""
+Shared test setup - tests never fetch robots.txt from the network
+
+Wall-clock benchmark gates are marked `benchmark` and skipped unless selected
+with `pytest -m benchmark` or RUN_BENCHMARKS=1 (they are too noisy for every run).
+"""
+import os
+
+import pytest
+
+from config.settings import config
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: wall-clock performance gate, skipped unless selected')
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get('RUN_BENCHMARKS') or 'benchmark' in (config.getoption('markexpr') or ''):
+        return
+    skip = pytest.mark.skip(reason="benchmark gate: run with -m benchmark or RUN_BENCHMARKS=1")
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def no_robots(monkeypatch):
+    """Scrapers built in tests skip robots.txt checks and per-host spacing unless a test enables them"""
+    monkeypatch.setattr(config, 'ROBOTS_ENABLED', False)
@@ -0,0 +1,71 @@
+"""
+Article records - dict compatibility, lazy keywords, pickling, and the corpus-scale benchmark
+"""
+import json
+import pickle
+
+import pytest
+
+from utils.article import Article
+
+SOURCE = {'name': 'Economic Times Agriculture', 'category': 'business_agriculture', 'language': 'english'}
+
+
+def test_reads_like_the_old_dict():
+    article = Article('https://example.com/a', SOURCE, 'Paddy prices rise', 'Farmers in Kuttanad', keywords=['paddy'])
+    assert article['title'] == article.title == 'Paddy prices rise'
+    assert article.get('date', '') == '' and 'date' not in article
+    assert set(article) == {'url', 'source', 'category', 'language', 'scraped_at', 'title', 'content', 'keywords'}
+    assert dict(article)['source'] == SOURCE['name']
+    assert json.loads(json.dumps(dict(article)))['keywords'] == ['paddy']
+
+    article['date'] = '2025-02-03T05:00:00+00:00'
+    assert 'date' in article and article['date'] == article.date
+    with pytest.raises(KeyError):
+        article['unknown'] = 1
+
+
+def test_categorical_fields_are_shared_and_keywords_lazy():
+    calls = []
+
+    def keywords(text):
+        calls.append(text)
+        return text.lower().split()[:2]
+
+    source = {key: ''.join(value) for key, value in SOURCE.items()}  # equal, but distinct string objects
+    first = Article('https://example.com/1', SOURCE, 'Rubber', 'tappers', keywords=keywords)
+    second = Article('https://example.com/2', source, 'Coconut', 'copra', keywords=keywords)
+    assert first.source is second.source and first.language is second.language
+    assert not calls
+    assert second.keywords == ['coconut', 'copra'] and second['keywords'] == ['coconut', 'copra']
+    assert calls == ['Coconut copra']
+
+
+def test_pickle_and_dict_round_trips_resolve_keywords():
+    article = Article('https://example.com/a', SOURCE, 'Rubber prices', 'Tappers', keywords=lambda text: ['rubber'],
+                      date='', author='', images=[])
+    copy = pickle.loads(pickle.dumps(article))  # lambdas do not pickle: keywords were resolved first
+    assert copy == article and copy.keywords == ['rubber']
+    assert Article.from_dict(json.loads(json.dumps(dict(article)))) == article
+
+
+def test_keyword_time_is_recorded_when_keywords_are_read(monkeypatch):
+    import utils.metrics
+    from config.sources import ALL_SOURCES
+    from multi_source_scraper import SimpleConsolidatedScraper
+    from utils.metrics import MetricsRegistry
+
+    registry = MetricsRegistry()
+    monkeypatch.setattr(utils.metrics, 'metrics', registry)  # where @timed records
+    scraper = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    article = scraper.new_article('https://example.com/a', 'Paddy procurement', 'Kuttanad farmers wait')
+    assert 'keywords' not in registry.snapshot()['stages'].get(SOURCE['name'], {})
+    assert article.keywords == ['paddy', 'procurement', 'kuttanad', 'farmers']
+    assert registry.snapshot()['stages'][SOURCE['name']]['keywords']['count'] == 1
+
+
+def test_records_are_smaller_than_dicts():
+    from benchmarks.article_bench import run_benchmark
+
+    report = run_benchmark(count=500)
+    assert report['article']['bytes_per_article'] < report['dict']['bytes_per_article']
@@ -0,0 +1,86 @@
+"""
+Run budget - priority order, fair per-source shares, deferral and deadline cut-off
+"""
+import json
+import os
+import time
+
+from config.settings import config
+from config.sources import ALL_SOURCES
+from multi_source_scraper import SimpleConsolidatedScraper
+from utils.budget import RunPlanner
+
+SOURCES = {
+    'slow_news': {'name': 'Slow News', 'priority': 1, 'expected_seconds': 100},
+    'schemes': {'name': 'Schemes', 'priority': 5, 'expected_seconds': 10},
+    'fast_news': {'name': 'Fast News', 'priority': 1, 'expected_seconds': 20},
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_priority_order_and_shares():
+    clock = FakeClock()
+    planner = RunPlanner(SOURCES, budget=200, min_seconds=5, clock=clock)
+    assert planner.order == ['schemes', 'fast_news', 'slow_news']
+
+    assert planner.start('schemes') == 80  # 200 minus what the other two expect
+    clock.now = 10
+    planner.finish('schemes')
+    assert planner.start('fast_news') == 10 + 95  # half of what is left beats 190 - 100
+    clock.now = 105  # fast_news stalled until its deadline
+    planner.finish('fast_news')
+    assert planner.start('slow_news') == 200  # the rest of the window
+    assert planner.spent == {'schemes': 10, 'fast_news': 95}
+
+
+def test_stalled_source_leaves_an_equal_share():
+    clock = FakeClock()
+    planner = RunPlanner(SOURCES, budget=60, min_seconds=5, clock=clock)
+    assert planner.start('schemes') == 20  # expected costs exceed the budget: a third each
+    clock.now = 20
+    assert planner.start('fast_news') == 20 + 20
+    clock.now = 58
+    assert planner.start('slow_news') is None and planner.is_deferred('slow_news')
+    assert planner.summary()['deferred'] == ['slow_news']
+
+
+def test_no_budget_keeps_order_without_deadlines():
+    planner = RunPlanner(SOURCES)
+    assert planner.order[0] == 'schemes'
+    assert planner.start('schemes') is None and not planner.is_deferred('schemes')
+    assert planner.remaining() is None
+
+
+def test_scraper_past_its_deadline_makes_no_requests(monkeypatch):
+    monkeypatch.setattr(config, 'BREAKER_STATE_FILE', None)
+    scraper = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    scraper.deadline = time.monotonic() - 1
+    url = 'http://127.0.0.1:9/listing'  # never contacted
+
+    assert scraper.get_page(url) is None
+    assert url in scraper.blocked_urls  # released back to the frontier, not failed
+    assert scraper.run_stats.fetches[-1]['error'] == 'run budget spent'
+
+
+def test_spent_budget_defers_every_source(tmp_path, monkeypatch):
+    import multi_source_scraper
+
+    reports_dir = tmp_path / 'reports'
+    monkeypatch.chdir(tmp_path)  # main() creates its output folder in the working directory
+    monkeypatch.setattr(config, 'REPORTS_DIR', str(reports_dir))
+    monkeypatch.setattr(config, 'METRICS_FILE', None)
+    monkeypatch.setattr(config, 'LOG_TO_FILE', False)
+    assert multi_source_scraper.main(budget=0) is None
+
+    with open(os.path.join(reports_dir, os.listdir(reports_dir)[0]), encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['totals']['sources_deferred'] == len(ALL_SOURCES)
+    assert report['budget']['deferred'] == report['budget']['order']
+    assert report['budget']['order'][0] == 'economic_times_agriculture'
@@ -0,0 +1,112 @@
+"""
+Circuit breaker - open after consecutive failures, half-open probe, persisted state
+"""
+import socket
+import time
+
+from config.settings import config
+from multi_source_scraper import SimpleConsolidatedScraper
+from config.sources import ALL_SOURCES
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+HOST = 'www.example.com'
+
+
+def test_opens_probes_and_closes(tmp_path):
+    breaker = CircuitBreaker(str(tmp_path / 'breakers.json'), failure_threshold=3, cooldown=60)
+    for _ in range(2):
+        assert not breaker.record_failure(HOST, now=0)
+    breaker.record_success(HOST)
+    for _ in range(2):
+        breaker.record_failure(HOST, now=0)
+    assert breaker.allow(HOST, now=0)  # success reset the count
+    assert breaker.record_failure(HOST, now=100)
+    assert breaker.state(HOST, now=100) == OPEN and not breaker.allow(HOST, now=150)
+
+    assert breaker.state(HOST, now=160) == HALF_OPEN
+    assert breaker.allow(HOST, now=160)      # the probe
+    assert not breaker.allow(HOST, now=161)  # one probe at a time
+    assert breaker.record_failure(HOST, now=162)
+    assert not breaker.allow(HOST, now=200)  # failed probe: another full cooldown
+
+    assert breaker.allow(HOST, now=230)
+    breaker.record_success(HOST)
+    assert breaker.state(HOST) == CLOSED and breaker.allow('other.example.com')
+
+
+def test_open_circuit_survives_restart(tmp_path):
+    path = str(tmp_path / 'breakers.json')
+    breaker = CircuitBreaker(path, failure_threshold=1, cooldown=600)
+    breaker.record_failure(HOST)
+
+    restarted = CircuitBreaker(path, failure_threshold=1, cooldown=600)
+    assert not restarted.allow(HOST)
+    assert HOST in restarted.open_hosts()
+
+
+def unused_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def test_dead_host_fails_fast(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'BREAKER_STATE_FILE', str(tmp_path / 'breakers.json'))
+    monkeypatch.setattr(config, 'BREAKER_FAILURE_THRESHOLD', 1)
+    dead = f"http://127.0.0.1:{unused_port()}"
+
+    scraper = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    assert scraper.get_page(f"{dead}/listing") is None  # refused once: circuit opens, no retry sleep
+
+    start = time.perf_counter()
+    next_run = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    for i in range(20):
+        assert next_run.get_page(f"{dead}/article/{i}") is None
+        next_run.rate_limit()
+    assert time.perf_counter() - start < 1.0
+    assert len(next_run.blocked_urls) == 20
+
+
+def test_retry_back_off_is_sleep_not_fetch_latency(tmp_path, monkeypatch):
+    import scrapers.base_scraper as base_scraper
+    from utils.metrics import MetricsRegistry
+
+    class Response:
+        status_code = 200
+        content = b'<html></html>'
+        text = '<html></html>'
+
+        def raise_for_status(self):
+            pass
+
+    responses = [ConnectionError('reset by peer'), Response()]
+
+    def flaky_get(url, timeout=None):
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    real_sleep = time.sleep
+    monkeypatch.setattr(config, 'BREAKER_STATE_FILE', str(tmp_path / 'breakers.json'))
+    monkeypatch.setattr(base_scraper, 'metrics', MetricsRegistry())
+    monkeypatch.setattr(base_scraper.time, 'sleep', lambda seconds: real_sleep(0.2))
+    scraper = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    monkeypatch.setattr(scraper.session, 'get', flaky_get)
+
+    assert scraper.get_page(f"https://{HOST}/listing") == '<html></html>'
+    stages = base_scraper.metrics.snapshot()['stages']['Economic Times Agriculture']
+    assert stages['sleep']['count'] == 1 and stages['sleep']['seconds'] >= 0.2
+    assert scraper.run_stats.fetches[0]['attempts'] == 2 and scraper.run_stats.fetches[0]['seconds'] < 0.2
+
+
+def test_robots_disallowed_url_does_not_take_the_probe(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'BREAKER_STATE_FILE', str(tmp_path / 'breakers.json'))
+    scraper = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    for _ in range(config.BREAKER_FAILURE_THRESHOLD):
+        scraper.breaker.record_failure(HOST, now=0)  # opened long ago: half-open now
+    assert scraper.breaker.state(HOST) == HALF_OPEN
+    monkeypatch.setattr(scraper, 'robots_allowed', lambda url: False)
+
+    assert scraper.get_page(f"https://{HOST}/private") is None
+    assert scraper.breaker.allow(HOST)  # the probe is still available
@@ -0,0 +1,81 @@
+"""
+Publication dates - English/Malayalam parsing and the per-source watermark
+"""
+from datetime import datetime, timezone
+
+from benchmarks.extractor_bench import MATHRUBHUMI_CONFIG, load_page
+from config.settings import config
+from scrapers.malayalam_media.mathrubhumi import MathrubhumiScraper
+from utils.dates import parse_date, to_utc_iso
+from utils.frontier import CrawlFrontier
+
+NOW = datetime(2025, 2, 3, 12, 0, tzinfo=timezone.utc)
+
+EXAMPLES = {
+    'Updated: Feb 3, 2025, 10:30 AM IST': '2025-02-03T05:00:00+00:00',
+    'Last Updated: 12:30 PM Feb 3, 2025': '2025-02-03T07:00:00+00:00',
+    'February 3rd, 2025 at 9:05 pm': '2025-02-03T15:35:00+00:00',
+    'Mon, 03 Feb 2025 10:30:00 +0530': '2025-02-03T05:00:00+00:00',
+    '2025-02-03T10:30:00Z': '2025-02-03T10:30:00+00:00',
+    '03/02/2025': '2025-02-02T18:30:00+00:00',
+    '2025 ഫെബ്രുവരി 3, രാവിലെ 10.30': '2025-02-03T05:00:00+00:00',
+    'ഫെബ്രുവരി 3, 2025 വൈകിട്ട് 4.15': '2025-02-03T10:45:00+00:00',
+    '3 ഫെബ്രുവരി ൨൦൨൫': '2025-02-02T18:30:00+00:00',
+    'മാര്‍ച്ച് 5, 2025': '2025-03-04T18:30:00+00:00',  # old-style chillu
+    '3 മണിക്കൂർ മുമ്പ്': '2025-02-03T09:00:00+00:00',
+    '2 hours ago': '2025-02-03T10:00:00+00:00',
+    'no date here': '',
+}
+
+
+def test_english_and_malayalam_dates_to_utc():
+    assert {text: to_utc_iso(parse_date(text, now=NOW)) for text in EXAMPLES} == EXAMPLES
+
+
+def dated_listing(stories):
+    items = ''.join(
+        f'<div class="card"><a href="/agriculture/news/{slug}">{slug}</a><time datetime="{date}">{date}</time></div>'
+        for slug, date in stories
+    )
+    return f"<html><body>{items}</body></html>"
+
+
+def test_listing_entries_older_than_watermark_are_not_fetched(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', str(tmp_path / 'frontier.sqlite'))
+    monkeypatch.setattr(config, 'WATERMARK_LOOKBACK', 3600)
+    listing = dated_listing([('new-1', '2025-02-03T10:00:00+05:30'), ('slack', '2025-02-03T08:30:00+05:30'),
+                             ('old-1', '2025-02-01T09:00:00+05:30'), ('undated', '')])
+
+    class ListingScraper(MathrubhumiScraper):
+        def get_page(self, url):
+            return listing
+
+    scraper = ListingScraper(MATHRUBHUMI_CONFIG)
+    links = lambda soup: ['https://www.mathrubhumi.com' + a['href'] for a in soup.select('a')]
+    assert len(scraper.listing_links(MATHRUBHUMI_CONFIG['news_urls'][0], links)) == 4
+
+    scraper.frontier.advance_watermark(MATHRUBHUMI_CONFIG['name'], '2025-02-03T03:45:00+00:00')  # 09:15 IST
+    kept = scraper.listing_links(MATHRUBHUMI_CONFIG['news_urls'][0], links)
+    assert [url.rsplit('/', 1)[-1] for url in kept] == ['new-1', 'slack', 'undated']
+
+
+def test_run_advances_the_watermark(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', str(tmp_path / 'frontier.sqlite'))
+
+    class FixtureScraper(MathrubhumiScraper):
+        def get_page(self, url):
+            return load_page(url)
+
+        def rate_limit(self):
+            pass
+
+    scraper = FixtureScraper(MATHRUBHUMI_CONFIG)
+    articles = scraper.run()
+    newest = max(article['date'] for article in articles)
+    assert newest.endswith('+00:00')
+
+    frontier = CrawlFrontier.shared(config.FRONTIER_DB)
+    assert frontier.watermark(MATHRUBHUMI_CONFIG['name']) is None  # not before the output is written
+    scraper.commit_published()
+    assert frontier.watermark(MATHRUBHUMI_CONFIG['name']) == newest
+    assert not frontier.advance_watermark(MATHRUBHUMI_CONFIG['name'], '2000-01-01T00:00:00+00:00')
@@ -0,0 +1,42 @@
+"""
+Differential harness - parity and diff detection on the fixture corpus
+"""
+from benchmarks.diff_harness import build_variant, compare_corpus, pair_articles, parse_spec
+from scrapers.base_scraper import BaseScraper
+
+
+def truncating_refine(scraper, text):
+    return BaseScraper.light_refine_content(scraper, text)[:60]
+
+
+def test_same_configuration_is_identical():
+    result = compare_corpus('', 'parser=html.parser', repeat=1)
+
+    summary = result['summary']
+    assert summary['pages'] >= 3 and summary['articles'] > 0
+    assert summary['identical'] == summary['articles']
+    assert summary['min_similarity'] == 1.0
+
+
+def test_changed_refine_is_reported_per_article():
+    result = compare_corpus('', 'refine=tests.test_diff_harness:truncating_refine', match='testbook', repeat=1)
+
+    page = result['pages'][0]
+    assert page['articles_a'] == page['articles_b'] > 0
+    assert 0 < page['similarity'] < 1
+    assert any(row['similarity'] < 1 for row in page['articles'])
+
+
+def test_variants_subclass_without_modifying_the_scraper():
+    from multi_source_scraper import SimpleConsolidatedScraper
+
+    variant = build_variant('parser=html.parser,refine=tests.test_diff_harness:truncating_refine')
+    assert issubclass(variant, SimpleConsolidatedScraper)
+    assert 'light_refine_content' not in vars(SimpleConsolidatedScraper)
+    assert parse_spec('') == {}
+
+
+def test_unmatched_articles_pair_with_none():
+    left = [{'title': 'a'}, {'title': 'b'}]
+    right = [{'title': 'b'}]
+    assert pair_articles(left, right) == [({'title': 'b'}, {'title': 'b'}), ({'title': 'a'}, None)]
@@ -0,0 +1,120 @@
+"""
+Feed discovery - RSS/Atom/sitemap parsing and the HTML listing fallback
+"""
+from config.settings import config
+from multi_source_scraper import SimpleConsolidatedScraper
+from utils.discovery import discover, parse_feed
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>
+  <title>Agriculture</title><link>https://example.com/agriculture</link>
+  <item>
+    <title>Monsoon sowing of kharif crops picks up across states</title>
+    <link>https://example.com/news/kharif-sowing</link>
+    <pubDate>Mon, 03 Feb 2025 10:30:00 +0530</pubDate>
+    <description><![CDATA[<p>Sowing of paddy and pulses rose 12% this week as rainfall improved in the south.</p>]]></description>
+  </item>
+  <item>
+    <title>Coconut prices firm up in Kerala markets</title>
+    <guid>https://example.com/news/coconut-prices</guid>
+    <pubDate>Tue, 04 Feb 2025 08:00:00 +0530</pubDate>
+    <description>Copra and coconut oil prices rose on lower arrivals &amp; steady demand from mills.</description>
+  </item>
+</channel></rss>"""
+
+ATOM = """<feed xmlns="http://www.w3.org/2005/Atom"><title>Farm news</title>
+  <entry><title type="html">Rubber board &lt;b&gt;revises&lt;/b&gt; subsidy</title>
+    <link rel="alternate" href="https://example.com/atom/rubber"/><updated>2025-02-01T06:00:00Z</updated>
+    <summary>New rates for smallholders.</summary></entry>
+</feed>"""
+
+SITEMAP_INDEX = """<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-news.xml</loc></sitemap>
+  <sitemap><loc>https://example.com/sitemap-old.xml</loc></sitemap>
+</sitemapindex>"""
+
+NEWS_SITEMAP = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://example.com/news/kharif-sowing</loc>
+    <news:news><news:publication_date>2025-02-03T05:00:00Z</news:publication_date>
+      <news:title>Monsoon sowing of kharif crops picks up across states</news:title></news:news></url>
+  <url><loc>https://example.com/news/dairy-cooperatives</loc><lastmod>2025-02-05</lastmod></url>
+</urlset>"""
+
+
+def test_rss_atom_and_sitemap_entries():
+    entries, sitemaps = parse_feed(RSS)
+    assert sitemaps == []
+    assert [e['url'] for e in entries] == ['https://example.com/news/kharif-sowing', 'https://example.com/news/coconut-prices']
+    assert entries[0]['published'] == '2025-02-03T05:00:00+00:00'
+    assert entries[0]['summary'].startswith('Sowing of paddy') and '<p>' not in entries[0]['summary']
+    assert entries[1]['summary'].endswith('& steady demand from mills.')
+
+    (atom,), _ = parse_feed(ATOM)
+    assert atom == {'url': 'https://example.com/atom/rubber', 'title': 'Rubber board revises subsidy',
+                    'published': '2025-02-01T06:00:00+00:00', 'summary': 'New rates for smallholders.'}
+
+    entries, sitemaps = parse_feed(SITEMAP_INDEX)
+    assert entries == [] and sitemaps == ['https://example.com/sitemap-news.xml', 'https://example.com/sitemap-old.xml']
+    entries, _ = parse_feed(NEWS_SITEMAP)
+    assert entries[0]['title'].startswith('Monsoon') and entries[1]['published'] == '2025-02-04T18:30:00+00:00'  # IST midnight
+
+
+def test_discover_merges_feeds_newest_first():
+    documents = {
+        'https://example.com/rss': RSS,
+        'https://example.com/sitemap.xml': SITEMAP_INDEX,
+        'https://example.com/sitemap-news.xml': NEWS_SITEMAP,
+    }
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return documents.get(url)
+
+    entries = discover(fetch, ['https://example.com/rss', 'https://example.com/sitemap.xml', 'https://example.com/broken'],
+                       max_sitemaps=1)
+    assert [e['url'].rsplit('/', 1)[-1] for e in entries] == ['dairy-cooperatives', 'coconut-prices', 'kharif-sowing']
+    assert 'https://example.com/sitemap-old.xml' not in fetched
+
+
+def source(feeds):
+    return {
+        'name': 'Feed Test', 'base_url': 'https://example.com', 'news_urls': ['https://example.com/agriculture'],
+        'category': 'news_agriculture', 'language': 'english', 'feeds': feeds,
+    }
+
+
+def feed_scraper(documents, fetched):
+    class FeedScraper(SimpleConsolidatedScraper):
+        def get_page(self, url):
+            fetched.append(url)
+            return documents.get(url)
+
+        def rate_limit(self):
+            pass
+
+    return FeedScraper
+
+
+def test_listing_sources_read_articles_from_feeds(monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', None)
+    fetched = []
+    scraper = feed_scraper({'https://example.com/rss': RSS}, fetched)(source(['https://example.com/rss']))
+
+    articles = scraper.run()
+    assert fetched == ['https://example.com/rss']  # listing page never downloaded
+    assert [a['url'] for a in articles] == ['https://example.com/news/coconut-prices', 'https://example.com/news/kharif-sowing']
+    assert articles[0]['date'] == '2025-02-04T02:30:00+00:00'
+
+
+def test_html_listing_is_the_fallback(monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', None)
+    fetched = []
+    listing = '<html><body><div class="eachStory"><h3>Farmers get new crop insurance rules this season</h3>' \
+              '<p>' + 'The revised scheme covers more crops and pays claims faster. ' * 3 + '</p></div></body></html>'
+    documents = {'https://example.com/agriculture': listing}
+    scraper = feed_scraper(documents, fetched)(source(['https://example.com/missing-feed']))
+
+    scraper.run()
+    assert fetched == ['https://example.com/missing-feed', 'https://example.com/agriculture']
@@ -0,0 +1,107 @@
+"""
+Distributed crawling - leases, visibility timeouts, and a multi-process run against replay fixtures
+"""
+from config.settings import config
+from config.sources import ALL_SOURCES, EXTRA_SOURCES
+from tests.test_extractors import FIXTURES_DIR
+from utils.article import Article
+from utils.work_queue import open_queue
+
+LISTING = 'https://www.mathrubhumi.com/agriculture'
+SOURCE = {'name': 'Source', 'category': 'news_agriculture', 'language': 'english'}
+
+
+def make_queue(tmp_path, max_attempts=3):
+    return open_queue(f"sqlite:{tmp_path / 'queue.sqlite'}", max_attempts=max_attempts)
+
+
+def test_lease_hides_item_until_it_expires(tmp_path):
+    queue = make_queue(tmp_path)
+    assert queue.put('r1', 'src', 'listing', [LISTING, LISTING]) == 1
+
+    first, = queue.lease('a', visibility=60)
+    assert queue.lease('b', visibility=60) == []
+    assert queue.extend(first, 60)
+
+    with queue._write() as db:  # the worker stalls past its lease
+        db.execute('UPDATE work_items SET lease_until = 0')
+    second, = queue.lease('b', visibility=60)
+    assert second['id'] == first['id'] and second['attempts'] == 2
+
+    late, on_time = (Article('https://x/', SOURCE, title, 'body') for title in ('late', 'on time'))
+    assert not queue.complete(first, [late])  # lease lost: nothing recorded
+    assert queue.complete(second, [on_time], links=['https://x/1', 'https://x/1'])
+    assert queue.results('r1') == {'src': [on_time]}
+    assert queue.stats('r1') == {'queued': 1, 'leased': 0, 'done': 1, 'failed': 0}
+
+
+def test_failures_retry_until_max_attempts(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    queue.put('r1', 'src', 'detail', ['https://x/1'])
+    item, = queue.lease('a')
+    assert queue.fail(item, 'fetch failed')
+    item, = queue.lease('a')
+    assert queue.fail(item, 'fetch failed')
+    assert queue.lease('a') == [] and queue.stats()['failed'] == 1
+
+    queue.put('r1', 'src', 'detail', ['https://x/2'])
+    item, = queue.lease('a')
+    assert queue.fail(item, 'unsupported', retry=False) and queue.pending() == 0
+
+
+def test_detail_urls_are_fetched_once_listings_every_run(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.put('r1', 'src', 'listing', [LISTING])
+    item, = queue.lease('a')
+    queue.complete(item, links=['https://x/1'])
+    detail, = queue.lease('a')
+    queue.complete(detail, [Article('https://x/1', SOURCE, 't', 'body')])
+
+    assert queue.put('r2', 'src', 'listing', [LISTING]) == 1
+    item, = queue.lease('a')
+    assert item['run'] == 'r2'
+    queue.complete(item, links=['https://x/1', 'https://x/2'])
+    detail, = queue.lease('a')
+    assert detail['url'] == 'https://x/2' and queue.lease('a') == []
+
+
+def test_local_worker_processes_consolidate_one_run(tmp_path, monkeypatch):
+    from distributed import coordinate
+
+    monkeypatch.chdir(tmp_path)  # output2/ is written relative to the working directory
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    monkeypatch.setattr(config, 'LOG_TO_FILE', False)
+    monkeypatch.setattr(config, 'WORK_POLL_INTERVAL', 0.05)
+    sources = dict(ALL_SOURCES, mathrubhumi_agriculture=EXTRA_SOURCES['mathrubhumi_agriculture'])
+    queue_url = f"sqlite:{tmp_path / 'queue.sqlite'}"
+
+    result = coordinate(workers=2, sources=sources, queue_url=queue_url, timeout=120)
+
+    by_source = {}
+    for article in result['total_articles']:
+        by_source.setdefault(article['source'], []).append(article)
+    assert set(by_source) == {cfg['name'] for cfg in sources.values()}
+    assert len(by_source['Mathrubhumi Agriculture']) == 3  # detail pages leased after their listing
+    assert (tmp_path / 'output2' / 'news.txt').exists() and (tmp_path / 'output2' / 'schemes.txt').exists()
+
+    queue = open_queue(queue_url)
+    assert queue.pending() == 0 and queue.stats()['failed'] == 0
+
+
+def test_broken_scraper_items_are_not_retried(tmp_path, monkeypatch):
+    from distributed import ScraperWorker
+
+    class BrokenScraper:
+        def get_page(self, url):
+            return '<html></html>'
+
+        def listing_work(self, url, html):
+            return self.find_article_links(html)  # never defined
+
+    queue = make_queue(tmp_path)
+    queue.put('r1', 'mathrubhumi_agriculture', 'listing', [LISTING])
+    worker = ScraperWorker(queue, worker_id='w1', sources=EXTRA_SOURCES)
+    monkeypatch.setattr(worker, 'scraper_for', lambda source_name: BrokenScraper())
+
+    assert worker.run(exit_when_idle=True) == 1
+    assert queue.stats() == {'queued': 0, 'leased': 0, 'done': 0, 'failed': 1}
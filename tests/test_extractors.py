@@ -0,0 +1,49 @@
+"""
+Regression tests - extractor output on the recorded fixture pages
+"""
+import json
+import logging
+import os
+
+import pytest
+
+from benchmarks.extractor_bench import EXTRACTORS, FIXTURES_DIR, LISTING_SOURCES, load_page, make_scraper
+from config.settings import config
+from config.sources import ALL_SOURCES
+
+EXPECTED_PATH = os.path.join(os.path.dirname(FIXTURES_DIR), 'expected.json')
+
+with open(EXPECTED_PATH, encoding='utf-8') as f:
+    EXPECTED = json.load(f)
+
+
+def titles_of(output):
+    return [item['title'] if isinstance(item, dict) else item[:80] for item in output]
+
+
+@pytest.mark.parametrize('name', sorted(EXTRACTORS))
+def test_extractor_output_matches_fixture(name):
+    kind, url, call = EXTRACTORS[name]
+    scraper = make_scraper(kind)
+    output = call(scraper, scraper.parse_html(load_page(url)), url)
+
+    assert len(output) == EXPECTED[name]['count']
+    assert titles_of(output) == EXPECTED[name]['titles']
+
+
+def test_every_extractor_has_expectations():
+    assert sorted(EXPECTED) == sorted(EXTRACTORS)
+
+
+@pytest.mark.parametrize('source_name', sorted(LISTING_SOURCES))
+def test_replay_pipeline_produces_articles(source_name, monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    articles = SimpleConsolidatedScraper(ALL_SOURCES[source_name]).run()
+
+    assert articles
+    for article in articles:
+        assert article['source'] == ALL_SOURCES[source_name]['name']
+        assert article['title'] and article['content']
+        assert isinstance(article['keywords'], list)
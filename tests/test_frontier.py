@@ -0,0 +1,134 @@
+"""
+Crawl frontier - Bloom filter, URL states, resume after interruption
+"""
+from datetime import datetime, timezone
+
+from benchmarks.extractor_bench import MATHRUBHUMI_CONFIG, load_page
+from config.settings import config
+from utils.frontier import BloomFilter, CrawlFrontier
+
+SOURCE = 'Mathrubhumi Agriculture'
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"https://example.com/a/{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"https://example.com/b/{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_fetched_urls_are_not_claimed_again(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / 'frontier.sqlite'))
+    assert frontier.add_many(SOURCE, ['u1', 'u2', 'u3']) == 3
+    assert frontier.claim(SOURCE, 2) == ['u1', 'u2']
+    frontier.mark_done(SOURCE, 'u1')
+    frontier.mark_done(SOURCE, 'u2')
+
+    assert frontier.add_many(SOURCE, ['u1', 'u4', 'u2']) == 1
+    assert frontier.claim(SOURCE, 10) == ['u4', 'u3']  # listing position beats age
+    assert frontier.seen(SOURCE, 'u1') and not frontier.seen(SOURCE, 'u3')
+    assert frontier.state(SOURCE, 'never-seen') is None
+    assert frontier.add_many('Other Source', ['u1']) == 1
+
+
+def test_interrupted_crawl_resumes(tmp_path):
+    path = str(tmp_path / 'frontier.sqlite')
+    frontier = CrawlFrontier(path)
+    frontier.add_many(SOURCE, ['u1', 'u2', 'u3'])
+    frontier.claim(SOURCE, 3)
+    frontier.mark_done(SOURCE, 'u1')
+    frontier.db.close()  # process killed mid-batch
+
+    restarted = CrawlFrontier(path)
+    assert restarted.resumed == 2
+    assert restarted.claim(SOURCE, 10) == ['u2', 'u3']
+    assert restarted.seen(SOURCE, 'u1')
+
+
+def test_failures_retry_until_max_attempts(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / 'frontier.sqlite'), max_attempts=2)
+    frontier.add(SOURCE, 'flaky')
+    for expected in ('queued', 'failed'):
+        assert frontier.claim(SOURCE, 1) == ['flaky']
+        frontier.mark_failed(SOURCE, 'flaky', error='503')
+        assert frontier.state(SOURCE, 'flaky') == expected
+    assert frontier.claim(SOURCE, 1) == []
+
+
+def test_timestamps_are_utc_aware(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / 'frontier.sqlite'))
+    frontier.add(SOURCE, 'u1')
+    frontier.mark_done(SOURCE, 'u1')
+    frontier.add_items(SOURCE, ['digest'])
+    frontier.advance_watermark(SOURCE, '2025-02-03T06:00:00+00:00')
+    stamps = frontier.db.execute(
+        'SELECT discovered_at, fetched_at, (SELECT ingested_at FROM items), (SELECT updated_at FROM watermarks) '
+        'FROM urls'
+    ).fetchone()
+    assert all(datetime.fromisoformat(stamp).tzinfo == timezone.utc for stamp in stamps)
+
+
+def test_detail_crawler_skips_pages_fetched_on_an_earlier_run(tmp_path, monkeypatch):
+    from scrapers.malayalam_media.mathrubhumi import MathrubhumiScraper
+
+    monkeypatch.setattr(config, 'FRONTIER_DB', str(tmp_path / 'frontier.sqlite'))
+    fetched = []
+
+    class FixtureScraper(MathrubhumiScraper):
+        def get_page(self, url):
+            fetched.append(url)
+            return load_page(url)
+
+        def rate_limit(self):
+            pass
+
+    scraper = FixtureScraper(MATHRUBHUMI_CONFIG)
+    first = scraper.run()
+    scraper.commit_published()
+    detail_fetches = len(fetched) - 1
+    fetched.clear()
+    second = FixtureScraper(MATHRUBHUMI_CONFIG).run()
+
+    assert first and detail_fetches == len(first)
+    assert second == [] and fetched == MATHRUBHUMI_CONFIG['news_urls']
+
+
+def test_run_interrupted_before_publish_fetches_its_articles_again(tmp_path, monkeypatch):
+    from scrapers.malayalam_media.mathrubhumi import MathrubhumiScraper
+    from utils.staging import StagingArea
+
+    monkeypatch.setattr(config, 'FRONTIER_DB', str(tmp_path / 'frontier.sqlite'))
+    monkeypatch.setattr(CrawlFrontier, '_shared', {})
+    fetched = []
+
+    class FixtureScraper(MathrubhumiScraper):
+        def get_page(self, url):
+            fetched.append(url)
+            return load_page(url)
+
+        def rate_limit(self):
+            pass
+
+    def crawl():
+        fetched.clear()
+        scraper = FixtureScraper(MATHRUBHUMI_CONFIG)
+        staging = StagingArea(None)
+        articles = scraper.run()
+        staging.add('mathrubhumi_agriculture', MATHRUBHUMI_CONFIG, articles)
+        staging.hold('mathrubhumi_agriculture', scraper)
+        return articles, staging, fetched[1:]
+
+    articles, _, detail_pages = crawl()
+    assert articles and len(detail_pages) == len(articles)
+    CrawlFrontier.shared(config.FRONTIER_DB).db.close()  # SIGTERM before output2 was written
+    monkeypatch.setattr(CrawlFrontier, '_shared', {})
+
+    again, staging, refetched = crawl()
+    assert CrawlFrontier.shared(config.FRONTIER_DB).resumed == len(articles)
+    assert refetched == detail_pages and [a['url'] for a in again] == [a['url'] for a in articles]
+    staging.published()  # consolidated files written
+
+    assert crawl()[0] == [] and fetched == MATHRUBHUMI_CONFIG['news_urls']
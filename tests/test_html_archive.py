@@ -0,0 +1,94 @@
+"""
+Raw HTML archive - round trips, per-source dictionaries, index lookups and retention
+"""
+import os
+from datetime import datetime, timedelta, timezone
+
+from utils.html_archive import HtmlArchive
+
+URL = 'https://economictimes.indiatimes.com/news/economy/agriculture'
+
+
+def page(i):
+    """A listing page: shared template boilerplate around a unique story"""
+    template = ''.join(f'<li class="nav"><a href="/section/{n}">Section {n}</a></li>' for n in range(60))
+    return f'<html><head><title>Agriculture</title></head><body><ul>{template}</ul>' \
+           f'<div class="story"><h2>Story {i}</h2><p>Paddy procurement update number {i}.</p></div></body></html>'
+
+
+def test_store_and_load_round_trip(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    digest = archive.store(URL, page(1), 'Economic Times Agriculture', headers={'Content-Type': 'text/html'})
+    assert archive.store(URL, page(1).encode('utf-8'), 'Economic Times Agriculture') == digest  # same body
+
+    record = archive.get(URL)
+    assert record['source'] == 'economic_times_agriculture' and record['digest'] == digest
+    assert archive.read_text(record) == page(1)
+    assert archive.history(URL)[0]['headers'] == {'Content-Type': 'text/html'}
+    stats = archive.stats()
+    assert stats['records'] == 2 and stats['unique_bodies'] == 1
+    assert stats['stored_bytes'] < stats['raw_bytes']
+    assert archive.get('https://example.com/missing') is None
+
+
+def test_dictionary_is_trained_after_min_samples(tmp_path):
+    archive = HtmlArchive(str(tmp_path), dict_size=4096, dict_min_samples=30)
+    for i in range(29):
+        archive.store(f"{URL}/{i}", page(i), 'Economic Times Agriculture')
+    assert archive._current_dict_id('economic_times_agriculture') is None
+
+    archive.store(f"{URL}/29", page(29), 'Economic Times Agriculture')
+    dict_id = archive._current_dict_id('economic_times_agriculture')
+    assert dict_id == 'economic_times_agriculture-1'
+    assert os.path.exists(archive._dict_path(dict_id))
+
+    digest = archive.store(f"{URL}/30", page(30), 'Economic Times Agriculture')
+    blob = archive.db.execute('SELECT * FROM blobs WHERE digest = ?', (digest,)).fetchone()
+    assert blob['dict_id'] == dict_id
+    reopened = HtmlArchive(str(tmp_path))  # the dictionary is read back from disk
+    assert reopened.read_text(reopened.get(f"{URL}/30")) == page(30)
+
+
+def test_failed_training_waits_for_more_samples(tmp_path, monkeypatch):
+    archive = HtmlArchive(str(tmp_path), dict_size=4096, dict_min_samples=5)
+    attempts = []
+    monkeypatch.setattr(archive, 'train_dictionary', lambda source: attempts.append(source))  # always fails
+    for i in range(9):
+        archive.store(f"{URL}/{i}", page(i), 'Economic Times Agriculture')
+    assert len(attempts) == 1  # not retried on every store
+
+    archive.store(f"{URL}/9", page(9), 'Economic Times Agriculture')
+    assert len(attempts) == 2  # five more samples arrived
+
+    monkeypatch.undo()
+    for i in range(10, 15):
+        archive.store(f"{URL}/{i}", page(i), 'Economic Times Agriculture')
+    assert archive._current_dict_id('economic_times_agriculture') == 'economic_times_agriculture-1'
+
+
+def test_index_lookups_by_time_and_source(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    monday = datetime(2025, 2, 3, 6, 0, tzinfo=timezone.utc)
+    archive.store(URL, page(1), 'Economic Times Agriculture', fetched_at=monday)
+    archive.store(URL, page(2), 'Economic Times Agriculture', fetched_at=monday + timedelta(days=1))
+    archive.store('https://timesofindia.indiatimes.com/agriculture', page(3), 'Times of India Agriculture',
+                  fetched_at=monday + timedelta(hours=1))
+
+    assert archive.read_text(archive.get(URL)) == page(2)
+    assert archive.read_text(archive.get(URL, at=monday + timedelta(hours=12))) == page(1)
+    assert archive.get(URL, at=datetime(2025, 2, 3, 5, 0)) is None  # naive datetimes are UTC
+    assert [r['url'] for r in archive.records(source='Times of India Agriculture')] == [
+        'https://timesofindia.indiatimes.com/agriculture']
+    assert len(archive.records(since=monday, until=monday + timedelta(hours=2))) == 2
+
+
+def test_prune_drops_old_records_and_unreferenced_bodies(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    old = archive.store(URL, page(1), 'Economic Times Agriculture',
+                        fetched_at=datetime.now(timezone.utc) - timedelta(days=120))
+    kept = archive.store(URL, page(2), 'Economic Times Agriculture')
+
+    assert archive.prune(90) == 1
+    assert not os.path.exists(archive._object_path(old)) and archive.read_body(old) is None
+    assert archive.read_body(kept) == page(2).encode('utf-8')
+    assert archive.stats()['records'] == 1
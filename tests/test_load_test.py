@@ -0,0 +1,72 @@
+"""
+Synthetic site and load test - every request stays on the local site
+"""
+import time
+
+import pytest
+import requests
+
+from benchmarks.load_test import check_local, run_load_test
+from benchmarks.synthetic_site import (LISTING_PATHS, PageGenerator, SiteSettings, SyntheticSite,
+                                       point_source_at, site_kind_for)
+from config.settings import config
+from config.sources import ALL_SOURCES, EXTRA_SOURCES
+
+
+@pytest.fixture
+def load_test_config(monkeypatch):
+    """run_load_test points these at its temporary directory; put them back afterwards"""
+    for name in ('FRONTIER_DB', 'BREAKER_STATE_FILE', 'ROBOTS_ENABLED'):
+        monkeypatch.setattr(config, name, getattr(config, name))
+
+
+def test_pointed_sources_have_no_live_feeds():
+    with SyntheticSite(SiteSettings(items=5)) as site:
+        pointed = point_source_at('economic_times_agriculture', ALL_SOURCES['economic_times_agriculture'], site)
+        assert 'feeds' in ALL_SOURCES['economic_times_agriculture'] and 'feeds' not in pointed
+        assert pointed['news_urls'] == [site.listing_url('economictimes')]
+
+        check_local([pointed['news_urls'][0]], site)
+        with pytest.raises(AssertionError, match='economictimes.indiatimes.com'):
+            check_local(ALL_SOURCES['economic_times_agriculture']['feeds'], site)
+
+
+def test_feed_source_is_served_from_the_listing(load_test_config):
+    report = run_load_test(SiteSettings(items=10), ['economic_times_agriculture'])
+    row = report['sources']['economic_times_agriculture']
+    assert row['articles'] == 10 and row['pages'] == 1
+    assert report['total']['requests_served'] == 1
+
+
+def test_generated_pages_are_deterministic():
+    generator = PageGenerator(SiteSettings(items=3, seed=7))
+    listing = LISTING_PATHS['economictimes']
+    assert generator.render(listing) == PageGenerator(SiteSettings(items=3, seed=7)).render(listing)
+    assert generator.render(listing).count('class="eachStory"') == 3
+    assert generator.render(listing) != PageGenerator(SiteSettings(items=3, seed=8)).render(listing)
+    assert 'story-headline' in generator.render(LISTING_PATHS['mathrubhumi'] + '/news/2')
+    assert generator.render('/unknown') is None
+
+
+def test_site_serves_pages_errors_and_latency():
+    with SyntheticSite(SiteSettings(items=3, latency_ms=50)) as site:
+        start = time.perf_counter()
+        assert requests.get(site.listing_url('testbook'), timeout=5).status_code == 200
+        assert time.perf_counter() - start >= 0.05
+        assert requests.get(site.url + '/unknown', timeout=5).status_code == 404
+        assert site.requests_served == 2 and site.errors_injected == 0
+
+    with SyntheticSite(SiteSettings(items=3, error_rate=1.0)) as site:
+        assert requests.get(site.listing_url('testbook'), timeout=5).status_code == 503
+        assert site.errors_injected == 1
+
+
+def test_every_source_is_served_by_its_template(load_test_config):
+    sources = dict(ALL_SOURCES, **EXTRA_SOURCES)
+    assert {site_kind_for(name, sources[name]) for name in sources} == set(LISTING_PATHS)
+
+    report = run_load_test(SiteSettings(items=5), list(sources))
+    assert all(row['articles'] for row in report['sources'].values())
+    assert report['sources']['mathrubhumi_agriculture']['pages'] == 6  # listing + one page per article
+    assert report['total']['requests_served'] == report['total']['pages']
+    assert report['total']['errors_injected'] == 0
@@ -0,0 +1,61 @@
+"""
+Structured logging - JSON-lines file sink, context fields, tracebacks, and switching log files
+"""
+import json
+import logging
+
+import pytest
+
+from utils.logger import log_context, setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def fresh_logging():
+    """Each test starts its own setup; the root logger is put back afterwards"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    shutdown_logging()
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_file_records_carry_context_and_a_separate_traceback(tmp_path, fresh_logging):
+    log_file = tmp_path / 'logs' / 'scraper.jsonl'
+    setup_logging(log_file=str(log_file))
+    logger = logging.getLogger('test.scraper')
+
+    with log_context(source='Economic Times Agriculture', stage='fetch'):
+        logger.info("Fetched %d bytes", 512)
+        try:
+            raise ConnectionError("reset by peer")
+        except ConnectionError:
+            logger.exception("Fetch failed")
+    shutdown_logging()
+
+    fetched, failed = read_lines(log_file)
+    assert fetched['msg'] == 'Fetched 512 bytes' and 'exc' not in fetched
+    assert fetched['source'] == 'Economic Times Agriculture' and fetched['stage'] == 'fetch'
+    assert failed['msg'] == 'Fetch failed' and failed['level'] == 'ERROR'
+    assert 'ConnectionError: reset by peer' in failed['exc']
+
+
+def test_later_setup_switches_to_the_new_log_file(tmp_path, fresh_logging):
+    first, second = tmp_path / 'scraper.jsonl', tmp_path / 'daemon.jsonl'
+    setup_logging(log_file=str(first))
+    logging.getLogger('test').warning("before")
+    setup_logging(log_file=str(second))
+    logging.getLogger('test').warning("after")
+    setup_logging()  # no file asked for: the current one is kept
+    logging.getLogger('test').warning("still daemon")
+    shutdown_logging()
+
+    assert [entry['msg'] for entry in read_lines(first)] == ['before']
+    assert [entry['msg'] for entry in read_lines(second)] == [
+        f"Log file switched from {first} to {second}", 'after', 'still daemon']
@@ -0,0 +1,67 @@
+"""
+Metrics registry - Prometheus rendering, merging worker exports, and the @timed decorator
+"""
+import pytest
+
+import utils.metrics
+from utils.metrics import MetricsRegistry, timed
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    for seconds in (0.0004, 0.003, 0.003, 0.2, 120.0):
+        registry.observe('stage_seconds', seconds, source='ET', stage='fetch')
+    lines = registry.render_prometheus().splitlines()
+
+    def bucket(le):
+        return next(line for line in lines
+                    if line.startswith('scraper_stage_seconds_bucket') and f'le="{le}"' in line)
+
+    assert bucket('0.0005').endswith(' 1')
+    assert bucket('0.005').endswith(' 3')
+    assert bucket('0.25').endswith(' 4')
+    assert bucket('60.0').endswith(' 4')
+    assert bucket('+Inf').endswith(' 5')  # above the largest bound: only in +Inf and _count
+    assert 'scraper_stage_seconds_count{source="ET",stage="fetch"} 5' in lines
+    assert '# TYPE scraper_stage_seconds histogram' in lines
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.inc('fetch_errors', source='Say "hi"\\now\nplease')
+    assert 'scraper_fetch_errors_total{source="Say \\"hi\\"\\\\now\\nplease"} 1' in registry.render_prometheus()
+
+
+def test_merge_adds_worker_exports():
+    main, worker = MetricsRegistry(), MetricsRegistry()
+    main.inc('pages_parsed', source='ET')
+    main.observe('stage_seconds', 0.002, source='ET', stage='parse')
+    worker.inc('pages_parsed', 2, source='ET')
+    worker.inc('pages_parsed', source='TOI')
+    worker.observe('stage_seconds', 0.02, source='ET', stage='parse')
+
+    main.merge(worker.export())
+    snapshot = main.snapshot()
+    assert snapshot['counters']['pages_parsed_total'] == {'{source="ET"}': 3, '{source="TOI"}': 1}
+    assert snapshot['stages']['ET']['parse'] == {'count': 2, 'seconds': 0.022}
+
+
+def test_timed_records_the_stage_even_when_the_call_fails(monkeypatch):
+    registry = MetricsRegistry()
+    monkeypatch.setattr(utils.metrics, 'metrics', registry)
+
+    class Scraper:
+        source_config = {'name': 'Testbook Agriculture Schemes'}
+
+        @timed('extract')
+        def extract(self, fail=False):
+            """Extract things"""
+            if fail:
+                raise ValueError("bad page")
+            return ['scheme']
+
+    scraper = Scraper()
+    assert scraper.extract() == ['scheme'] and Scraper.extract.__doc__ == "Extract things"
+    with pytest.raises(ValueError):
+        scraper.extract(fail=True)
+    assert registry.snapshot()['stages']['Testbook Agriculture Schemes']['extract']['count'] == 2
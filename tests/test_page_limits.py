@@ -0,0 +1,52 @@
+"""
+Page limits and tree release - oversized pages are rejected before a tree is built
+"""
+import bs4
+import pytest
+
+import scrapers.base_scraper as base_scraper
+from config.settings import config
+from config.sources import ALL_SOURCES
+from scrapers.base_scraper import PageTooLargeError
+from utils.metrics import MetricsRegistry
+
+URL = ALL_SOURCES['times_of_india_agriculture']['news_urls'][0]
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+
+    monkeypatch.setattr(base_scraper, 'metrics', MetricsRegistry())
+    return SimpleConsolidatedScraper(ALL_SOURCES['times_of_india_agriculture'])
+
+
+def not_parsed(*args, **kwargs):
+    raise AssertionError("oversized page was parsed")
+
+
+@pytest.mark.parametrize('reason, limits, html', [
+    ('size', {'MAX_PAGE_BYTES': 10000}, '<html><body><p>' + 'Paddy ' * 2000 + '</p></body></html>'),
+    ('nodes', {'MAX_PAGE_NODES': 500}, '<html><body>' + '<span>x</span>' * 400 + '</body></html>'),
+])
+def test_oversized_page_is_rejected_without_parsing(scraper, monkeypatch, reason, limits, html):
+    for name, value in limits.items():
+        monkeypatch.setattr(config, name, value)
+    monkeypatch.setattr(bs4, 'BeautifulSoup', not_parsed)
+
+    with pytest.raises(PageTooLargeError):
+        scraper.process_page(URL, html)
+
+    counters = base_scraper.metrics.snapshot()['counters']
+    assert counters['pages_rejected_total'] == {
+        f'{{reason="{reason}",source="Times of India Agriculture"}}': 1}
+    assert 'pages_parsed_total' not in counters
+
+
+def test_parsed_tree_is_released_when_extraction_fails(scraper):
+    with pytest.raises(ValueError):
+        with scraper.parsed('<html><body><p>Paddy prices</p></body></html>') as soup:
+            raise ValueError("extractor bug")
+    assert soup.decomposed
+    assert base_scraper.metrics.snapshot()['counters']['pages_parsed_total'] == {
+        '{source="Times of India Agriculture"}': 1}
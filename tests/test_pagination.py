@@ -0,0 +1,108 @@
+"""
+Listing pagination - older pages are read only until already-ingested items come up
+"""
+from config.settings import config
+from multi_source_scraper import SimpleConsolidatedScraper
+from scrapers.malayalam_media.mathrubhumi import MathrubhumiScraper
+
+LISTING = 'https://example.com/agriculture'
+
+
+def listing_pages(stories, per_page=5, next_links=True):
+    """{url: html}: stories newest first, per_page to a page, linked with rel=next"""
+    pages = {}
+    chunks = [stories[i:i + per_page] for i in range(0, len(stories), per_page)]
+    for number, chunk in enumerate(chunks, 1):
+        url = LISTING if number == 1 else f"{LISTING}?page={number}"
+        items = ''.join(f'<li><a href="/agriculture/news/{s}">{s}</a><p>{s} story text</p></li>' for s in chunk)
+        nav = f'<a rel="next" href="?page={number + 1}">Next</a>' if next_links and number < len(chunks) else ''
+        pages[url] = f"<html><body><ul>{items}</ul>{nav}</body></html>"
+    return pages
+
+
+def source(pagination):
+    return {
+        'name': 'Paginated Test', 'base_url': 'https://example.com', 'news_urls': [LISTING],
+        'category': 'news_agriculture', 'language': 'english', 'pagination': pagination,
+    }
+
+
+class FakeSite:
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    def scraper(self, base, source_config):
+        site = self
+
+        class PageScraper(base):
+            def get_page(self, url):
+                site.fetched.append(url)
+                return site.pages.get(url)
+
+            def rate_limit(self):
+                pass
+
+        return PageScraper(source_config)
+
+
+def links(soup):
+    return ['https://example.com' + a['href'] for a in soup.select('li a')]
+
+
+def test_detail_links_stop_at_already_fetched_articles(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', str(tmp_path / 'frontier.sqlite'))
+    site = FakeSite(listing_pages([f"s{i}" for i in range(20, 0, -1)]))
+    source_config = source({'next_selector': 'a[rel="next"]', 'stop_after_seen': 2})
+
+    scraper = site.scraper(MathrubhumiScraper, source_config)
+    first = scraper.listing_links(LISTING, links)
+    assert len(first) == 20 and len(site.fetched) == 4
+    for url in scraper.detail_urls(first):
+        scraper.mark_detail(url)
+    scraper.commit_published()
+
+    # three new stories pushed everything down; page 2 now starts with known stories
+    site.pages = listing_pages([f"s{i}" for i in range(23, 0, -1)])
+    site.fetched.clear()
+    second = site.scraper(MathrubhumiScraper, source_config).listing_links(LISTING, links)
+    assert second == [f"https://example.com/agriculture/news/s{i}" for i in (23, 22, 21)]
+    assert site.fetched == [LISTING]
+
+
+def test_url_template_and_max_pages(monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', None)
+    site = FakeSite(listing_pages([f"s{i}" for i in range(30, 0, -1)], next_links=False))
+    source_config = source({'url_template': '{url}?page={page}', 'max_pages': 3})
+
+    found = site.scraper(MathrubhumiScraper, source_config).listing_links(LISTING, links)
+    assert len(found) == 15
+    assert site.fetched == [LISTING, f"{LISTING}?page=2", f"{LISTING}?page=3"]
+
+
+def test_unpaginated_sources_read_one_page(monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', None)
+    site = FakeSite(listing_pages([f"s{i}" for i in range(10, 0, -1)]))
+
+    found = site.scraper(MathrubhumiScraper, source(None)).listing_links(LISTING, links)
+    assert len(found) == 5 and site.fetched == [LISTING]
+
+
+def test_listing_items_stop_on_content_digests(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'FRONTIER_DB', str(tmp_path / 'frontier.sqlite'))
+
+    class ListScraper(SimpleConsolidatedScraper):
+        def extract_synopsis_articles(self, soup, url):
+            return [{'title': li.a.get_text(), 'content': li.p.get_text()} for li in soup.select('li')]
+
+    site = FakeSite(listing_pages([f"s{i}" for i in range(12, 0, -1)]))
+    source_config = source({'next_selector': 'a[rel="next"]'})
+    first = site.scraper(ListScraper, source_config)
+    assert len(first.run()) == 12
+    first.commit_published()
+
+    site.pages = listing_pages([f"s{i}" for i in range(14, 0, -1)])
+    site.fetched.clear()
+    articles = site.scraper(ListScraper, source_config).run()
+    assert site.fetched == [LISTING]
+    assert [a['title'] for a in articles] == ['s14', 's13', 's12', 's11', 's10']  # first page is always kept
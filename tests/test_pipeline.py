@@ -0,0 +1,106 @@
+"""
+Staged pipeline - same output as the sequential run, in URL order, with merged stats
+"""
+import json
+import os
+import shutil
+
+import pytest
+
+from config.settings import config
+from config.sources import ALL_SOURCES
+from tests.test_extractors import FIXTURES_DIR
+from utils.metrics import metrics
+from utils.pipeline import StagedPipeline
+
+
+def without_timestamps(articles):
+    return [{k: v for k, v in a.items() if k != 'scraped_at'} for a in articles]
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_pipeline_matches_sequential_run(workers, monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    scrapers = {name: SimpleConsolidatedScraper(cfg) for name, cfg in ALL_SOURCES.items()}
+    sequential = {name: scraper.run() for name, scraper in scrapers.items()}
+
+    metrics.reset()
+    written = []
+    results = StagedPipeline(
+        SimpleConsolidatedScraper, cpu_workers=workers, max_pending=1,
+        writer=lambda name, articles: written.append(name)
+    ).run(ALL_SOURCES)
+
+    assert sorted(written) == sorted(ALL_SOURCES)
+    for name, result in results.items():
+        assert result['error'] is None
+        assert without_timestamps(result['articles']) == without_timestamps(sequential[name])
+        assert result['run_stats'].accepted >= len(result['articles'])
+        assert [f['url'] for f in result['run_stats'].fetches] == [f['url'] for f in scrapers[name].run_stats.fetches]
+    candidates = metrics.snapshot()['counters']['candidates_total']
+    assert sum(candidates.values()) == sum(r['run_stats'].candidates for r in results.values())
+
+
+def test_pages_keep_url_order_within_a_source(monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    et, toi = (ALL_SOURCES[name]['news_urls'][0]
+               for name in ('economic_times_agriculture', 'times_of_india_agriculture'))
+    source = dict(ALL_SOURCES['economic_times_agriculture'], news_urls=[toi, 'https://missing.example/', et])
+
+    articles = StagedPipeline(SimpleConsolidatedScraper, cpu_workers=2).run({'mixed': source})['mixed']['articles']
+
+    urls = [a['url'] for a in articles]
+    assert urls == sorted(urls, key=[toi, et].index) and set(urls) == {toi, et}
+
+
+def test_failed_submit_does_not_stall_the_writer(monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+    import utils.pipeline
+
+    def broken_pool(*args):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    monkeypatch.setattr(utils.pipeline, '_InlineFuture', broken_pool)
+    sources = {name: ALL_SOURCES[name] for name in ('economic_times_agriculture', 'times_of_india_agriculture')}
+
+    results = StagedPipeline(SimpleConsolidatedScraper, cpu_workers=0, max_pending=1).run(sources)
+
+    for result in results.values():
+        assert result['articles'] == [] and 'after shutdown' in result['error']
+
+
+def test_feeds_and_paginated_listings_match_sequential_run(tmp_path, monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+    from tests.test_discovery import RSS
+
+    et, toi = ALL_SOURCES['economic_times_agriculture'], ALL_SOURCES['times_of_india_agriculture']
+    page_two = 'https://timesofindia.indiatimes.com/topic/agriculture/news/2'
+    with open(os.path.join(FIXTURES_DIR, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    for filename in set(manifest.values()):
+        shutil.copy(os.path.join(FIXTURES_DIR, filename), tmp_path / filename)
+    first_page = (tmp_path / manifest[toi['news_urls'][0]]).read_text(encoding='utf-8')
+    (tmp_path / 'toi_page_1.html').write_text(
+        first_page.replace('</body>', f'<a rel="next" href="{page_two}">Next</a></body>'), encoding='utf-8')
+    (tmp_path / 'et_feed.xml').write_text(RSS, encoding='utf-8')
+    manifest.update({toi['news_urls'][0]: 'toi_page_1.html', page_two: manifest[toi['news_urls'][0]],
+                     et['feeds'][0]: 'et_feed.xml'})
+    (tmp_path / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+    monkeypatch.setattr(config, 'REPLAY_DIR', str(tmp_path))
+    sources = {'economic_times_agriculture': et, 'times_of_india_agriculture': toi}
+
+    sequential = {name: SimpleConsolidatedScraper(cfg).run() for name, cfg in sources.items()}
+    results = StagedPipeline(SimpleConsolidatedScraper, cpu_workers=2, max_pending=1).run(sources)
+
+    et_articles = results['economic_times_agriculture']['articles']
+    assert [a['url'] for a in et_articles] == ['https://example.com/news/coconut-prices',  # newest first
+                                                'https://example.com/news/kharif-sowing']
+    toi_urls = [a['url'] for a in results['times_of_india_agriculture']['articles']]
+    assert toi_urls.count(page_two) == toi_urls.count(toi['news_urls'][0]) > 0
+    for name, result in results.items():
+        assert without_timestamps(result['articles']) == without_timestamps(sequential[name])
@@ -0,0 +1,66 @@
+"""
+Per-source profiling - pstats and collapsed stacks for both profiler modes
+"""
+import os
+import pstats
+import time
+
+import pytest
+
+from config.settings import config
+from utils.profiling import SourceProfiler, paused
+
+
+def spin(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(i * i for i in range(200))
+    return total
+
+
+def busy_source(seconds=0.15):
+    """CPU work with a politeness sleep in the middle, like a scraper run"""
+    total = spin(seconds)
+    with paused():
+        time.sleep(0.05)
+    return total
+
+
+def paced_source():
+    """Work on both sides of a paused() sleep, like pages fetched between rate limits"""
+    spin(0.05)
+    with paused():
+        time.sleep(0.2)
+    spin(0.05)
+
+
+@pytest.mark.parametrize('mode', SourceProfiler.MODES)
+def test_profile_writes_pstats_and_collapsed_stacks(mode, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'PROFILE_DIR', str(tmp_path / 'profiles'))
+    profiler = SourceProfiler(config.PROFILE_DIR, mode=mode)
+    with profiler.profile('economic_times_agriculture'):
+        busy_source()
+
+    result = profiler.results['economic_times_agriculture']
+    for key in ('pstats', 'collapsed'):
+        assert os.path.dirname(result[key]) == profiler.run_dir
+        assert profiler.run_dir.startswith(config.PROFILE_DIR) and os.path.getsize(result[key])
+
+    functions = {name for _, _, name in pstats.Stats(result['pstats']).stats}
+    assert 'busy_source' in functions
+    with open(result['collapsed'], encoding='utf-8') as f:
+        stacks = [line.rsplit(' ', 1)[0] for line in f]
+    assert any('busy_source (test_profiling.py' in stack for stack in stacks)
+    assert not any('sleep' in stack.rsplit(';', 1)[-1] for stack in stacks)  # paused() time is left out
+    assert result['hotspots']
+
+
+def test_outer_frames_keep_their_time_across_pauses(tmp_path):
+    profiler = SourceProfiler(str(tmp_path), mode='cprofile')
+    with profiler.profile('mathrubhumi_agriculture'):
+        paced_source()
+
+    stats = profiler.results['mathrubhumi_agriculture']['stats'].stats
+    cumulative = next(entry[3] for (_, _, name), entry in stats.items() if name == 'paced_source')
+    assert 0.09 < cumulative < 0.2  # both spins, not the paused sleep
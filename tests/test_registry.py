@@ -0,0 +1,89 @@
+"""
+Scraper registry - every configured source resolves, classes load lazily
+"""
+import pytest
+
+from benchmarks.extractor_bench import load_page
+from scrapers.registry import (
+    SCRAPE_METHODS, ScraperResolutionError, all_sources, create_scraper, scraper_class, scraper_path,
+    validate_sources
+)
+
+# Methods no configured source uses yet, with a source whose pages they read
+FIXTURE_SOURCES = {
+    'synopsis_extraction': 'economic_times_agriculture',
+    'mathrubhumi_full_articles': 'mathrubhumi_agriculture',
+}
+
+
+def test_every_configured_source_resolves():
+    assert validate_sources() == []
+    assert validate_sources(load=True) == []  # every class is concrete and defines what it calls
+    for source_name, source_config in all_sources().items():
+        cls = scraper_class(source_name, source_config)
+        assert hasattr(cls, 'scrape_articles')
+
+
+@pytest.mark.parametrize('method', sorted(SCRAPE_METHODS))
+def test_registered_scrapers_handle_leased_work(method):
+    sources = all_sources()
+    source_name = FIXTURE_SOURCES.get(method) or next(
+        name for name, source_config in sources.items() if source_config.get('scrape_method') == method)
+    source_config = dict(sources[source_name], scrape_method=method)
+    scraper = create_scraper(source_name, source_config)
+
+    url = source_config['news_urls'][0]
+    articles, links = scraper.listing_work(url, load_page(url))
+    assert articles or links
+    if links:  # detail-page scrapers: one of the linked articles is in the fixtures
+        article = scraper.detail_work(links[0], load_page(links[0]))
+        assert article and len(article['content']) > 100
+
+
+def test_scrape_method_and_explicit_scraper():
+    from fixed_mathrubhumi import FixedMathrubhumiScraper
+    from scrapers.malayalam_media.mathrubhumi import MathrubhumiScraper
+
+    assert isinstance(create_scraper('mathrubhumi_agriculture'), MathrubhumiScraper)
+    config = dict(all_sources()['mathrubhumi_agriculture'], scraper='fixed_mathrubhumi:FixedMathrubhumiScraper')
+    assert scraper_class('custom', config) is FixedMathrubhumiScraper
+
+
+def test_scraper_without_work_item_hooks_cannot_be_created():
+    from scrapers.base_scraper import BaseScraper
+
+    class ListingOnly(BaseScraper):
+        def scrape_articles(self):
+            return []
+
+    with pytest.raises(TypeError, match='detail_work'):
+        ListingOnly(all_sources()['economic_times_agriculture'])
+
+
+def test_classes_that_cannot_run_are_reported_when_loaded():
+    sources = {
+        'abstract': {'scraper': 'scrapers.base_scraper:BaseScraper'},
+        'stub': {'scraper': 'scrapers.malayalam_media.manorama:ManoramaScraper'},
+    }
+    assert validate_sources(sources) == []  # module paths alone look fine
+    abstract, stub = validate_sources(sources, load=True)
+    assert abstract.startswith("Source 'abstract'") and 'detail_work, listing_work, scrape_articles' in abstract
+    assert stub.startswith("Source 'stub'") and 'calls undefined extract_article_data, find_article_links' in stub
+
+
+def test_bad_sources_are_reported_without_importing():
+    sources = {
+        'no_method': {'scrape_method': 'carrier_pigeon'},
+        'no_module': {'scraper': 'scrapers.does_not_exist:Nothing'},
+        'no_class': {'scraper': 'multi_source_scraper'},
+    }
+    problems = validate_sources(sources)
+    assert len(problems) == 3
+    assert "carrier_pigeon" in problems[0] and 'does_not_exist' in problems[1]
+
+    with pytest.raises(ScraperResolutionError):
+        scraper_path('no_method', sources['no_method'])
+    with pytest.raises(ScraperResolutionError):
+        scraper_class('missing_class', {'scraper': 'multi_source_scraper:NoSuchScraper'})
+    with pytest.raises(ScraperResolutionError):
+        create_scraper('not_a_source')
@@ -0,0 +1,91 @@
+"""
+Replay corpus - lookups in fixture and archive corpora, and scrapers that never touch the network
+"""
+import json
+
+import pytest
+
+from config.settings import config
+from config.sources import ALL_SOURCES
+from utils.html_archive import HtmlArchive
+from utils.replay import ReplayCorpus
+
+LISTING = 'https://economictimes.indiatimes.com/news/economy/agriculture'
+STORY = 'https://economictimes.indiatimes.com/news/economy/agriculture/paddy-prices.cms'
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    (tmp_path / 'listing.html').write_text('<html>listing</html>', encoding='utf-8')
+    (tmp_path / 'manifest.json').write_text(json.dumps({LISTING: 'listing.html'}), encoding='utf-8')
+    (tmp_path / ReplayCorpus.fixture_name(STORY)).write_text('<html>story</html>', encoding='utf-8')
+    return tmp_path
+
+
+def test_fixture_lookup_hits_and_misses(corpus_dir):
+    corpus = ReplayCorpus(str(corpus_dir))
+    assert corpus.get(LISTING) == '<html>listing</html>'  # manifest entry
+    assert corpus.get(STORY) == '<html>story</html>'      # file named after the URL
+    assert corpus.get('https://example.com/unknown') is None
+    assert corpus.hits == 2 and corpus.misses == ['https://example.com/unknown']
+    assert corpus.urls() == [LISTING]
+
+
+def test_archive_corpus_serves_latest_record(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    archive.store(LISTING, '<html>monday</html>', 'Economic Times Agriculture')
+    archive.store(LISTING, '<html>tuesday</html>', 'Economic Times Agriculture')
+
+    corpus = ReplayCorpus(str(tmp_path))
+    assert corpus.get(LISTING) == '<html>tuesday</html>'
+    assert corpus.urls() == [LISTING]
+    with pytest.raises(FileNotFoundError):
+        ReplayCorpus(str(tmp_path / 'missing'))
+
+
+def test_replay_scraper_makes_no_requests_and_never_sleeps(corpus_dir, monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+    import scrapers.base_scraper as base_scraper
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("network request during replay")
+
+    def no_sleep(seconds):
+        raise AssertionError(f"slept {seconds}s during replay")
+
+    monkeypatch.setattr(config, 'REPLAY_DIR', str(corpus_dir))
+    monkeypatch.setattr(config, 'ROBOTS_ENABLED', True)  # robots.txt is not fetched while replaying either
+    monkeypatch.setattr(base_scraper.time, 'sleep', no_sleep)
+    scraper = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    monkeypatch.setattr(scraper.session, 'get', no_network)
+    monkeypatch.setattr(scraper.session, 'request', no_network)
+
+    assert scraper.get_page(LISTING) == '<html>listing</html>'
+    scraper.rate_limit()
+    assert scraper.get_page('https://economictimes.indiatimes.com/missing') is None
+    assert scraper.archive is None and scraper.robots is None
+    assert [fetch['replay'] for fetch in scraper.run_stats.fetches] == [True, True]
+
+
+def test_redirected_fetch_is_replayed_under_the_requested_url(tmp_path, monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+    import requests
+
+    def redirected(url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = LISTING + '/'  # where the site sent us
+        response._content = b'<html>archived</html>'
+        return response
+
+    monkeypatch.setattr(config, 'ARCHIVE_ENABLED', True)
+    monkeypatch.setattr(config, 'ARCHIVE_DIR', str(tmp_path / 'archive'))
+    monkeypatch.setattr(config, 'BREAKER_STATE_FILE', None)
+    scraper = SimpleConsolidatedScraper(ALL_SOURCES['economic_times_agriculture'])
+    monkeypatch.setattr(scraper.session, 'get', redirected)
+    assert scraper.get_page(LISTING) == '<html>archived</html>'
+    assert scraper.archive.get(LISTING)['final_url'] == LISTING + '/'
+
+    corpus = ReplayCorpus(str(tmp_path / 'archive'))
+    assert corpus.get(LISTING) == '<html>archived</html>'
+    assert corpus.urls() == [LISTING]
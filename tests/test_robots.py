@@ -0,0 +1,128 @@
+"""
+robots.txt cache, Crawl-delay spacing and filtering in the scraper fetch path
+"""
+from benchmarks.extractor_bench import MATHRUBHUMI_CONFIG
+from config.settings import config
+from scrapers.malayalam_media.mathrubhumi import MathrubhumiScraper
+from utils.robots import HostThrottle, RobotsCache
+
+ROBOTS = """
+User-agent: KeralaAgriNewsScraper
+Disallow: /search
+Crawl-delay: 7
+
+User-agent: *
+Disallow: /agriculture/private/
+Crawl-delay: 3
+"""
+
+
+class Fetcher:
+    def __init__(self, status=200, body=ROBOTS):
+        self.status = status
+        self.body = body
+        self.calls = []
+
+    def __call__(self, url):
+        self.calls.append(url)
+        if self.status is None:
+            raise ConnectionError('unreachable')
+        return self.status, self.body
+
+
+def test_rules_and_crawl_delay_per_user_agent(tmp_path):
+    fetch = Fetcher()
+    ours = RobotsCache(str(tmp_path), user_agent='KeralaAgriNewsScraper')
+    assert not ours.allowed('https://example.com/search?q=rice', fetch)
+    assert ours.allowed('https://example.com/agriculture/private/x', fetch)
+    assert ours.crawl_delay('https://example.com/', fetch) == 7
+    assert fetch.calls == ['https://example.com/robots.txt']  # one fetch per host
+
+    generic = RobotsCache(str(tmp_path / 'other'), user_agent='SomeBot')
+    assert not generic.allowed('https://example.com/agriculture/private/x', fetch)
+    assert generic.crawl_delay('https://example.com/', fetch) == 3
+
+
+def test_disk_cache_and_ttl(tmp_path):
+    RobotsCache(str(tmp_path), ttl=3600).allowed('https://example.com/', Fetcher())
+
+    offline = Fetcher(status=None)
+    restarted = RobotsCache(str(tmp_path), ttl=3600)
+    assert not restarted.allowed('https://example.com/agriculture/private/x', offline)
+    assert offline.calls == []  # served from disk
+
+    expired = RobotsCache(str(tmp_path), ttl=0)
+    assert not expired.allowed('https://example.com/agriculture/private/x', offline)  # stale copy kept
+    assert offline.calls == ['https://example.com/robots.txt']
+
+
+def test_missing_and_failing_robots(tmp_path):
+    cache = RobotsCache(str(tmp_path))
+    assert cache.allowed('https://missing.example.com/anything', Fetcher(status=404))
+    assert not cache.allowed('https://down.example.com/anything', Fetcher(status=503))
+    assert cache.crawl_delay('https://missing.example.com/', Fetcher(status=404)) is None
+
+
+def test_host_throttle_spaces_requests_per_host():
+    throttle = HostThrottle()
+    assert throttle.reserve('a.example.com', 5) == 0
+    assert 4.9 < throttle.reserve('a.example.com', 5) <= 5
+    assert 9.9 < throttle.reserve('a.example.com', 5) <= 10
+    assert throttle.reserve('b.example.com', 5) == 0
+
+
+def test_scraper_skips_disallowed_urls(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'ROBOTS_ENABLED', True)
+    monkeypatch.setattr(config, 'ROBOTS_CACHE_DIR', str(tmp_path / 'robots'))
+    monkeypatch.setattr(config, 'FRONTIER_DB', None)
+    robots_fetch = Fetcher()
+
+    class RobotsScraper(MathrubhumiScraper):
+        def fetch_robots(self, url):
+            return robots_fetch(url)
+
+    scraper = RobotsScraper(MATHRUBHUMI_CONFIG)
+    links = ['https://www.mathrubhumi.com/agriculture/news/a', 'https://www.mathrubhumi.com/search?q=rubber']
+    assert scraper.detail_urls(links) == links[:1]
+    assert scraper.get_page(links[1]) is None and scraper.last_fetch_blocked
+    assert scraper.request_delay(links[0]) == 7  # our own group, not '*'
+    assert robots_fetch.calls == ['https://www.mathrubhumi.com/robots.txt']
+
+
+def test_crawl_delay_wait_is_sleep_not_fetch_latency(tmp_path, monkeypatch):
+    import time
+
+    import scrapers.base_scraper as base_scraper
+    import utils.robots
+    from utils.metrics import MetricsRegistry
+
+    class Response:
+        status_code = 200
+        content = b'<html></html>'
+        text = '<html></html>'
+
+        def raise_for_status(self):
+            pass
+
+    class SlowThrottle:
+        def wait(self, host, delay):
+            time.sleep(0.2)
+            return 0.2
+
+    monkeypatch.setattr(config, 'ROBOTS_ENABLED', True)
+    monkeypatch.setattr(config, 'ROBOTS_CACHE_DIR', str(tmp_path / 'robots'))
+    monkeypatch.setattr(config, 'FRONTIER_DB', None)
+    monkeypatch.setattr(base_scraper, 'metrics', MetricsRegistry())
+    monkeypatch.setattr(utils.robots, 'throttle', SlowThrottle())
+
+    class RobotsScraper(MathrubhumiScraper):
+        def fetch_robots(self, url):
+            return Fetcher()(url)
+
+    scraper = RobotsScraper(MATHRUBHUMI_CONFIG)
+    monkeypatch.setattr(scraper.session, 'get', lambda url, timeout=None: Response())
+    assert scraper.get_page('https://www.mathrubhumi.com/agriculture/news/a') == '<html></html>'
+
+    stages = base_scraper.metrics.snapshot()['stages']['Mathrubhumi Agriculture']
+    assert stages['sleep']['count'] == 1 and stages['sleep']['seconds'] >= 0.2
+    assert scraper.run_stats.fetches[0]['seconds'] < 0.2
@@ -0,0 +1,63 @@
+"""
+Run report - per-source JSON report contents, writing and retention
+"""
+import json
+import os
+import time
+
+from config.settings import config
+from config.sources import ALL_SOURCES
+from utils.run_report import RunReport, prune_reports
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'pages')
+
+
+def test_report_records_fetches_candidates_and_extractors(tmp_path, monkeypatch):
+    from multi_source_scraper import SimpleConsolidatedScraper
+
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    source_config = ALL_SOURCES['times_of_india_agriculture']
+    report = RunReport()
+    with report.track('times_of_india_agriculture', source_config) as entry:
+        entry.scraper = SimpleConsolidatedScraper(source_config)
+        entry.articles = entry.scraper.run()
+
+    path = report.write(str(tmp_path), retention_days=30, replay=True)
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    source = data['sources']['times_of_india_agriculture']
+    assert data['replay'] is True
+    assert source['ok'] and source['articles'] == len(entry.articles)
+    assert source['fetches'][0]['status'] == 200
+    assert source['fetches'][0]['bytes'] == source['bytes_fetched'] > 0
+    assert sum(source['extractors'].values()) == source['articles']
+    candidates = source['candidates']
+    assert candidates['considered'] == candidates['accepted'] + sum(candidates['rejected'].values())
+    assert set(source['stages']) >= {'fetch', 'parse', 'extract', 'sleep'}
+
+
+def test_failed_source_is_reported(tmp_path):
+    report = RunReport()
+    try:
+        with report.track('broken', {'name': 'Broken'}):
+            raise RuntimeError('boom')
+    except RuntimeError:
+        pass
+    assert report.sources['broken']['error'] == 'boom'
+    assert not report.sources['broken']['ok']
+
+
+def test_old_reports_are_pruned(tmp_path):
+    old = tmp_path / 'run_20000101_000000.json'
+    old.write_text('{}')
+    stale = time.time() - 40 * 86400
+    os.utime(old, (stale, stale))
+    keep = tmp_path / 'notes.json'
+    keep.write_text('{}')
+
+    path = RunReport().write(str(tmp_path), retention_days=30)
+
+    assert not old.exists()
+    assert keep.exists() and os.path.exists(path)
+    assert prune_reports(str(tmp_path), 30) == []
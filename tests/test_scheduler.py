@@ -0,0 +1,86 @@
+"""
+Adaptive schedule and daemon crawls
+"""
+from config.settings import config
+from utils.scheduler import AdaptiveSchedule, content_fingerprint
+
+HOUR = 3600
+
+
+def make_schedule(state_file=None):
+    return AdaptiveSchedule(15 * 60, 7 * 24 * HOUR, HOUR, state_file=state_file)
+
+
+def test_interval_backs_off_when_stable_and_speeds_up_on_change():
+    schedule = make_schedule()
+    schedule.add('feed', now=0)
+
+    assert schedule.record('feed', 'v1', now=0)  # first observation never adapts
+    assert schedule.entries['feed']['interval'] == HOUR
+    assert not schedule.record('feed', 'v1', now=HOUR)
+    assert schedule.entries['feed']['interval'] == 1.5 * HOUR
+    assert schedule.record('feed', 'v2', now=3 * HOUR)
+    assert schedule.entries['feed']['interval'] == 0.75 * HOUR
+    assert schedule.entries['feed']['next_run'] == 3.75 * HOUR
+
+
+def test_interval_stays_within_bounds():
+    schedule = make_schedule()
+    schedule.add('schemes', interval=30 * 24 * HOUR, now=0)
+    assert schedule.entries['schemes']['interval'] == 7 * 24 * HOUR
+
+    schedule.add('busy', interval=60, now=0)
+    assert schedule.entries['busy']['interval'] == 15 * 60
+
+
+def test_due_and_failures():
+    schedule = make_schedule()
+    schedule.add('a', now=0)
+    schedule.add('b', now=0)
+    schedule.record('a', 'x', now=0)
+    assert schedule.due(now=1) == ['b']
+
+    schedule.record_failure('b', now=1)
+    assert schedule.entries['b']['interval'] == HOUR
+    assert schedule.entries['b']['next_run'] == 1 + 15 * 60
+    assert schedule.seconds_until_next(now=1) == 15 * 60
+
+
+def test_learned_state_survives_restart(tmp_path):
+    state_file = str(tmp_path / 'schedule.json')
+    schedule = make_schedule(state_file)
+    schedule.add('feed', now=0)
+    schedule.record('feed', 'v1', now=0)
+    schedule.record('feed', 'v1', now=HOUR)
+
+    restarted = make_schedule(state_file)
+    entry = restarted.add('feed', interval=HOUR, now=10 * HOUR)
+    assert entry['interval'] == 1.5 * HOUR
+    assert entry['next_run'] == 10 * HOUR
+    assert restarted.due(now=10 * HOUR) == ['feed']
+
+
+def test_fingerprint_ignores_order_and_scrape_time():
+    a = {'title': 'Rain alert', 'content': 'Heavy rain', 'scraped_at': '1'}
+    b = {'title': 'Copra price', 'content': 'Up 5%', 'scraped_at': '2'}
+    assert content_fingerprint([a, b]) == content_fingerprint([dict(b, scraped_at='3'), a])
+    assert content_fingerprint([a]) != content_fingerprint([a, b])
+
+
+def test_daemon_recrawl_of_unchanged_page_backs_off(tmp_path, monkeypatch):
+    from daemon import ScraperDaemon
+    from tests.test_extractors import FIXTURES_DIR
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    monkeypatch.setattr(config, 'REPORTS_DIR', None)
+    monkeypatch.setattr(config, 'METRICS_FILE', None)
+    daemon = ScraperDaemon(schedule=make_schedule())
+
+    assert daemon.crawl('times_of_india_agriculture')
+    scraper = daemon.scrapers['times_of_india_agriculture']
+    assert not daemon.crawl('times_of_india_agriculture')
+
+    assert daemon.scrapers['times_of_india_agriculture'] is scraper
+    assert daemon.schedule.entries['times_of_india_agriculture']['interval'] == 1.5 * HOUR
+    assert (tmp_path / 'output2' / 'news.txt').exists()
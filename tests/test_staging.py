@@ -0,0 +1,69 @@
+"""
+Staging and publishing - a failed source leaves nothing behind, output2 files are replaced whole
+"""
+import os
+
+import pytest
+
+from config.settings import config
+from tests.test_extractors import FIXTURES_DIR
+from utils.article import Article
+from utils.file_manager import FileManager
+from utils.staging import StagingArea
+
+NEWS = {'name': 'Times of India Agriculture', 'category': 'news_agriculture', 'language': 'english'}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in tmp_path (output2/ and state/ are relative) against the replay fixtures"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, 'REPLAY_DIR', FIXTURES_DIR)
+    monkeypatch.setattr(config, 'REPORTS_DIR', None)
+    monkeypatch.setattr(config, 'METRICS_FILE', None)
+    monkeypatch.setattr(config, 'LOG_TO_FILE', False)
+    return tmp_path
+
+
+def test_source_failing_mid_run_stages_nothing(workdir, monkeypatch):
+    import multi_source_scraper
+
+    def create_scraper(source_name, source_config=None):
+        scraper = real_create_scraper(source_name, source_config)
+        if source_name == 'times_of_india_agriculture':
+            def run():
+                scraper.scrape_articles()  # pages fetched and extracted, then the source fails
+                raise RuntimeError("connection reset")
+            scraper.run = run
+        return scraper
+
+    real_create_scraper = multi_source_scraper.create_scraper
+    monkeypatch.setattr(multi_source_scraper, 'create_scraper', create_scraper)
+    result = multi_source_scraper.main()
+
+    sources = {article['source'] for article in result['total_articles']}
+    assert 'Times of India Agriculture' not in sources and 'Economic Times Agriculture' in sources
+    news = (workdir / 'output2' / 'news.txt').read_text(encoding='utf-8')
+    assert 'SOURCE: Times of India Agriculture' not in news
+    assert not (workdir / 'output').exists()  # no per-source temp files either
+    assert sorted(os.listdir(workdir / 'output2')) == ['news.txt', 'schemes.txt']
+
+
+def test_consolidated_file_is_replaced_only_when_complete(workdir):
+    class Broken(Article):
+        __slots__ = ()
+
+        def get(self, key, default=None):
+            raise OSError("disk full")
+
+    file_manager = FileManager()
+    staging = StagingArea(file_manager)
+    staging.add('times_of_india_agriculture', NEWS, [Article('https://x/1', NEWS, 'Paddy prices rise', 'Body')])
+    assert file_manager.save_news_consolidated(staging.news_articles) == 'output2/news.txt'
+    published = (workdir / 'output2' / 'news.txt').read_text(encoding='utf-8')
+    assert 'TITLE: Paddy prices rise' in published
+
+    failing = staging.news_articles + [Broken('https://x/2', NEWS, 'Rubber', 'Body')]
+    assert file_manager.save_news_consolidated(failing) is None
+    assert (workdir / 'output2' / 'news.txt').read_text(encoding='utf-8') == published
+    assert os.listdir(workdir / 'output2') == ['news.txt']
@@ -0,0 +1,44 @@
+"""
+CLI startup - config-only commands must not import HTTP/HTML libraries or scrapers
+
+Uses `python -X importtime`; STARTUP_BUDGET_MS overrides the import-time budget.
+"""
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS = float(os.environ.get('STARTUP_BUDGET_MS', 60))
+HEAVY_MODULES = ('requests', 'urllib3', 'bs4', 'sqlite3', 'zstandard', 'multi_source_scraper', 'scrapers.base_scraper')
+
+
+def imported_modules(args, cwd):
+    """{module: self time in microseconds} from -X importtime"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        cwd=cwd, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def test_list_does_not_import_heavy_modules(tmp_path):
+    modules = imported_modules([os.path.join(ROOT_DIR, 'main.py'), '--list'], str(tmp_path))
+
+    assert 'config.sources' in modules
+    assert [name for name in HEAVY_MODULES if name in modules] == []
+    assert not (tmp_path / 'output').exists() and not (tmp_path / 'logs').exists()
+
+
+def test_list_import_time_within_budget(tmp_path):
+    baseline = imported_modules(['-c', 'pass'], str(tmp_path))
+    modules = imported_modules([os.path.join(ROOT_DIR, 'main.py'), '--list'], str(tmp_path))
+
+    extra_ms = sum(us for name, us in modules.items() if name not in baseline) / 1000
+    assert extra_ms < BUDGET_MS, f"--list imports took {extra_ms:.1f} ms (budget {BUDGET_MS} ms)"
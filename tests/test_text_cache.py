@@ -0,0 +1,68 @@
+"""
+Normalization cache - LRU eviction, stats, sharing across threads, and unchanged scraper output
+"""
+import threading
+
+from scrapers.base_scraper import clean_text, refine_text
+from utils.metrics import MetricsRegistry
+from utils.text_cache import NormalizationCache
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = NormalizationCache(maxsize=2, max_chars=20)
+    calls = []
+
+    def upper(text):
+        calls.append(text)
+        return text.upper()
+
+    assert cache.get('upper', 'paddy', upper) == 'PADDY'
+    cache.get('upper', 'rubber', upper)
+    assert cache.get('upper', 'paddy', upper) == 'PADDY'  # hit; 'rubber' is now the oldest
+    cache.get('upper', 'copra', upper)
+    cache.get('upper', 'rubber', upper)
+    assert calls == ['paddy', 'rubber', 'copra', 'rubber']
+    assert cache.get('other', 'paddy', str.title) == 'Paddy'  # keyed by kind as well as text
+
+    cache.get('upper', 'a long article body past max_chars', upper)
+    assert cache.stats() == {'hits': 1, 'misses': 5, 'hit_rate': 0.1667, 'size': 2, 'evictions': 3}
+
+    registry = MetricsRegistry()
+    cache.export_metrics(registry)
+    cache.export_metrics(registry)  # only lookups since the last export are added
+    assert registry.snapshot()['counters']['cache_hits_total'] == {'{cache="normalize"}': 1}
+    assert registry.snapshot()['counters']['cache_misses_total'] == {'{cache="normalize"}': 5}
+
+
+def test_disabled_cache_always_calls_through():
+    cache = NormalizationCache(maxsize=0)
+    assert cache.get('clean', ' a  b ', clean_text) == 'a b'
+    assert cache.stats()['size'] == 0 and cache.stats()['misses'] == 0
+
+
+def test_shared_across_threads():
+    cache = NormalizationCache(maxsize=50, max_chars=100)
+    texts = [f"  Share this  paragraph {i % 80}  " for i in range(400)]
+    expected = [refine_text(text) for text in texts]
+    results = {}
+
+    def worker(index):
+        results[index] = [cache.get('refine', text, refine_text) for text in texts]
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(result == expected for result in results.values())
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 8 * 400 and stats['size'] <= 50
+
+
+def test_corpus_output_is_unchanged_by_the_cache():
+    from benchmarks.normalize_bench import run_benchmark
+
+    report = run_benchmark(passes=2)
+    assert report['identical'] and report['articles']
+    assert report['cache']['hits'] > 0
@@ -0,0 +1,132 @@
+"""
+Article record - one scraped article or scheme, compact and dict-compatible
+
+    article = Article(url, source_config, title, content, keywords=scraper.extract_keywords)
+    article.title, article['title'], article.get('date', '')   # all work
+    dict(article)                                             # plain dict (JSON, reports)
+
+Fields live in __slots__ (no per-record __dict__). source, category and
+language are interned, so a corpus holds one copy of each. scraped_at is
+kept as a timestamp and formatted when read. keywords may be given as a
+function of the text, run the first time they are read. The optional
+fields (date, author, images) only show up as keys when they were set.
+"""
+import sys
+import time
+from datetime import datetime
+
+FIELDS = ('url', 'source', 'category', 'language', 'scraped_at', 'title', 'content', 'keywords')
+OPTIONAL_FIELDS = ('date', 'author', 'images')
+
+
+class Article:
+    """Scraped article with attribute and mapping access"""
+
+    __slots__ = ('url', 'source', 'category', 'language', '_scraped_at', 'title', 'content', '_keywords',
+                 'date', 'author', 'images')
+
+    def __init__(self, url, source_config, title, content, keywords=None, scraped_at=None,
+                 date=None, author=None, images=None):
+        """keywords: a list, or a function of "title content" called on first read"""
+        self.url = url
+        self.source = sys.intern(source_config['name'])
+        self.category = sys.intern(source_config['category'])
+        self.language = sys.intern(source_config['language'])
+        self._scraped_at = time.time() if scraped_at is None else scraped_at
+        self.title = title
+        self.content = content
+        self._keywords = keywords
+        self.date = date
+        self.author = author
+        self.images = images
+
+    @classmethod
+    def from_dict(cls, data):
+        """Article from a dict with the usual keys (scraped_at as an ISO string)"""
+        scraped_at = data.get('scraped_at')
+        if isinstance(scraped_at, str):
+            scraped_at = datetime.fromisoformat(scraped_at).timestamp()
+        source_config = {'name': data.get('source', ''), 'category': data.get('category', ''),
+                         'language': data.get('language', '')}
+        return cls(
+            data.get('url', ''), source_config, data.get('title', ''), data.get('content', ''),
+            keywords=data.get('keywords'), scraped_at=scraped_at,
+            date=data.get('date'), author=data.get('author'), images=data.get('images')
+        )
+
+    @property
+    def scraped_at(self):
+        return datetime.fromtimestamp(self._scraped_at).isoformat()
+
+    @property
+    def keywords(self):
+        if callable(self._keywords):
+            self._keywords = self._keywords(self.title + " " + self.content)
+        return self._keywords if self._keywords is not None else []
+
+    @keywords.setter
+    def keywords(self, value):
+        self._keywords = value
+
+    # ------------------------------------------------------------------ dict compatibility
+
+    def keys(self):
+        return list(FIELDS) + [name for name in OPTIONAL_FIELDS if getattr(self, name) is not None]
+
+    def __getitem__(self, key):
+        if key not in FIELDS and (key not in OPTIONAL_FIELDS or getattr(self, key) is None):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in FIELDS and key not in OPTIONAL_FIELDS:
+            raise KeyError(key)
+        if key == 'scraped_at':
+            value = datetime.fromisoformat(value).timestamp()
+            key = '_scraped_at'
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in FIELDS or (key in OPTIONAL_FIELDS and getattr(self, key) is not None)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, (Article, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Article({self.url!r}, title={self.title[:40]!r})"
+
+    # Keywords are resolved before pickling (a keyword function is usually a bound scraper method)
+    def __getstate__(self):
+        self._keywords = self.keywords
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        for name in ('source', 'category', 'language'):
+            setattr(self, name, sys.intern(getattr(self, name)))
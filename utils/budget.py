@@ -0,0 +1,100 @@
+"""
+Run budget - fit a multi-source run into a fixed time window
+
+Sources say how much they matter and roughly how long they take:
+
+    "priority": 10,            # higher runs first (default BUDGET_DEFAULT_PRIORITY)
+    "expected_seconds": 60     # typical run time (default BUDGET_DEFAULT_SECONDS)
+
+    planner = RunPlanner(ALL_SOURCES, budget=1800)
+    for source_name in planner.order:
+        deadline = planner.start(source_name)    # time.monotonic() value, None without a budget
+        if planner.is_deferred(source_name):     # too little time left: next run
+            continue
+        scraper.deadline = deadline
+        ...
+        planner.finish(source_name)
+
+Sources run highest priority first, cheaper first among equals. A source may
+use whatever the sources after it are not expected to need, and never less
+than an equal share of what is left, so one stalled source cannot starve the
+rest. Without a budget the order still applies but there are no deadlines.
+"""
+import time
+
+from config.settings import config
+
+
+class RunPlanner:
+    """Priority order and per-source deadlines within one run's time budget"""
+
+    def __init__(self, sources, budget=None, min_seconds=None, clock=time.monotonic):
+        self.sources = sources
+        self.budget = budget
+        self.min_seconds = config.BUDGET_MIN_SECONDS if min_seconds is None else min_seconds
+        self.clock = clock
+        self.started_at = clock()
+        self.order = sorted(sources, key=lambda name: (-self.priority(name), self.expected(name)))
+        self.pending = list(self.order)
+        self.allowances = {}  # source -> seconds it was given
+        self.started = {}     # source -> clock time it started
+        self.spent = {}       # source -> seconds it took
+        self.deferred = []
+
+    def priority(self, source_name):
+        return self.sources[source_name].get('priority', config.BUDGET_DEFAULT_PRIORITY)
+
+    def expected(self, source_name):
+        return self.sources[source_name].get('expected_seconds', config.BUDGET_DEFAULT_SECONDS)
+
+    def remaining(self):
+        """Seconds left in the budget (None when unlimited)"""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - (self.clock() - self.started_at))
+
+    def allowance(self, source_name):
+        """Seconds source_name may take if it starts now"""
+        remaining = self.remaining()
+        if remaining is None:
+            return None
+        rest = [name for name in self.pending if name != source_name]
+        reserved = sum(self.expected(name) for name in rest)
+        return max(remaining - reserved, remaining / (len(rest) + 1))
+
+    def start(self, source_name):
+        """Deadline (clock time) for source_name, or None without a budget
+
+        With less than min_seconds left the source is deferred instead (see
+        is_deferred) and None is returned.
+        """
+        if source_name in self.pending:
+            self.pending.remove(source_name)
+        self.started[source_name] = now = self.clock()
+        allowance = self.allowance(source_name)
+        if allowance is None:
+            return None
+        if allowance < self.min_seconds:
+            self.deferred.append(source_name)
+            return None
+        self.allowances[source_name] = allowance
+        return now + allowance
+
+    def is_deferred(self, source_name):
+        return source_name in self.deferred
+
+    def finish(self, source_name, seconds=None):
+        if seconds is None:
+            seconds = self.clock() - self.started[source_name]
+        self.spent[source_name] = seconds
+
+    def summary(self):
+        """{'budget', 'used', 'order', 'allowances', 'spent', 'deferred'} for the run report"""
+        return {
+            'budget': self.budget,
+            'used': round(self.clock() - self.started_at, 4),
+            'order': self.order,
+            'allowances': {name: round(seconds, 4) for name, seconds in self.allowances.items()},
+            'spent': {name: round(seconds, 4) for name, seconds in self.spent.items()},
+            'deferred': list(self.deferred),
+        }
@@ -0,0 +1,126 @@
+"""
+Circuit breaker - stop requesting hosts that keep failing
+
+    breaker = CircuitBreaker.shared('state/breakers.json')
+    if breaker.allow(host):
+        ...fetch...
+        breaker.record_success(host)   # or record_failure(host)
+
+Per host: after failure_threshold consecutive failures the circuit opens and
+requests fail fast for cooldown seconds. Then one probe request is let
+through (half-open); its success closes the circuit, its failure opens it for
+another cooldown. Open circuits are kept in a JSON state file, so the next
+cron or daemon run skips a host that is known to be down.
+"""
+import json
+import os
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Per-host closed/open/half-open state shared by every scraper in the process"""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, state_file=None, failure_threshold=3, cooldown=600):
+        self.state_file = state_file
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self.hosts = self._load()  # host -> {'state', 'failures', 'opened_at', 'probing'}
+
+    @classmethod
+    def shared(cls, state_file, **kwargs):
+        """One breaker per state file for the whole process"""
+        key = os.path.abspath(state_file)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(state_file, **kwargs)
+            return cls._shared[key]
+
+    def _load(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                hosts = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        for entry in hosts.values():
+            entry['probing'] = False  # a probe in flight did not survive the restart
+        return hosts
+
+    def save(self):
+        if not self.state_file:
+            return
+        directory = os.path.dirname(self.state_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.hosts, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_file)
+
+    def _entry(self, host):
+        return self.hosts.setdefault(host, {'state': CLOSED, 'failures': 0, 'opened_at': None, 'probing': False})
+
+    def state(self, host, now=None):
+        """closed, open, or half_open (open and past its cooldown)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self.hosts.get(host)
+            if not entry:
+                return CLOSED
+            if entry['state'] == OPEN and now - entry['opened_at'] >= self.cooldown:
+                return HALF_OPEN
+            return entry['state']
+
+    def allow(self, host, now=None):
+        """True when a request to host may go out; in half-open state only one probe at a time"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self.hosts.get(host)
+            if not entry or entry['state'] == CLOSED:
+                return True
+            if now - entry['opened_at'] < self.cooldown or entry['probing']:
+                return False
+            entry['state'] = HALF_OPEN
+            entry['probing'] = True
+            return True
+
+    def record_success(self, host):
+        with self._lock:
+            entry = self.hosts.get(host)
+            if not entry:
+                return
+            was_open = entry['state'] != CLOSED
+            entry.update(state=CLOSED, failures=0, opened_at=None, probing=False)
+            if was_open:
+                self.save()
+
+    def record_failure(self, host, now=None):
+        """Count a failure; returns True when this opened (or re-opened) the circuit"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(host)
+            entry['failures'] += 1
+            if entry['state'] == HALF_OPEN or entry['failures'] >= self.failure_threshold:
+                entry.update(state=OPEN, opened_at=now, probing=False)
+                self.save()
+                return True
+            return False
+
+    def open_hosts(self, now=None):
+        """{host: seconds until a probe is allowed} for circuits that are open"""
+        now = time.time() if now is None else now
+        with self._lock:
+            return {
+                host: max(0.0, self.cooldown - (now - entry['opened_at']))
+                for host, entry in self.hosts.items() if entry['state'] != CLOSED
+            }
@@ -0,0 +1,158 @@
+"""
+Publication dates - English and Malayalam date strings to UTC
+
+    parse_date('Updated: Feb 3, 2025, 10:30 AM IST')         # 2025-02-03 05:00:00+00:00
+    parse_date('2025 ഫെബ്രുവരി 3, രാവിലെ 10.30')             # same instant
+    parse_date('3 മണിക്കൂർ മുമ്പ്', now=...)                    # relative, from now
+    to_utc_iso(parse_date(text))                               # '' when unparseable
+
+Understood: ISO 8601, RFC 822, "3 Feb 2025", "February 3, 2025", "2025 Feb 3",
+DD/MM/YYYY, Malayalam month names and digits, and "N minutes/hours/days ago"
+in either language. Times without a zone are taken as IST.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+MALAYALAM_MONTHS = {
+    'ജനുവരി': 'jan', 'ഫെബ്രുവരി': 'feb', 'മാർച്ച്': 'mar', 'ഏപ്രിൽ': 'apr', 'മേയ്': 'may', 'മെയ്': 'may',
+    'ജൂൺ': 'jun', 'ജൂലൈ': 'jul', 'ഓഗസ്റ്റ്': 'aug', 'ആഗസ്റ്റ്': 'aug', 'സെപ്റ്റംബർ': 'sep',
+    'സെപ്തംബർ': 'sep', 'ഒക്ടോബർ': 'oct', 'നവംബർ': 'nov', 'ഡിസംബർ': 'dec',
+}
+
+# Malayalam time-of-day words before the clock time
+MALAYALAM_PERIODS = {'രാവിലെ': 'am', 'ഉച്ചയ്ക്ക്': 'pm', 'ഉച്ചക്ക്': 'pm', 'വൈകിട്ട്': 'pm',
+                     'വൈകുന്നേരം': 'pm', 'രാത്രി': 'pm'}
+
+MALAYALAM_UNITS = {'മിനിറ്റ്': 'minute', 'മണിക്കൂർ': 'hour', 'ദിവസം': 'day'}
+
+# Old-style chillu letters (consonant + virama + ZWJ) and the atomic forms used above
+CHILLU = {'\u0d30\u0d4d\u200d': 'ർ', '\u0d28\u0d4d\u200d': 'ൻ', '\u0d32\u0d4d\u200d': 'ൽ', '\u0d33\u0d4d\u200d': 'ൾ', '\u0d23\u0d4d\u200d': 'ൺ'}
+
+_MALAYALAM_DIGITS = str.maketrans('൦൧൨൩൪൫൬൭൮൯', '0123456789')
+_word = '[A-Za-z]{3,9}'
+_iso_pattern = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2}))?(?:\.\d+)?)?\s*(Z|[+-]\d{2}:?\d{2})?'
+)
+_date_patterns = (
+    ('dmy', re.compile(rf'\b(\d{{1,2}})(?:st|nd|rd|th)?[\s-]+({_word})\.?,?[\s-]+(\d{{4}})')),
+    ('mdy', re.compile(rf'\b({_word})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?,?\s+(\d{{4}})')),
+    ('ymd', re.compile(rf'\b(\d{{4}})\s+({_word})\.?\s+(\d{{1,2}})\b')),
+    ('numeric', re.compile(r'\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})\b')),
+)
+_time_pattern = re.compile(r'\b(\d{1,2})[:.](\d{2})(?:[:.](\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)?', re.IGNORECASE)
+_relative_pattern = re.compile(r'\b(\d+)\s*(minute|min|hour|hr|day)s?\s+ago\b', re.IGNORECASE)
+_zone_pattern = re.compile(r'\b(IST|GMT|UTC)\b|([+-]\d{2}):?(\d{2})\s*$')
+
+
+def normalize(text):
+    """Malayalam digits, month names and period words replaced by their English forms"""
+    for old, new in CHILLU.items():
+        text = text.replace(old, new)
+    text = text.replace('\u200d', '').replace('\u200c', '').translate(_MALAYALAM_DIGITS)  # ZWJ / ZWNJ
+    for table in (MALAYALAM_MONTHS, MALAYALAM_PERIODS):
+        for word in sorted(table, key=len, reverse=True):
+            text = text.replace(word, f' {table[word]} ')
+    for word, unit in MALAYALAM_UNITS.items():
+        text = re.sub(rf'(\d+)\s*{word}\s*(?:മുമ്പ്|മുൻപ്)', rf'\1 {unit} ago', text)
+    return ' '.join(text.split())
+
+
+def _zone(text):
+    match = _zone_pattern.search(text)
+    if not match:
+        return IST
+    if match.group(1):
+        return IST if match.group(1) == 'IST' else timezone.utc
+    hours, minutes = int(match.group(2)), int(match.group(3))
+    return timezone(timedelta(hours=hours, minutes=minutes if hours >= 0 else -minutes))
+
+
+def _clock(text, period_before=None):
+    """(hour, minute, second) of the first clock time in text, or None"""
+    match = _time_pattern.search(text)
+    if not match:
+        return None
+    hour, minute, second = int(match.group(1)), int(match.group(2)), int(match.group(3) or 0)
+    period = (match.group(4) or period_before or '').lower().replace('.', '')
+    if period == 'pm' and hour < 12:
+        hour += 12
+    elif period == 'am' and hour == 12:
+        hour = 0
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return hour, minute, second
+
+
+def parse_date(text, now=None):
+    """Timezone-aware UTC datetime for a date string, or None"""
+    if not text:
+        return None
+    if isinstance(text, datetime):
+        moment = text if text.tzinfo else text.replace(tzinfo=IST)
+        return moment.astimezone(timezone.utc)
+    text = normalize(str(text))
+
+    relative = _relative_pattern.search(text)
+    if relative:
+        amount, unit = int(relative.group(1)), relative.group(2).lower()
+        unit = {'min': 'minute', 'hr': 'hour'}.get(unit, unit)
+        now = now or datetime.now(timezone.utc)
+        return (now - timedelta(**{f"{unit}s": amount})).astimezone(timezone.utc)
+
+    iso = _iso_pattern.search(text)
+    if iso:
+        value = iso.group(0).replace(' ', 'T', 1).replace('Z', '+00:00')
+        try:
+            moment = datetime.fromisoformat(value.strip())
+        except ValueError:
+            moment = None
+        if moment:
+            return (moment if moment.tzinfo else moment.replace(tzinfo=IST)).astimezone(timezone.utc)
+
+    try:
+        moment = parsedate_to_datetime(text)
+        return (moment if moment.tzinfo else moment.replace(tzinfo=IST)).astimezone(timezone.utc)
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    for kind, pattern in _date_patterns:
+        match = pattern.search(text)
+        if not match:
+            continue
+        if kind == 'numeric':
+            day, month, year = (int(g) for g in match.groups())
+        else:
+            groups = match.groups()
+            if kind == 'dmy':
+                day, name, year = groups
+            elif kind == 'mdy':
+                name, day, year = groups
+            else:
+                year, name, day = groups
+            month = MONTHS.get(name.lower()[:4]) or MONTHS.get(name.lower()[:3])
+            if not month:
+                continue
+            day, year = int(day), int(year)
+        period_before = re.findall(r'\b(am|pm)\b', text[:match.start()] + text[match.end():])
+        period_before = period_before[0] if period_before else None
+        hour, minute, second = (_clock(text[match.end():], period_before)
+                                or _clock(text[:match.start()], period_before) or (0, 0, 0))
+        try:
+            moment = datetime(year, month, day, hour, minute, second, tzinfo=_zone(text))
+        except ValueError:
+            continue
+        return moment.astimezone(timezone.utc)
+    return None
+
+
+def to_utc_iso(moment):
+    """'2025-02-03T05:00:00+00:00' for a datetime, '' for None"""
+    return moment.astimezone(timezone.utc).isoformat() if moment else ''
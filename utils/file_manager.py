@@ -4,6 +4,7 @@ File Manager - Create output2 at root level and delete output folder after conso
 import os
 import json
 import shutil
+from contextlib import contextmanager
 from datetime import datetime
 
 class FileManager:
@@ -13,17 +14,27 @@ class FileManager:
         self.setup_directories()
         
     def setup_directories(self):
-        """Create directories"""
-        os.makedirs('output', exist_ok=True)
-        os.makedirs('output/daily', exist_ok=True)
-        os.makedirs('output/consolidated', exist_ok=True)
+        """Create the final output directory (output/daily is created only when a snapshot is written)"""
         os.makedirs('output2', exist_ok=True)  # Create output2 at root level (same as config)
     
+    @contextmanager
+    def publishing(self, filename):
+        """Write to a temp file and replace filename only once the whole file is written"""
+        tmp_path = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                yield f
+            os.replace(tmp_path, filename)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
     def save_articles_to_text(self, articles, source_name):
-        """Save articles to individual text file in output/daily (temporary)"""
+        """Save articles to individual text file in output/daily (per-source snapshot)"""
         if not articles:
             return None
         
+        os.makedirs('output/daily', exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"output/daily/{source_name}_{timestamp}.txt"
         
@@ -62,7 +73,7 @@ class FileManager:
         filename = "output2/news.txt"  # Root level output2
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
+            with self.publishing(filename) as f:
                 f.write("AGRICULTURE NEWS CONSOLIDATED\n")
                 f.write("Economic Times + Times of India\n")
                 f.write("=" * 70 + "\n")
@@ -110,7 +121,7 @@ class FileManager:
         filename = "output2/schemes.txt"  # Root level output2
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
+            with self.publishing(filename) as f:
                 f.write("AGRICULTURE SCHEMES CONSOLIDATED\n")
                 f.write("Government Schemes for Farmers\n")
                 f.write("=" * 70 + "\n")
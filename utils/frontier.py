@@ -0,0 +1,264 @@
+"""
+Crawl frontier - persistent per-source URL queue for detail-page crawlers
+
+    frontier = CrawlFrontier.shared('state/frontier.sqlite')
+    frontier.add_many('Mathrubhumi Agriculture', links)      # new links are queued
+    for url in frontier.claim('Mathrubhumi Agriculture', 10):
+        ...
+        frontier.mark_done('Mathrubhumi Agriculture', url, status=200)
+
+Every known URL has a row in SQLite with its fetch state (queued, in_progress,
+done, failed). A Bloom filter in front answers "never seen" without touching
+the database, which is the common case for links found on a listing page.
+Rows left in_progress by a crash or SIGTERM are claimed again first on the
+next run, so an interrupted crawl resumes instead of starting over.
+
+Listing sources whose items have no URL of their own record content digests
+instead (add_items / seen_item), which paginated listings use to stop early.
+Each source also keeps a publication-date high-water mark (watermark /
+advance_watermark): listing entries older than it are not fetched.
+"""
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    priority INTEGER NOT NULL DEFAULT 0,
+    discovered_at TEXT NOT NULL,
+    fetched_at TEXT,
+    status INTEGER,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    PRIMARY KEY (source, url)
+);
+CREATE INDEX IF NOT EXISTS idx_urls_queue ON urls (source, state, priority DESC, discovered_at);
+CREATE TABLE IF NOT EXISTS items (
+    source TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    PRIMARY KEY (source, digest)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    source TEXT PRIMARY KEY,
+    published TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+STATES = ('queued', 'in_progress', 'done', 'failed')
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter; no false negatives, false positives at ~error_rate"""
+
+    def __init__(self, capacity=100000, error_rate=0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class CrawlFrontier:
+    """SQLite-backed URL state per source with a Bloom filter front"""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path, bloom_capacity=100000, max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+        total = self.db.execute('SELECT COUNT(*) FROM urls').fetchone()[0]
+        self.bloom = BloomFilter(max(bloom_capacity, total * 2))
+        for row in self.db.execute('SELECT source, url FROM urls'):
+            self.bloom.add(self._key(row['source'], row['url']))
+        self.resumed = self.requeue_interrupted()
+
+    @classmethod
+    def shared(cls, path, **kwargs):
+        """One frontier instance per database file for the whole process"""
+        key = os.path.abspath(path)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(path, **kwargs)
+            return cls._shared[key]
+
+    @staticmethod
+    def _key(source, url):
+        return f"{source}\t{url}"
+
+    def _grow_bloom(self):
+        """Rebuild a larger filter once it holds more keys than it was sized for"""
+        bloom = BloomFilter(self.bloom.capacity * 2, self.bloom.error_rate)
+        for row in self.db.execute('SELECT source, url FROM urls'):
+            bloom.add(self._key(row['source'], row['url']))
+        self.bloom = bloom
+
+    def requeue_interrupted(self):
+        """Put URLs claimed by a run that never finished back in the queue"""
+        with self._lock, self.db:
+            return self.db.execute("UPDATE urls SET state = 'queued' WHERE state = 'in_progress'").rowcount
+
+    # ------------------------------------------------------------------ queue
+
+    def add(self, source, url, priority=0):
+        """Queue a URL unless it is already known; returns True when it was new"""
+        return self.add_many(source, [url], priority) == 1
+
+    def add_many(self, source, urls, priority=0):
+        """Queue unknown URLs; earlier URLs in the list get higher priority. Returns the number added"""
+        now = datetime.now(timezone.utc).isoformat()
+        rows = []
+        with self._lock:
+            for index, url in enumerate(urls):
+                key = self._key(source, url)
+                if key in self.bloom and self.known(source, url):
+                    continue
+                rows.append((source, url, priority * 1000000 - index, now))
+            with self.db:
+                added = self.db.executemany(
+                    'INSERT OR IGNORE INTO urls (source, url, priority, discovered_at) VALUES (?, ?, ?, ?)', rows
+                ).rowcount
+            for source_, url, _, _ in rows:
+                self.bloom.add(self._key(source_, url))
+            if self.bloom.count > self.bloom.capacity:
+                self._grow_bloom()
+        return max(added, 0) if rows else 0
+
+    def known(self, source, url):
+        with self._lock:
+            return self.db.execute('SELECT 1 FROM urls WHERE source = ? AND url = ?', (source, url)).fetchone() is not None
+
+    def state(self, source, url):
+        """Fetch state of a URL, or None if it was never seen"""
+        if self._key(source, url) not in self.bloom:
+            return None
+        with self._lock:
+            row = self.db.execute('SELECT state FROM urls WHERE source = ? AND url = ?', (source, url)).fetchone()
+        return row['state'] if row else None
+
+    def seen(self, source, url):
+        """True when the URL was already fetched successfully"""
+        return self.state(source, url) == 'done'
+
+    def claim(self, source, limit=10):
+        """Mark up to limit queued URLs in_progress and return them, highest priority first"""
+        with self._lock, self.db:
+            rows = self.db.execute(
+                "SELECT url FROM urls WHERE source = ? AND state = 'queued' "
+                "ORDER BY priority DESC, discovered_at LIMIT ?",
+                (source, limit)
+            ).fetchall()
+            urls = [row['url'] for row in rows]
+            self.db.executemany(
+                "UPDATE urls SET state = 'in_progress' WHERE source = ? AND url = ?",
+                [(source, url) for url in urls]
+            )
+        return urls
+
+    def mark_done(self, source, url, status=200):
+        with self._lock, self.db:
+            self.db.execute(
+                "UPDATE urls SET state = 'done', status = ?, fetched_at = ?, attempts = attempts + 1, error = NULL "
+                "WHERE source = ? AND url = ?",
+                (status, datetime.now(timezone.utc).isoformat(), source, url)
+            )
+
+    def mark_failed(self, source, url, error=None, status=None):
+        """Failed URLs are queued again until max_attempts, then parked as failed"""
+        with self._lock, self.db:
+            self.db.execute(
+                "UPDATE urls SET attempts = attempts + 1, error = ?, status = ?, fetched_at = ?, "
+                "state = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'queued' END "
+                "WHERE source = ? AND url = ?",
+                (error, status, datetime.now(timezone.utc).isoformat(), self.max_attempts, source, url)
+            )
+
+    def release(self, source, urls):
+        """Return claimed but unprocessed URLs to the queue (e.g. after a stop request)"""
+        with self._lock, self.db:
+            self.db.executemany(
+                "UPDATE urls SET state = 'queued' WHERE source = ? AND url = ? AND state = 'in_progress'",
+                [(source, url) for url in urls]
+            )
+
+    # ------------------------------------------------------------------ listing items
+
+    def add_items(self, source, digests):
+        """Record content digests of ingested listing items; returns the number that were new"""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock, self.db:
+            return self.db.executemany(
+                'INSERT OR IGNORE INTO items (source, digest, ingested_at) VALUES (?, ?, ?)',
+                [(source, digest, now) for digest in digests]
+            ).rowcount
+
+    def seen_item(self, source, digest):
+        with self._lock:
+            return self.db.execute(
+                'SELECT 1 FROM items WHERE source = ? AND digest = ?', (source, digest)
+            ).fetchone() is not None
+
+    # ------------------------------------------------------------------ watermarks
+
+    def watermark(self, source):
+        """Newest publication date ingested for a source (UTC ISO string), or None"""
+        with self._lock:
+            row = self.db.execute('SELECT published FROM watermarks WHERE source = ?', (source,)).fetchone()
+        return row['published'] if row else None
+
+    def advance_watermark(self, source, published):
+        """Move the watermark forward to published (UTC ISO string); never moves it back"""
+        current = self.watermark(source)
+        if current and datetime.fromisoformat(current) >= datetime.fromisoformat(published):
+            return False
+        with self._lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO watermarks (source, published, updated_at) VALUES (?, ?, ?)',
+                (source, published, datetime.now(timezone.utc).isoformat())
+            )
+        return True
+
+    def stats(self, source=None):
+        """{state: count}, for one source or all"""
+        query = 'SELECT state, COUNT(*) AS n FROM urls'
+        params = ()
+        if source:
+            query += ' WHERE source = ?'
+            params = (source,)
+        with self._lock:
+            rows = self.db.execute(query + ' GROUP BY state', params).fetchall()
+        counts = dict.fromkeys(STATES, 0)
+        counts.update({row['state']: row['n'] for row in rows})
+        return counts
@@ -0,0 +1,326 @@
+"""
+Raw HTML archive - content-addressed store of every fetched response
+
+Layout under the archive directory:
+    index.sqlite             record index (url, source, fetched_at, status, headers, digest, final_url)
+    objects/ab/abcdef...     compressed bodies, one file per unique body (sha256)
+    dicts/<source>-<n>.dict  compression dictionaries trained per source
+
+Bodies are compressed with zstd using a per-source dictionary once enough
+samples have been collected (template boilerplate compresses very well).
+Without the optional `zstandard` package, zlib with a preset dictionary is used.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    status INTEGER,
+    headers TEXT,
+    digest TEXT NOT NULL,
+    final_url TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_records_url ON records (url, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_records_source ON records (source, fetched_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    dict_id TEXT,
+    raw_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dicts (
+    dict_id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    samples INTEGER NOT NULL
+);
+"""
+
+ZSTD_LEVEL = 10
+ZLIB_WINDOW = 32 * 1024  # zlib can only reference the last 32KB of a preset dictionary
+
+
+def utc_iso(moment):
+    """ISO timestamp in UTC as stored in the index (naive datetimes are taken as UTC)"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
+
+
+class HtmlArchive:
+    """WARC-like record store for raw responses, deduplicated by body hash"""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, root, dict_size=64 * 1024, dict_min_samples=20):
+        self.root = root
+        self.dict_size = dict_size
+        self.dict_min_samples = dict_min_samples
+        self.codec = 'zstd' if zstandard else 'zlib'
+        self._lock = threading.RLock()
+        self._dict_cache = {}
+        self._train_failed = {}  # source -> sample count at the last failed training
+
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(root, 'dicts'), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(root, 'index.sqlite'), check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        columns = [row['name'] for row in self.db.execute('PRAGMA table_info(records)')]
+        if 'final_url' not in columns:  # archives written before redirects were recorded
+            self.db.execute('ALTER TABLE records ADD COLUMN final_url TEXT')
+            self.db.commit()
+
+    @classmethod
+    def shared(cls, root, **kwargs):
+        """One archive instance per directory for the whole process"""
+        key = os.path.abspath(root)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(root, **kwargs)
+            return cls._shared[key]
+
+    @staticmethod
+    def source_key(source_name):
+        """Filesystem-safe key for a source name"""
+        return re.sub(r'[^a-z0-9]+', '_', source_name.lower()).strip('_') or 'unknown'
+
+    # ------------------------------------------------------------------ write
+
+    def store(self, url, body, source, headers=None, status=200, fetched_at=None, final_url=None):
+        """Archive one response under the requested url; returns the body digest"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        source = self.source_key(source)
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        digest = hashlib.sha256(body).hexdigest()
+
+        with self._lock:
+            known = self.db.execute('SELECT 1 FROM blobs WHERE digest = ?', (digest,)).fetchone()
+            if not known:
+                dict_id = self._current_dict_id(source)
+                data = self._compress(body, dict_id)
+                path = self._object_path(digest)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                self.db.execute(
+                    'INSERT INTO blobs (digest, codec, dict_id, raw_size, stored_size) VALUES (?, ?, ?, ?, ?)',
+                    (digest, self.codec, dict_id, len(body), len(data))
+                )
+
+            self.db.execute(
+                'INSERT INTO records (url, source, fetched_at, status, headers, digest, final_url) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, source, utc_iso(fetched_at), status, json.dumps(dict(headers or {})), digest,
+                 final_url if final_url and final_url != url else None)
+            )
+            self.db.commit()
+
+            if self._current_dict_id(source) is None:
+                self._maybe_train(source)
+
+        return digest
+
+    def store_response(self, url, response, source):
+        """Archive a requests.Response under the URL that was requested (replay looks that up),
+        keeping the post-redirect URL as final_url"""
+        return self.store(url, response.content, source, headers=response.headers,
+                          status=response.status_code, final_url=response.url)
+
+    # ------------------------------------------------------------------- read
+
+    def get(self, url, at=None):
+        """Latest record for url, optionally as of a datetime"""
+        query = 'SELECT * FROM records WHERE url = ?'
+        params = [url]
+        if at is not None:
+            query += ' AND fetched_at <= ?'
+            params.append(utc_iso(at))
+        query += ' ORDER BY fetched_at DESC, id DESC LIMIT 1'
+        with self._lock:
+            row = self.db.execute(query, params).fetchone()
+        return self._record(row) if row else None
+
+    def history(self, url):
+        """All records for url, oldest first"""
+        with self._lock:
+            rows = self.db.execute(
+                'SELECT * FROM records WHERE url = ? ORDER BY fetched_at, id', (url,)
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    def records(self, source=None, since=None, until=None):
+        """Records filtered by source and date range, oldest first"""
+        query = 'SELECT * FROM records WHERE 1 = 1'
+        params = []
+        if source:
+            query += ' AND source = ?'
+            params.append(self.source_key(source))
+        if since:
+            query += ' AND fetched_at >= ?'
+            params.append(utc_iso(since))
+        if until:
+            query += ' AND fetched_at < ?'
+            params.append(utc_iso(until))
+        query += ' ORDER BY fetched_at, id'
+        with self._lock:
+            rows = self.db.execute(query, params).fetchall()
+        return [self._record(row) for row in rows]
+
+    def read_body(self, digest):
+        """Decompressed body bytes for a digest"""
+        with self._lock:
+            blob = self.db.execute('SELECT * FROM blobs WHERE digest = ?', (digest,)).fetchone()
+        if not blob:
+            return None
+        with open(self._object_path(digest), 'rb') as f:
+            data = f.read()
+        return self._decompress(data, blob['codec'], blob['dict_id'])
+
+    def read_text(self, record):
+        """Body of a record decoded the same way get_page decodes it"""
+        body = self.read_body(record['digest'])
+        return body.decode('utf-8', errors='replace') if body is not None else None
+
+    def stats(self):
+        """Record count and raw vs. stored bytes"""
+        with self._lock:
+            records = self.db.execute('SELECT COUNT(*) FROM records').fetchone()[0]
+            blobs = self.db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM blobs'
+            ).fetchone()
+        raw, stored = blobs[1], blobs[2]
+        return {
+            'records': records,
+            'unique_bodies': blobs[0],
+            'raw_bytes': raw,
+            'stored_bytes': stored,
+            'ratio': round(raw / stored, 2) if stored else 0.0
+        }
+
+    # ------------------------------------------------------------ maintenance
+
+    def train_dictionary(self, source):
+        """Train a new dictionary for source from its archived bodies"""
+        source = self.source_key(source)
+        with self._lock:
+            rows = self.db.execute(
+                'SELECT DISTINCT digest FROM records WHERE source = ? ORDER BY id DESC LIMIT 200', (source,)
+            ).fetchall()
+            samples = [self.read_body(row['digest']) for row in rows]
+            samples = [s for s in samples if s]
+            if not samples:
+                return None
+
+            if zstandard:
+                try:
+                    dict_data = zstandard.train_dictionary(self.dict_size, samples).as_bytes()
+                except Exception:
+                    return None  # not enough sample data yet
+            else:
+                # zlib preset dictionary: most recent shared bytes, capped to the window
+                dict_data = b''.join(s[:ZLIB_WINDOW // len(samples) + 1] for s in samples)[-ZLIB_WINDOW:]
+
+            count = self.db.execute('SELECT COUNT(*) FROM dicts WHERE source = ?', (source,)).fetchone()[0]
+            dict_id = f"{source}-{count + 1}"
+            with open(self._dict_path(dict_id), 'wb') as f:
+                f.write(dict_data)
+            self.db.execute(
+                'INSERT INTO dicts (dict_id, source, codec, created_at, samples) VALUES (?, ?, ?, ?, ?)',
+                (dict_id, source, self.codec, datetime.now(timezone.utc).isoformat(), len(samples))
+            )
+            self.db.commit()
+        return dict_id
+
+    def prune(self, older_than_days):
+        """Drop records older than the retention window and unreferenced bodies"""
+        cutoff = utc_iso(datetime.now(timezone.utc) - timedelta(days=older_than_days))
+        with self._lock:
+            self.db.execute('DELETE FROM records WHERE fetched_at < ?', (cutoff,))
+            orphans = self.db.execute(
+                'SELECT digest FROM blobs WHERE digest NOT IN (SELECT DISTINCT digest FROM records)'
+            ).fetchall()
+            for row in orphans:
+                path = self._object_path(row['digest'])
+                if os.path.exists(path):
+                    os.remove(path)
+                self.db.execute('DELETE FROM blobs WHERE digest = ?', (row['digest'],))
+            self.db.commit()
+        return len(orphans)
+
+    # --------------------------------------------------------------- internal
+
+    def _record(self, row):
+        record = dict(row)
+        record['headers'] = json.loads(record['headers'] or '{}')
+        return record
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+
+    def _dict_path(self, dict_id):
+        return os.path.join(self.root, 'dicts', f"{dict_id}.dict")
+
+    def _current_dict_id(self, source):
+        row = self.db.execute(
+            'SELECT dict_id FROM dicts WHERE source = ? AND codec = ? ORDER BY created_at DESC LIMIT 1',
+            (source, self.codec)
+        ).fetchone()
+        return row['dict_id'] if row else None
+
+    def _maybe_train(self, source):
+        count = self.db.execute(
+            'SELECT COUNT(DISTINCT digest) FROM records WHERE source = ?', (source,)
+        ).fetchone()[0]
+        if count < self.dict_min_samples:
+            return
+        failed_at = self._train_failed.get(source)
+        if failed_at is not None and count < failed_at + self.dict_min_samples:
+            return  # wait for more samples instead of retraining on every store
+        if self.train_dictionary(source) is None:
+            self._train_failed[source] = count
+        else:
+            self._train_failed.pop(source, None)
+
+    def _load_dict(self, dict_id):
+        if dict_id not in self._dict_cache:
+            with open(self._dict_path(dict_id), 'rb') as f:
+                self._dict_cache[dict_id] = f.read()
+        return self._dict_cache[dict_id]
+
+    def _compress(self, body, dict_id):
+        dict_data = self._load_dict(dict_id) if dict_id else None
+        if self.codec == 'zstd':
+            zdict = zstandard.ZstdCompressionDict(dict_data) if dict_data else None
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zdict).compress(body)
+        compressor = zlib.compressobj(9, zdict=dict_data) if dict_data else zlib.compressobj(9)
+        return compressor.compress(body) + compressor.flush()
+
+    def _decompress(self, data, codec, dict_id):
+        dict_data = self._load_dict(dict_id) if dict_id else None
+        if codec == 'zstd':
+            if not zstandard:
+                raise RuntimeError("Archive body is zstd-compressed but 'zstandard' is not installed")
+            zdict = zstandard.ZstdCompressionDict(dict_data) if dict_data else None
+            return zstandard.ZstdDecompressor(dict_data=zdict).decompress(data)
+        decompressor = zlib.decompressobj(zdict=dict_data) if dict_data else zlib.decompressobj()
+        return decompressor.decompress(data) + decompressor.flush()
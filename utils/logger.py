@@ -1,42 +1,199 @@
 """
 Logging utilities for the scraper
+
+One process-wide setup: records go through a QueueHandler and are written by a
+QueueListener thread, so scraping threads never block on console or file I/O.
+The file sink writes one JSON object per line with source, url and stage fields,
+and the traceback (if any) in its own "exc" field.
 """
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+from contextlib import contextmanager
 from datetime import datetime
 
+CONTEXT_FIELDS = ('source', 'url', 'stage')
+
+_context = contextvars.ContextVar('log_context', default={})
+_listener = None
+_log_file = None
+_worker = False  # records are forwarded to a parent process (see setup_worker_logging)
+
+
+@contextmanager
+def log_context(**fields):
+    """Attach source/url/stage to every record logged inside the block"""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the current log_context onto the record (runs in the calling thread, before queueing)"""
+
+    def filter(self, record):
+        context = _context.get()
+        for field in CONTEXT_FIELDS:
+            if not hasattr(record, field):
+                setattr(record, field, context.get(field))
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:  # formatted before queueing (see StructuredQueueHandler)
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the traceback in exc_text instead of folding it into msg"""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None  # tracebacks do not pickle (worker processes)
+        return record
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Human-readable console lines, with the source when there is one"""
+
+    def format(self, record):
+        line = super().format(record)
+        source = getattr(record, 'source', None)
+        return f"{line} [{source}]" if source else line
+
+
+def setup_logging(level=logging.INFO, log_file=None, json_console=False):
+    """Configure the root logger once; later calls adjust the level and switch to a new log_file"""
+    global _listener, _log_file
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _worker:
+        return root
+    if _listener is not None:
+        if log_file and (not _log_file or os.path.abspath(log_file) != os.path.abspath(_log_file)):
+            switch_log_file(log_file)
+        return root
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(
+        JsonFormatter() if json_console else ConsoleFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    handlers = [console_handler]
+
+    if log_file:
+        handlers.append(json_file_handler(log_file))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    for handler in list(root.handlers):
+        # left over from logging.basicConfig, or from a setup that was shut down
+        if type(handler) is logging.StreamHandler or isinstance(handler, StructuredQueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _log_file = log_file
+    atexit.register(shutdown_logging)
+    return root
+
+
+def json_file_handler(log_file):
+    directory = os.path.dirname(log_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handler = logging.FileHandler(log_file, encoding='utf-8')
+    handler.setFormatter(JsonFormatter())
+    return handler
+
+
+def switch_log_file(log_file):
+    """Send file records to log_file from now on (an entry point started after another one)"""
+    global _listener, _log_file
+    previous = _log_file
+    handlers = [h for h in _listener.handlers if not isinstance(h, logging.FileHandler)]
+    _listener.stop()  # writes out what is queued for the previous file
+    for handler in _listener.handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+    handlers.append(json_file_handler(log_file))
+    _listener = logging.handlers.QueueListener(_listener.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _log_file = log_file
+    if previous:
+        logging.getLogger(__name__).info("Log file switched from %s to %s", previous, log_file)
+
+
+def setup_worker_logging(log_queue, level=logging.INFO):
+    """In a pool worker: drop inherited handlers and send records to the parent through log_queue"""
+    global _listener, _worker
+    _listener = None  # a forked copy; its thread does not exist here
+    _worker = True
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = StructuredQueueHandler(log_queue)
+    handler.addFilter(ContextFilter())
+    root.addHandler(handler)
+    root.setLevel(level)
+
+
+def forward_worker_logs(log_queue):
+    """Parent side of setup_worker_logging: replay worker records into this process's handlers"""
+    listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers)
+    listener.start()
+    return listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the writer thread"""
+    global _listener, _log_file
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+        _listener = None
+        _log_file = None
+
+
+def default_log_file(name='scraper', logs_dir='logs'):
+    return os.path.join(logs_dir, f"{name}_{datetime.now().strftime('%Y-%m-%d')}.jsonl")
+
+
 def setup_logger(name, log_file=None, level=logging.INFO):
-    """Setup logger with file and console handlers"""
-    
-    # Create logs directory if it doesn't exist
-    os.makedirs('logs', exist_ok=True)
-    
-    # Create logger
+    """Named logger on top of the shared queue-based setup (file sink is JSON lines)"""
+    setup_logging(level=level, log_file=log_file or default_log_file(name))
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    if log_file is None:
-        log_file = f"logs/{name}_{datetime.now().strftime('%Y-%m-%d')}.log"
-    
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
     return logger
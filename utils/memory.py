@@ -0,0 +1,39 @@
+"""
+Memory accounting - per-source peak Python heap usage via tracemalloc
+"""
+import tracemalloc
+from contextlib import contextmanager
+
+MB = 1024 * 1024
+
+
+class MemoryTracker:
+    """Records peak and retained traced memory for each source run"""
+
+    def __init__(self):
+        self.results = {}  # source -> {'peak_mb': float, 'retained_mb': float}
+
+    @contextmanager
+    def track(self, source_name):
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.results[source_name] = {
+                'peak_mb': round((peak - baseline) / MB, 2),
+                'retained_mb': round(max(current - baseline, 0) / MB, 2),
+            }
+            if started_here:
+                tracemalloc.stop()
+
+    def print_summary(self):
+        if not self.results:
+            return
+        print(f"\n🧠 Memory (tracemalloc, per source):")
+        for source_name, result in self.results.items():
+            print(f"   {source_name}: peak {result['peak_mb']} MB, retained {result['retained_mb']} MB")
@@ -0,0 +1,223 @@
+"""
+Metrics - per-source, per-stage timers and counters exported in Prometheus text format
+
+Usage:
+    from utils.metrics import metrics, timed
+
+    with metrics.timer('fetch', source='Economic Times Agriculture'):
+        ...
+    metrics.inc('bytes_fetched', len(body), source=...)
+
+    class MyScraper(BaseScraper):
+        @timed('extract')
+        def extract_things(self, soup): ...
+
+    metrics.write_prometheus('metrics/scraper.prom')
+
+Stage timings are inclusive: an 'extract' timing contains the 'refine' calls made inside it.
+"""
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PREFIX = 'scraper'
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+HELP = {
+    'stage_seconds': 'Time spent per pipeline stage',
+    'bytes_fetched_total': 'Response bytes received',
+    'pages_fetched_total': 'Pages fetched successfully',
+    'fetch_errors_total': 'Failed fetch attempts',
+    'circuit_rejected_total': 'Requests skipped because the host circuit breaker was open',
+    'robots_disallowed_total': 'URLs skipped because robots.txt disallows them',
+    'budget_skipped_total': 'Requests not made because the source ran out of run budget',
+    'sources_deferred_total': 'Sources not started because the run budget was spent',
+    'pages_parsed_total': 'HTML documents parsed',
+    'pages_rejected_total': 'Pages over the size or node limit, not parsed',
+    'candidates_total': 'Candidate articles checked by is_meaningful_content',
+    'candidates_accepted_total': 'Candidate articles accepted by is_meaningful_content',
+    'candidates_rejected_total': 'Candidate articles rejected by is_meaningful_content, by reason',
+    'cache_hits_total': 'Lookups served from a cache or replay corpus',
+    'cache_misses_total': 'Cache lookups that had to compute the value',
+    'articles_total': 'Articles produced',
+    'watermark_skipped_total': 'Listing entries older than the source watermark, not fetched',
+    'last_run_timestamp_seconds': 'Unix time the metrics file was written',
+}
+
+
+def _labels(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + (list(extra.items()) if extra else [])
+    if not items:
+        return ''
+    escaped = []
+    for key, value in items:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append(f'{key}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)"""
+
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            yield bound, running
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms keyed by name and labels"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}    # (name, labels) -> float
+        self.histograms = {}  # (name, labels) -> Histogram
+
+    def inc(self, name, value=1, **labels):
+        key = (f"{name}_total" if not name.endswith('_total') else name, _labels(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, stage, source='all'):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe('stage_seconds', time.perf_counter() - start, source=source, stage=stage)
+
+    def export(self):
+        """Picklable copy of the raw state, for merging into another process's registry"""
+        with self._lock:
+            return {
+                'counters': dict(self.counters),
+                'histograms': {key: (list(h.counts), h.total, h.count) for key, h in self.histograms.items()},
+            }
+
+    def merge(self, exported):
+        """Add counters and histograms exported by another registry (process pool workers)"""
+        with self._lock:
+            for key, value in exported['counters'].items():
+                self.counters[key] = self.counters.get(key, 0) + value
+            for key, (counts, total, count) in exported['histograms'].items():
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = Histogram()
+                histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+                histogram.total += total
+                histogram.count += count
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def snapshot(self):
+        """Plain-dict view: {'counters': {name: {labels: value}}, 'stages': {source: {stage: {...}}}}"""
+        with self._lock:
+            counters = {}
+            for (name, labels), value in self.counters.items():
+                counters.setdefault(name, {})[_format_labels(labels)] = value
+            stages = {}
+            for (name, labels), histogram in self.histograms.items():
+                label_dict = dict(labels)
+                stages.setdefault(label_dict.get('source', 'all'), {})[label_dict.get('stage', name)] = {
+                    'count': histogram.count,
+                    'seconds': round(histogram.total, 6),
+                }
+        return {'counters': counters, 'stages': stages}
+
+    def render_prometheus(self):
+        """Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            by_name = {}
+            for (name, labels), value in self.counters.items():
+                by_name.setdefault(name, []).append((labels, value))
+            for name in sorted(by_name):
+                metric = f"{PREFIX}_{name}"
+                lines.append(f"# HELP {metric} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(by_name[name]):
+                    lines.append(f"{metric}{_format_labels(labels)} {value}")
+
+            hist_by_name = {}
+            for (name, labels), histogram in self.histograms.items():
+                hist_by_name.setdefault(name, []).append((labels, histogram))
+            for name in sorted(hist_by_name):
+                metric = f"{PREFIX}_{name}"
+                lines.append(f"# HELP {metric} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(hist_by_name[name], key=lambda item: item[0]):
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{metric}_bucket{_format_labels(labels, {'le': bound})} {count}")
+                    lines.append(f"{metric}_bucket{_format_labels(labels, {'le': '+Inf'})} {histogram.count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.total:.6f}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+
+        metric = f"{PREFIX}_last_run_timestamp_seconds"
+        lines.append(f"# HELP {metric} {HELP['last_run_timestamp_seconds']}")
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {time.time():.0f}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Atomically write the textfile-collector file (temp file + rename)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+        return path
+
+
+metrics = MetricsRegistry()
+
+
+def source_label(scraper):
+    """Label value for a scraper instance"""
+    return scraper.source_config.get('name', scraper.__class__.__name__)
+
+
+def timed(stage):
+    """Decorator for scraper methods: time the call under this stage for the scraper's source"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with metrics.timer(stage, source=source_label(self)):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
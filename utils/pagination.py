@@ -0,0 +1,115 @@
+"""
+Listing pagination - walk a listing newest-first until already-ingested items come up
+
+A source opts in with a "pagination" entry in its config:
+
+    "pagination": {
+        "next_selector": 'a[rel="next"]',            # follow the next-page link, or
+        "url_template": "{url}?page={page}",           # build page URLs (page 2, 3, ...)
+        "max_pages": 10,                               # optional, default PAGINATION_MAX_PAGES
+        "stop_after_seen": 3                           # optional, default PAGINATION_STOP_AFTER_SEEN
+    }
+
+    with ListingWalk(scraper, news_url, is_seen=..., record=...) as walk:
+        for page_url, html in walk:
+            with scraper.parsed(html) as soup:
+                walk.follow(soup, page_url)
+                links = find_links(soup)
+            new_links = walk.observe(links)
+
+No further page is fetched once stop_after_seen consecutive items (URLs or
+content digests) were ingested on earlier runs, so a run fetches pages in
+proportion to what is new. Sources without "pagination" read only their first
+page, as before. New keys are passed to record() only when the walk finishes
+without an error.
+"""
+from urllib.parse import urljoin
+
+from config.settings import config
+
+
+class ListingWalk:
+    """Pages of one listing URL, stopping at a run of already-seen items"""
+
+    def __init__(self, scraper, news_url, is_seen=None, record=None):
+        pagination = scraper.source_config.get('pagination') or {}
+        self.scraper = scraper
+        self.news_url = news_url
+        self.next_selector = pagination.get('next_selector')
+        self.url_template = pagination.get('url_template')
+        self.max_pages = pagination.get('max_pages', config.PAGINATION_MAX_PAGES) if pagination else 1
+        self.stop_after = pagination.get('stop_after_seen', config.PAGINATION_STOP_AFTER_SEEN)
+        self.is_seen = is_seen or (lambda key: False)
+        self.record = record
+        self.pages = 0
+        self.seen_run = 0
+        self.stopped = False
+        self.new_keys = []
+        self._next_url = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self.record and self.new_keys:
+            self.record(self.new_keys)
+        return False
+
+    def __iter__(self):
+        url = self.news_url
+        while url and self.pages < self.max_pages and not self.stopped:
+            if self.pages:
+                self.scraper.rate_limit()
+            html = self.scraper.get_page(url)
+            if not html:
+                return
+            self._next_url = self.page_url(self.pages + 2) if self.url_template else None
+            self.pages += 1
+            yield url, html
+            url = self._next_url
+        if self.max_pages > 1:
+            self.scraper.logger.info("Listing %s: %d page(s)%s", self.news_url, self.pages,
+                                     ", stopped at already-seen items" if self.stopped else "")
+
+    def page_url(self, page):
+        """URL of a page number from url_template ({url} is the first listing page)"""
+        return self.url_template.format(url=self.news_url.rstrip('/'), page=page)
+
+    @property
+    def next_url(self):
+        return self._next_url
+
+    def follow(self, soup, page_url):
+        """Pick up the next-page link from a parsed page (next_selector mode)"""
+        if not self.next_selector:
+            return
+        link = soup.select_one(self.next_selector)
+        self.follow_href(link.get('href') if link else None, page_url)
+
+    def follow_href(self, href, page_url):
+        """Next-page link read off the page elsewhere (a pipeline extraction worker)"""
+        if not self.next_selector:
+            return
+        next_url = urljoin(page_url, href) if href else None
+        self._next_url = next_url if next_url and next_url != page_url else None
+
+    def observe(self, keys, seen=()):
+        """New keys of a page in listing order; a run of seen keys (or an empty page) ends the walk
+
+        The page itself is already fetched, so new keys after the run are still returned.
+        Keys in seen (e.g. entries older than the date watermark) count as already seen.
+        """
+        if not keys:
+            self.stopped = True
+            return []
+        new = []
+        for key in keys:
+            if key in seen or self.is_seen(key):
+                self.seen_run += 1
+                if self.seen_run >= self.stop_after:
+                    self.stopped = True
+            else:
+                self.seen_run = 0
+                new.append(key)
+        self.new_keys.extend(new)
+        return new
@@ -0,0 +1,244 @@
+"""
+Staged pipeline - fetch on threads, parse/extract in a process pool, one writer
+
+    fetch threads ──(bounded: max_pending pages)──> process pool ──> writer thread
+    one per source,                                 parse, extract,   staging / snapshots,
+    per-host politeness kept                        keywords          strictly one at a time
+
+Fetchers block when max_pending fetched pages are waiting to be extracted or
+written, so a slow CPU stage throttles the network stage instead of piling up
+HTML in memory. Scrapers must implement feed_articles() and process_page(url,
+html, walk), the CPU-only part of scrape_articles. Discovery follows scrape_articles: feed
+articles when the source's feeds have entries, else its listing pages. A
+paginated listing fetches its next page once the previous one is extracted
+(the next link and the already-seen check need the extracted page). Metrics,
+log records and run stats from the workers are merged back into this process.
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.logger import forward_worker_logs, log_context, setup_worker_logging
+from utils.metrics import metrics, source_label
+from utils.pagination import ListingWalk
+from utils.run_report import SourceStats
+from utils.scheduler import article_digest
+from utils.text_cache import normalization_cache
+
+_worker_scrapers = {}  # (class, source name) -> scraper, per worker process
+
+
+def _init_worker(log_queue, log_level):
+    setup_worker_logging(log_queue, log_level)
+    metrics.reset()
+
+
+def process_listing_page(scraper, url, html):
+    """(articles, next page URL) for one listing page; the link is only read for paginated sources"""
+    walk = ListingWalk(scraper, url) if scraper.source_config.get('pagination') else None
+    articles = scraper.process_page(url, html, walk)
+    return articles, walk.next_url if walk else None
+
+
+def extract_page(scraper_class, source_config, url, html):
+    """Pool task: CPU stages for one page; returns (articles, run stats, metrics export, next page URL)"""
+    key = (scraper_class, source_config['name'])
+    scraper = _worker_scrapers.get(key)
+    if scraper is None:
+        scraper = _worker_scrapers[key] = scraper_class(source_config)
+    scraper.run_stats = SourceStats()
+    metrics.reset()
+    with log_context(source=source_label(scraper)):
+        articles, next_url = process_listing_page(scraper, url, html)
+        for article in articles:
+            article.keywords  # resolved here, not while pickling, so the timings are exported
+    normalization_cache.export_metrics(metrics)
+    return articles, scraper.run_stats, metrics.export(), next_url
+
+
+class _InlineFuture:
+    """Result holder with the Future methods the pipeline uses (cpu_workers=0)"""
+
+    def __init__(self, func, *args):
+        self._result = self._error = None
+        try:
+            self._result = func(*args)
+        except Exception as e:
+            self._error = e
+
+    def add_done_callback(self, callback):
+        callback(self)
+
+    def result(self):
+        if self._error:
+            raise self._error
+        return self._result
+
+
+class StagedPipeline:
+    """Run several sources through fetch -> extract -> write concurrently"""
+
+    def __init__(self, scraper_class, fetch_class=None, cpu_workers=None, max_pending=None, writer=None,
+                 deadline=None):
+        """
+        scraper_class: BaseScraper subclass with process_page(); used in the workers
+        fetch_class:   class used for get_page/rate_limit (default scraper_class)
+        cpu_workers:   process pool size (default os.cpu_count(); 0 extracts inline)
+        max_pending:   fetched pages allowed in flight before fetchers block
+        writer:        callable(source_name, articles) run on the single writer thread
+                       once a source's pages are all extracted
+        deadline:      time.monotonic() after which fetchers stop requesting (run budget)
+        """
+        self.scraper_class = scraper_class
+        self.fetch_class = fetch_class or scraper_class
+        self.cpu_workers = (os.cpu_count() or 1) if cpu_workers is None else cpu_workers
+        self.max_pending = max_pending or max(2, 2 * self.cpu_workers)
+        self.writer = writer
+        self.deadline = deadline
+        self.logger = logging.getLogger('StagedPipeline')
+
+    def run(self, sources):
+        """{source_name: {'articles', 'run_stats', 'seconds', 'error'}} in sources order"""
+        results = {
+            name: {'pages': {}, 'keep': {}, 'run_stats': SourceStats(), 'seconds': 0.0, 'error': None,
+                   'start': None, 'scraper': None}
+            for name in sources
+        }
+        slots = threading.BoundedSemaphore(self.max_pending)
+        written = queue.Queue()
+        lock = threading.Lock()
+
+        pool = log_queue = log_listener = None
+        if self.cpu_workers:
+            context = multiprocessing.get_context()
+            log_queue = context.Queue()
+            log_listener = forward_worker_logs(log_queue)
+            pool = ProcessPoolExecutor(
+                max_workers=self.cpu_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(log_queue, logging.getLogger().level)
+            )
+
+        def submit(source_name, source_config, index, url, html):
+            if pool:
+                future = pool.submit(extract_page, self.scraper_class, source_config, url, html)
+            else:
+                future = _InlineFuture(self._extract_inline, source_config, url, html)
+            future.add_done_callback(lambda f: written.put((source_name, index, url, f)))
+            return future
+
+        def fetch(source_name, source_config):
+            result = results[source_name]
+            result['start'] = time.perf_counter()
+            try:
+                scraper = self.fetch_class(source_config)
+                scraper.deadline = self.deadline
+                result['run_stats'] = scraper.run_stats
+                result['scraper'] = scraper  # its listing digests are committed once the output is written
+                with log_context(source=source_label(scraper)):
+                    articles = scraper.feed_articles()
+                    if articles:  # built from feed entries, nothing to extract
+                        with lock:
+                            result['pages'][(0, 0)] = articles
+                        return
+                    for listing, news_url in enumerate(source_config['news_urls']):
+                        if listing:
+                            scraper.rate_limit()
+                        with scraper.listing_walk(news_url, by_content=True) as walk:
+                            for page, (page_url, html) in enumerate(walk):
+                                index = (listing, page)
+                                slots.acquire()  # backpressure: wait for the CPU/writer stages
+                                with lock:
+                                    result['pages'][index] = None
+                                try:
+                                    future = submit(source_name, source_config, index, page_url, html)
+                                except Exception:
+                                    # Pool shut down or broken: nothing will arrive for this page
+                                    with lock:
+                                        del result['pages'][index]
+                                    slots.release()
+                                    raise
+                                if walk.max_pages > 1:
+                                    # Paginated: the next link and the seen-items check need this page extracted
+                                    page_articles, _, _, next_url = future.result()
+                                    walk.follow_href(next_url, page_url)
+                                    new = set(walk.observe([article_digest(a) for a in page_articles]))
+                                    if walk.pages > 1:
+                                        with lock:
+                                            result['keep'][index] = new
+            except Exception as e:
+                self.logger.error("Fetch stage failed for %s: %s", source_name, e)
+                result['error'] = str(e)
+
+        fetchers = {
+            name: threading.Thread(target=fetch, args=(name, config), name=f"fetch-{name}", daemon=True)
+            for name, config in sources.items()
+        }
+        for thread in fetchers.values():
+            thread.start()
+
+        def finished(source_name):
+            with lock:
+                return not fetchers[source_name].is_alive() and None not in results[source_name]['pages'].values()
+
+        try:
+            # This thread is the writer: results are applied one at a time, in arrival order
+            remaining = list(sources)
+            while remaining:
+                try:
+                    source_name, index, url, future = written.get(timeout=0.05)
+                    self._extracted(results[source_name], index, url, future, lock)
+                    slots.release()
+                except queue.Empty:
+                    pass
+                for source_name in [name for name in remaining if finished(name)]:
+                    remaining.remove(source_name)
+                    self._finish(source_name, sources[source_name], results[source_name])
+        finally:
+            for thread in fetchers.values():
+                thread.join()
+            if pool:
+                pool.shutdown()
+            if log_listener:
+                log_listener.stop()
+
+        return {
+            name: {key: results[name][key] for key in ('articles', 'run_stats', 'seconds', 'error', 'scraper')}
+            for name in sources
+        }
+
+    def _extract_inline(self, source_config, url, html):
+        scraper = self.scraper_class(source_config)
+        articles, next_url = process_listing_page(scraper, url, html)
+        return articles, scraper.run_stats, None, next_url
+
+    def _extracted(self, result, index, url, future, lock):
+        try:
+            articles, run_stats, exported, _ = future.result()
+        except Exception as e:
+            self.logger.error("Extract stage failed for %s: %s", url, e)
+            articles, run_stats, exported = [], None, None
+            result['error'] = str(e)
+        if exported:
+            metrics.merge(exported)
+        if run_stats is not None:
+            result['run_stats'].merge(run_stats)
+        with lock:
+            result['pages'][index] = articles
+
+    def _finish(self, source_name, source_config, result):
+        """All pages of a source are in: assemble in URL order and hand to the writer"""
+        result['articles'] = [
+            a for index in sorted(result['pages']) for a in result['pages'][index]
+            if index not in result['keep'] or article_digest(a) in result['keep'][index]
+        ]
+        result['seconds'] = time.perf_counter() - result['start'] if result['start'] else 0.0
+        metrics.inc('articles', len(result['articles']), source=source_config['name'])
+        metrics.observe('stage_seconds', result['seconds'], source=source_config['name'], stage='run')
+        if self.writer:
+            self.writer(source_name, result['articles'])
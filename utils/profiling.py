@@ -0,0 +1,283 @@
+"""
+Profiling - per-source CPU profiles and flame-graph stacks
+
+    profiler = SourceProfiler('profiles', mode='cprofile')
+    with profiler.profile('economic_times_agriculture'):
+        scraper.run()
+    profiler.print_hotspots('economic_times_agriculture')
+
+Each source gets <name>.pstats and <name>.collapsed, a collapsed-stack file
+that flamegraph.pl / speedscope / inferno read directly. In sampling mode the
+pstats times are estimated from the samples (calls = samples).
+Politeness sleeps are excluded: code that sleeps wraps it in paused().
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+_active = None  # profiler currently recording, if any
+
+
+@contextmanager
+def paused():
+    """Stop recording for the duration of the block (rate_limit / retry sleeps)"""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    profiler.pause()
+    try:
+        yield
+    finally:
+        profiler.resume()
+
+
+def _label(func):
+    filename, line, name = func
+    return f"{name} ({os.path.basename(filename)}:{line})" if line else name
+
+
+class _SampledProfile:
+    """Stand-in for cProfile.Profile that pstats.Stats can load"""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class _CProfileRecorder:
+    """Deterministic profile; collapsed stacks are derived from the caller graph
+
+    The profiler stays enabled through paused() blocks - disabling it would
+    drop the frames still running (run, scrape_articles, ...) - and its clock
+    stands still instead, so paused time counts for nothing.
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile(self.clock)
+        self._paused_total = 0.0
+        self._paused_at = None
+
+    def clock(self):
+        """perf_counter minus the time spent paused"""
+        now = self._paused_at if self._paused_at is not None else time.perf_counter()
+        return now - self._paused_total
+
+    def start(self):
+        self.profile.enable()
+
+    def pause(self):
+        if self._paused_at is None:
+            self._paused_at = time.perf_counter()
+
+    def resume(self):
+        if self._paused_at is not None:
+            self._paused_total += time.perf_counter() - self._paused_at
+            self._paused_at = None
+
+    def stop(self):
+        self.profile.disable()
+
+    def stats(self):
+        return pstats.Stats(self.profile, stream=io.StringIO())
+
+    def collapsed(self, max_depth=64):
+        """Approximate stacks: split each function's time across callers by edge cumulative time"""
+        stats = self.stats().stats
+        children = {}
+        for func, (_, _, _, _, callers) in stats.items():
+            for caller, edge in callers.items():
+                children.setdefault(caller, []).append((func, edge[3]))
+        roots = [func for func, entry in stats.items() if not entry[4]]
+        label = _label
+
+        lines = Counter()
+
+        def walk(func, seconds, path):
+            _, _, tottime, cumtime, _ = stats[func]
+            path = path + [label(func)]
+            if cumtime <= 0 or seconds <= 0:
+                return
+            self_us = int(seconds * tottime / cumtime * 1e6)
+            if self_us:
+                lines[';'.join(path)] += self_us
+            if len(path) >= max_depth:
+                return
+            for child, edge_time in children.get(func, []):
+                if label(child) not in path:  # break recursion cycles
+                    walk(child, seconds * edge_time / cumtime, path)
+
+        for root in roots:
+            walk(root, stats[root][3], [])
+        return lines
+
+
+class _SamplingRecorder:
+    """Low-overhead sampler: a thread snapshots the profiled thread's stack every interval"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = Counter()
+        self.target = None
+        self._running = False
+        self._paused = False
+        self._thread = None
+
+    def start(self):
+        self.target = threading.get_ident()
+        self._running = True
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def pause(self):
+        self._paused = True
+
+    def resume(self):
+        self._paused = False
+
+    def stop(self):
+        self._paused = True  # do not sample our own join below
+        self._running = False
+        if self._thread:
+            self._thread.join()
+
+    def _sample(self):
+        while self._running:
+            time.sleep(self.interval)
+            if self._paused:
+                continue
+            frame = sys._current_frames().get(self.target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    def stats(self):
+        """pstats view of the samples: own time from leaf samples, cumulative from samples on the stack"""
+        entries = {}  # func -> [calls, calls, own, cumulative, {caller: [calls, calls, own, cumulative]}]
+        for stack, count in self.samples.items():
+            seconds = count * self.interval
+            seen = set()
+            for depth, func in enumerate(stack):
+                entry = entries.setdefault(func, [0, 0, 0.0, 0.0, {}])
+                leaf = depth == len(stack) - 1
+                if func not in seen:  # recursion counts once per sample
+                    seen.add(func)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += seconds
+                if leaf:
+                    entry[2] += seconds
+                if depth:
+                    edge = entry[4].setdefault(stack[depth - 1], [0, 0, 0.0, 0.0])
+                    edge[0] += count
+                    edge[1] += count
+                    edge[2] += seconds if leaf else 0.0
+                    edge[3] += seconds
+        if not entries:
+            return None
+        stats = {
+            func: (cc, nc, tt, ct, {caller: tuple(edge) for caller, edge in callers.items()})
+            for func, (cc, nc, tt, ct, callers) in entries.items()
+        }
+        return pstats.Stats(_SampledProfile(stats), stream=io.StringIO())
+
+    def collapsed(self):
+        weight = int(self.interval * 1e6)
+        lines = Counter()
+        for stack, count in self.samples.items():
+            lines[';'.join(_label(func) for func in stack)] += count * weight
+        return lines
+
+
+class SourceProfiler:
+    """Profiles each source run separately and writes the results under a run directory"""
+
+    MODES = ('cprofile', 'sampling')
+
+    def __init__(self, profiles_dir='profiles', mode='cprofile'):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiler mode '{mode}', expected one of {self.MODES}")
+        self.mode = mode
+        self.run_dir = os.path.join(profiles_dir, datetime.now().strftime('%Y%m%d_%H%M%S'))
+        suffix = 1
+        while os.path.exists(self.run_dir):
+            suffix += 1
+            self.run_dir = os.path.join(profiles_dir, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}")
+        self.results = {}  # source -> {'pstats': path, 'collapsed': path, 'stats': pstats.Stats}
+        self._recorder = None
+
+    def pause(self):
+        self._recorder.pause()
+
+    def resume(self):
+        self._recorder.resume()
+
+    @contextmanager
+    def profile(self, source_name):
+        global _active
+        recorder = _CProfileRecorder() if self.mode == 'cprofile' else _SamplingRecorder()
+        self._recorder = recorder
+        _active = self
+        recorder.start()
+        try:
+            yield
+        finally:
+            recorder.stop()
+            _active = None
+            self._recorder = None
+            self._save(source_name, recorder)
+
+    def _save(self, source_name, recorder):
+        os.makedirs(self.run_dir, exist_ok=True)
+        result = {}
+
+        stats = recorder.stats()
+        if stats is not None:
+            result['pstats'] = os.path.join(self.run_dir, f"{source_name}.pstats")
+            stats.dump_stats(result['pstats'])
+            result['stats'] = stats
+
+        result['collapsed'] = os.path.join(self.run_dir, f"{source_name}.collapsed")
+        with open(result['collapsed'], 'w', encoding='utf-8') as f:
+            for stack, weight in sorted(recorder.collapsed().items()):
+                f.write(f"{stack} {weight}\n")
+
+        result['hotspots'] = self._hotspots(recorder)
+        self.results[source_name] = result
+
+    def _hotspots(self, recorder, limit=10):
+        """[(self seconds, function label)] with the most own time"""
+        stats = recorder.stats()
+        if stats is not None:
+            ranked = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+            return [(entry[2], f"{name} ({os.path.basename(filename)}:{line})" if line else name)
+                    for (filename, line, name), entry in ranked]
+
+        totals = Counter()
+        for stack, weight in recorder.collapsed().items():
+            totals[stack.rsplit(';', 1)[-1]] += weight
+        return [(weight / 1e6, name) for name, weight in totals.most_common(limit)]
+
+    def print_hotspots(self, source_name, limit=10):
+        result = self.results.get(source_name)
+        if not result:
+            return
+        print(f"🔥 Top hotspots for {source_name} (self time):")
+        for seconds, name in result['hotspots'][:limit]:
+            print(f"   {seconds * 1000:9.2f} ms  {name}")
+        for key in ('pstats', 'collapsed'):
+            if key in result:
+                print(f"   📁 {key}: {result[key]}")
@@ -0,0 +1,88 @@
+"""
+Replay corpus - serve get_page from recorded responses instead of the network
+
+A replay directory is either:
+  - an HtmlArchive directory (contains index.sqlite), latest record per URL is served
+  - a fixture directory of saved pages, mapped by manifest.json ({url: filename})
+    or by the file name derived from the URL (see fixture_name)
+"""
+import json
+import os
+import re
+import threading
+
+from utils.html_archive import HtmlArchive
+
+
+class ReplayCorpus:
+    """Local corpus of recorded responses, looked up by URL"""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, root):
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"Replay directory not found: {root}")
+        self.root = root
+        self.archive = None
+        self.manifest = {}
+        self.hits = 0
+        self.misses = []
+
+        if os.path.exists(os.path.join(root, 'index.sqlite')):
+            self.archive = HtmlArchive(root)
+        else:
+            manifest_path = os.path.join(root, 'manifest.json')
+            if os.path.exists(manifest_path):
+                with open(manifest_path, encoding='utf-8') as f:
+                    self.manifest = json.load(f)
+
+    @classmethod
+    def shared(cls, root):
+        """One corpus instance per directory for the whole process"""
+        key = os.path.abspath(root)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(root)
+            return cls._shared[key]
+
+    @staticmethod
+    def fixture_name(url):
+        """File name a page is saved under when there is no manifest entry"""
+        name = re.sub(r'^https?://', '', url)
+        name = re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_')
+        return f"{name[:150]}.html"
+
+    def get(self, url):
+        """Recorded body for url, or None if the corpus does not have it"""
+        text = self._lookup(url)
+        if text is None:
+            self.misses.append(url)
+        else:
+            self.hits += 1
+        return text
+
+    def urls(self):
+        """URLs the corpus can serve (fixtures found only by file name are not listed)"""
+        if self.archive:
+            return list(dict.fromkeys(record['url'] for record in self.archive.records()))
+        return list(self.manifest)
+
+    def save(self, url, html):
+        """Add a page to a fixture directory (used to build corpora by hand)"""
+        filename = self.manifest.get(url) or self.fixture_name(url)
+        with open(os.path.join(self.root, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+        return filename
+
+    def _lookup(self, url):
+        if self.archive:
+            record = self.archive.get(url)
+            return self.archive.read_text(record) if record else None
+
+        filename = self.manifest.get(url) or self.fixture_name(url)
+        path = os.path.join(self.root, filename)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8', errors='replace') as f:
+            return f.read()
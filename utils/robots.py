@@ -0,0 +1,160 @@
+"""
+robots.txt - cached per-host rules and Crawl-delay based request spacing
+
+    robots = RobotsCache.shared('state/robots', ttl=86400, user_agent='KeralaAgriNewsScraper')
+    robots.allowed(url, fetch)        # fetch(robots_url) -> (status, text)
+    robots.crawl_delay(url, fetch)    # seconds, or None when the site declares none
+
+    throttle = HostThrottle()
+    throttle.wait(host, delay)        # blocks until host's next request slot
+
+Rules are cached in memory and as one JSON file per host, refreshed after
+ttl seconds. Following RFC 9309, a 4xx robots.txt allows everything; a 5xx
+or unreachable one disallows everything for error_ttl seconds, unless an
+older copy is on disk, in which case that copy keeps applying.
+"""
+import json
+import os
+import threading
+import time
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from utils.profiling import paused
+
+
+def robots_url(url):
+    parts = urlparse(url)
+    return f"{parts.scheme}://{parts.netloc}/robots.txt"
+
+
+class RobotsCache:
+    """Parsed robots.txt per host, kept in memory and on disk"""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir=None, ttl=24 * 3600, user_agent='*', error_ttl=600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.user_agent = user_agent
+        self._lock = threading.Lock()
+        self.hosts = {}  # netloc -> (expires_at, RobotFileParser)
+
+    @classmethod
+    def shared(cls, cache_dir, **kwargs):
+        """One cache per directory for the whole process"""
+        key = os.path.abspath(cache_dir) if cache_dir else None
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(cache_dir, **kwargs)
+            return cls._shared[key]
+
+    def _path(self, netloc):
+        return os.path.join(self.cache_dir, netloc.replace(':', '_') + '.json')
+
+    def _read(self, netloc):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(netloc), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, netloc, record):
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(netloc)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _parser(record):
+        parser = RobotFileParser(record['url'])
+        status = record['status']
+        if status is None or status >= 500:
+            parser.disallow_all = True
+        elif status >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(record['body'].splitlines())
+        return parser
+
+    def _load(self, url, fetch):
+        """Parser for url's host: memory, then a fresh disk copy, then the network"""
+        netloc = urlparse(url).netloc
+        now = time.time()
+        cached = self.hosts.get(netloc)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        record = self._read(netloc)
+        if not record or now - record['fetched_at'] >= self.ttl:
+            fetched = {'url': robots_url(url), 'fetched_at': now, 'status': None, 'body': ''}
+            try:
+                fetched['status'], fetched['body'] = fetch(fetched['url'])
+            except Exception:
+                pass
+            if fetched['status'] is not None and fetched['status'] < 500:
+                record = fetched
+                self._write(netloc, record)
+            elif record:  # site trouble: keep using the last good copy for a while
+                record = dict(record, fetched_at=now - self.ttl + self.error_ttl)
+            else:
+                record = fetched
+
+        failed = record['status'] is None or record['status'] >= 500
+        expires_at = record['fetched_at'] + (self.error_ttl if failed else self.ttl)
+        parser = self._parser(record)
+        self.hosts[netloc] = (max(expires_at, now + 1), parser)
+        return parser
+
+    def policy(self, url, fetch):
+        with self._lock:
+            return self._load(url, fetch)
+
+    def allowed(self, url, fetch):
+        return self.policy(url, fetch).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, url, fetch):
+        """Declared Crawl-delay (or Request-rate as seconds per request) for our user agent"""
+        parser = self.policy(url, fetch)
+        delays = []
+        delay = parser.crawl_delay(self.user_agent)
+        if delay is not None:
+            delays.append(float(delay))
+        rate = parser.request_rate(self.user_agent)
+        if rate and rate.requests:
+            delays.append(rate.seconds / rate.requests)
+        return max(delays) if delays else None
+
+
+class HostThrottle:
+    """Spaces requests to the same host; threads asking for one host queue up in slot order"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.next_slot = {}  # host -> monotonic time of its next free slot
+
+    def reserve(self, host, delay):
+        """Seconds to wait before this request may go out (and book the slot after it)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, 0.0))
+            self.next_slot[host] = slot + delay
+            return slot - now
+
+    def wait(self, host, delay):
+        wait = self.reserve(host, delay)
+        if wait > 0:
+            with paused():
+                time.sleep(wait)
+        return wait
+
+
+throttle = HostThrottle()
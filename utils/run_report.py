@@ -0,0 +1,201 @@
+"""
+Run report - per-source latency, volume and outcome for one run, written as JSON
+
+    report = RunReport()
+    with report.track(source_name, source_config) as entry:
+        scraper = SimpleConsolidatedScraper(source_config)
+        entry.scraper = scraper
+        entry.articles = scraper.run()
+    report.write('reports')   # reports/run_20250101_060000.json, old files pruned
+
+Stage seconds are taken from the metrics registry (difference across the source
+run), so they match the Prometheus export; 'refine' time is also counted inside
+'extract' and 'keywords', which call it.
+"""
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from utils.metrics import metrics
+
+REPORT_PREFIX = 'run_'
+STAGES = ('fetch', 'parse', 'extract', 'refine', 'keywords', 'sleep')
+
+
+class SourceStats:
+    """What one scraper saw: fetches, candidates, rejection reasons, extractor methods"""
+
+    def __init__(self):
+        self.fetches = []  # {'url', 'status', 'bytes', 'seconds', 'attempts', 'replay'[, 'error']}
+        self.candidates = 0
+        self.accepted = 0
+        self.rejections = Counter()  # reason code -> count
+        self.extractors = Counter()  # method name -> items produced
+
+    def record_fetch(self, url, status, size, seconds, attempts=1, replay=False, error=None):
+        entry = {
+            'url': url,
+            'status': status,
+            'bytes': size,
+            'seconds': round(seconds, 4),
+            'attempts': attempts,
+            'replay': replay,
+        }
+        if error:
+            entry['error'] = error
+        self.fetches.append(entry)
+
+    def record_candidate(self, reason=None):
+        """reason is None for an accepted candidate, else a short code"""
+        self.candidates += 1
+        if reason is None:
+            self.accepted += 1
+        else:
+            self.rejections[reason] += 1
+
+    def record_extractor(self, method, count):
+        if count:
+            self.extractors[method] += count
+
+    def merge(self, other):
+        """Fold in stats collected elsewhere (e.g. by a process pool worker)"""
+        self.fetches.extend(other.fetches)
+        self.candidates += other.candidates
+        self.accepted += other.accepted
+        self.rejections.update(other.rejections)
+        self.extractors.update(other.extractors)
+
+    def to_dict(self):
+        return {
+            'fetches': self.fetches,
+            'bytes_fetched': sum(f['bytes'] or 0 for f in self.fetches),
+            'candidates': {
+                'considered': self.candidates,
+                'accepted': self.accepted,
+                'rejected': dict(self.rejections.most_common()),
+            },
+            'extractors': dict(self.extractors.most_common()),
+        }
+
+
+class _SourceEntry:
+    """Filled in by the caller inside RunReport.track()"""
+
+    def __init__(self):
+        self.scraper = None
+        self.articles = None
+
+
+def stage_seconds(source_label):
+    stages = metrics.snapshot()['stages'].get(source_label, {})
+    return {stage: stats['seconds'] for stage, stats in stages.items()}
+
+
+class RunReport:
+    """Collects per-source results for one run"""
+
+    def __init__(self):
+        self.started = datetime.now()
+        self._start = time.perf_counter()
+        self.sources = {}
+
+    @contextmanager
+    def track(self, source_name, source_config):
+        label = source_config.get('name', source_name)
+        before = stage_seconds(label)
+        entry = _SourceEntry()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield entry
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self.add(
+                source_name, source_config, entry.articles,
+                run_stats=entry.scraper.run_stats if entry.scraper is not None else None,
+                wall_seconds=time.perf_counter() - start,
+                stages_before=before,
+                error=error
+            )
+
+    def add(self, source_name, source_config, articles, run_stats=None, wall_seconds=0.0,
+            stages_before=None, error=None, deferred=False):
+        """Record one source's result (stage seconds are the change since stages_before)
+
+        deferred: the source was not started because the run budget was spent.
+        """
+        label = source_config.get('name', source_name)
+        before = stages_before or {}
+        after = stage_seconds(label)
+        result = {
+            'name': label,
+            'wall_seconds': round(wall_seconds, 4),
+            'stages': {stage: round(after.get(stage, 0) - before.get(stage, 0), 4) for stage in STAGES},
+            'articles': len(articles) if articles is not None else 0,
+            'ok': error is None and bool(articles),
+        }
+        if run_stats is not None:
+            result.update(run_stats.to_dict())
+        if error:
+            result['error'] = error
+        if deferred:
+            result['deferred'] = True
+        self.sources[source_name] = result
+
+    def to_dict(self, **extra):
+        sources = self.sources.values()
+        report = {
+            'started_at': self.started.isoformat(timespec='seconds'),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'wall_seconds': round(time.perf_counter() - self._start, 4),
+            'totals': {
+                'sources': len(self.sources),
+                'sources_ok': sum(1 for s in sources if s['ok']),
+                'sources_deferred': sum(1 for s in sources if s.get('deferred')),
+                'articles': sum(s['articles'] for s in sources),
+                'pages': sum(len(s.get('fetches', [])) for s in sources),
+                'bytes_fetched': sum(s.get('bytes_fetched', 0) for s in sources),
+            },
+            'sources': self.sources,
+        }
+        report.update(extra)
+        return report
+
+    def write(self, reports_dir, retention_days=None, **extra):
+        """Write run_<timestamp>.json atomically and prune reports past the retention"""
+        os.makedirs(reports_dir, exist_ok=True)
+        stamp = self.started.strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(reports_dir, f"{REPORT_PREFIX}{stamp}.json")
+        suffix = 1
+        while os.path.exists(path):
+            suffix += 1
+            path = os.path.join(reports_dir, f"{REPORT_PREFIX}{stamp}_{suffix}.json")
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(**extra), f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        os.replace(tmp_path, path)
+
+        if retention_days:
+            prune_reports(reports_dir, retention_days)
+        return path
+
+
+def prune_reports(reports_dir, retention_days):
+    """Delete run reports older than retention_days; returns the removed paths"""
+    cutoff = (datetime.now() - timedelta(days=retention_days)).timestamp()
+    removed = []
+    for name in os.listdir(reports_dir):
+        if not (name.startswith(REPORT_PREFIX) and name.endswith('.json')):
+            continue
+        path = os.path.join(reports_dir, name)
+        if os.path.getmtime(path) < cutoff:
+            os.remove(path)
+            removed.append(path)
+    return removed
@@ -0,0 +1,124 @@
+"""
+Adaptive recrawl schedule - per-source intervals that follow how often content changes
+
+A crawl whose content fingerprint differs from the previous one shortens the
+source's interval (x SPEEDUP); an unchanged crawl lengthens it (x BACKOFF),
+always within [min_interval, max_interval]. Failed crawls retry after
+min_interval without touching the learned interval. State is kept in a JSON
+file so a restarted daemon resumes with what it learned.
+"""
+import hashlib
+import json
+import os
+import time
+
+BACKOFF = 1.5
+SPEEDUP = 0.5
+
+
+def article_digest(article):
+    """Hash of one article's title and content"""
+    return hashlib.sha1(f"{article.get('title', '')}\n{article.get('content', '')}".encode('utf-8')).hexdigest()
+
+
+def content_fingerprint(articles):
+    """Order-independent hash of the titles and contents of a crawl"""
+    digests = sorted(article_digest(a) for a in articles)
+    return hashlib.sha1('\n'.join(digests).encode('ascii')).hexdigest()
+
+
+class AdaptiveSchedule:
+    """When each source is next due, and how often it has been changing"""
+
+    def __init__(self, min_interval, max_interval, default_interval, state_file=None):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.state_file = state_file
+        self.entries = {}  # name -> {'interval', 'next_run', 'fingerprint', 'checks', 'changes', ...}
+        self._saved = self._load()
+
+    def _load(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        if not self.state_file:
+            return
+        directory = os.path.dirname(self.state_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_file)
+
+    def clamp(self, interval):
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def add(self, name, interval=None, now=None):
+        """Register a source, due now; a saved learned interval wins over the configured one"""
+        now = time.time() if now is None else now
+        entry = self._saved.get(name) or {
+            'interval': self.clamp(interval or self.default_interval),
+            'next_run': now,
+            'fingerprint': None,
+            'checks': 0,
+            'changes': 0,
+            'failures': 0,
+            'last_run': None,
+            'last_changed': None,
+        }
+        entry['next_run'] = now  # outputs are rebuilt from a fresh crawl after every start
+        self.entries[name] = entry
+        return entry
+
+    def due(self, now=None):
+        """Sources whose next run has passed, most overdue first"""
+        now = time.time() if now is None else now
+        ready = [(entry['next_run'], name) for name, entry in self.entries.items() if entry['next_run'] <= now]
+        return [name for _, name in sorted(ready)]
+
+    def seconds_until_next(self, now=None):
+        now = time.time() if now is None else now
+        if not self.entries:
+            return self.default_interval
+        return max(0.0, min(entry['next_run'] for entry in self.entries.values()) - now)
+
+    def record(self, name, fingerprint, now=None, adapt=True):
+        """Record a successful crawl; returns True when the content changed
+
+        adapt=False records the crawl without changing the interval (start-up crawls,
+        which do not say how long the content stayed the same).
+        """
+        now = time.time() if now is None else now
+        entry = self.entries[name]
+        changed = fingerprint != entry['fingerprint']
+
+        if adapt and entry['fingerprint'] is not None:
+            factor = SPEEDUP if changed else BACKOFF
+            entry['interval'] = self.clamp(entry['interval'] * factor)
+        entry['checks'] += 1
+        if changed:
+            entry['changes'] += 1
+            entry['last_changed'] = now
+        entry['fingerprint'] = fingerprint
+        entry['failures'] = 0
+        entry['last_run'] = now
+        entry['next_run'] = now + entry['interval']
+        self.save()
+        return changed
+
+    def record_failure(self, name, now=None):
+        """Crawl failed: retry soon, keep the learned interval"""
+        now = time.time() if now is None else now
+        entry = self.entries[name]
+        entry['failures'] += 1
+        entry['last_run'] = now
+        entry['next_run'] = now + min(self.min_interval * entry['failures'], entry['interval'])
+        self.save()
@@ -0,0 +1,66 @@
+"""
+Staging area - keep per-source results in memory until consolidation
+
+Scrapers that ran for the staged results are held too: their frontier writes
+(detail URLs done, listing digests, watermarks) are committed by published()
+once the consolidated files are written, so an interrupted run loses nothing.
+"""
+
+
+class StagingArea:
+    """Holds scraped articles per source until the consolidated files are written"""
+
+    def __init__(self, file_manager, save_snapshots=False):
+        self.file_manager = file_manager
+        self.save_snapshots = save_snapshots
+        self.results = {}  # source_name -> list of articles (insertion ordered)
+        self.scheme_sources = set()
+        self.unpublished = {}  # source_name -> scraper waiting for the consolidated files
+
+    @staticmethod
+    def is_scheme_source(source_name, source_config):
+        """Schemes go to schemes.txt, everything else to news.txt"""
+        return 'testbook' in source_name.lower() or source_config.get('category') == 'government_schemes'
+
+    def add(self, source_name, source_config, articles):
+        """Stage articles for a source; returns snapshot filename when archival is enabled"""
+        self.results[source_name] = articles
+        if self.is_scheme_source(source_name, source_config):
+            self.scheme_sources.add(source_name)
+
+        if self.save_snapshots:
+            return self.file_manager.save_articles_to_text(articles, source_name)
+        return None
+
+    def hold(self, source_name, scraper):
+        """Keep a scraper's frontier writes back until published()"""
+        self.unpublished[source_name] = scraper
+
+    def published(self):
+        """The consolidated files are written: commit every held scraper's run"""
+        for scraper in self.unpublished.values():
+            scraper.commit_published()
+        self.unpublished = {}
+
+    def reorder(self, source_names):
+        """Put staged sources in this order (results may arrive in any order from a pipeline)"""
+        rank = {name: i for i, name in enumerate(source_names)}
+        self.results = dict(sorted(self.results.items(), key=lambda item: rank.get(item[0], len(rank))))
+
+    @property
+    def news_articles(self):
+        return [a for name, articles in self.results.items()
+                if name not in self.scheme_sources for a in articles]
+
+    @property
+    def scheme_articles(self):
+        return [a for name, articles in self.results.items()
+                if name in self.scheme_sources for a in articles]
+
+    @property
+    def all_articles(self):
+        return [a for articles in self.results.values() for a in articles]
+
+    @property
+    def successful_sources(self):
+        return sum(1 for articles in self.results.values() if articles)
@@ -0,0 +1,97 @@
+"""
+Normalization cache - bounded LRU memo in front of the text cleaning functions
+
+    from utils.text_cache import normalization_cache
+
+    text = normalization_cache.get('clean', raw, clean_text)   # clean_text(raw) on a miss
+    normalization_cache.stats()   # {'hits', 'misses', 'hit_rate', 'size', 'evictions'}
+
+Entries are keyed by (kind, text), so one cache serves several functions.
+The same strings are cleaned over and over: titles cleaned alone and again
+inside "title content" for keywords, headings re-read by the Testbook
+section pass, boilerplate paragraphs repeated on every page of a site.
+Texts longer than max_chars are passed straight through (article bodies
+rarely repeat and would crowd out the short strings that do).
+
+Thread-safe: lookups and inserts take one lock; the function runs outside
+it, so two threads missing the same text may both compute it (same result).
+"""
+import threading
+from collections import OrderedDict
+
+from config.settings import config
+
+
+class NormalizationCache:
+    """LRU map (kind, text) -> normalized text with hit-rate stats"""
+
+    def __init__(self, maxsize=None, max_chars=None):
+        """maxsize: entries kept (0 disables); max_chars: longest text cached (None: follow config)"""
+        self._maxsize = maxsize
+        self._max_chars = max_chars
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._exported = (0, 0)  # hits, misses already added to the metrics registry
+
+    @property
+    def maxsize(self):
+        return config.NORMALIZE_CACHE_SIZE if self._maxsize is None else self._maxsize
+
+    @property
+    def max_chars(self):
+        return config.NORMALIZE_CACHE_MAX_CHARS if self._max_chars is None else self._max_chars
+
+    def get(self, kind, text, func):
+        """func(text), served from the cache when this text was normalized before"""
+        maxsize = self.maxsize
+        if not maxsize or len(text) > self.max_chars:
+            return func(text)
+        key = (kind, text)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = func(text)
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'evictions': self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self._exported = (0, 0)
+
+    def export_metrics(self, registry):
+        """Add the lookups since the last export to cache_hits_total / cache_misses_total"""
+        with self._lock:
+            hits, misses = self.hits - self._exported[0], self.misses - self._exported[1]
+            self._exported = (self.hits, self.misses)
+        if hits:
+            registry.inc('cache_hits', hits, cache='normalize')
+        if misses:
+            registry.inc('cache_misses', misses, cache='normalize')
+
+
+normalization_cache = NormalizationCache()
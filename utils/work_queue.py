@@ -0,0 +1,290 @@
+"""
+Work queue - listing pages and detail URLs leased to crawl workers on any node
+
+    queue = open_queue('sqlite:state/work_queue.sqlite')
+    queue.put(run, 'economic_times_agriculture', 'listing', [url])
+    for item in queue.lease('node1-w0', limit=1, visibility=300):
+        ...fetch and extract...
+        queue.complete(item, articles, links)    # or queue.fail(item, error)
+
+A leased item is invisible to other workers for visibility seconds. A worker
+that dies (or stalls past the lease) loses it and the item is leased again,
+up to max_attempts leases, then parked as failed. complete() and fail() only
+count while the caller still holds the lease, so a late worker cannot
+overwrite the result of the one that took over.
+
+Detail URLs are queued once per source for good: a URL completed on an
+earlier run is never queued again. Listing pages are queued again every run.
+Articles are written to the queue's result sink with the item, in the same
+transaction, and read back per run by the coordinator.
+
+Backends are picked by URL scheme (see BACKENDS). A new backend (e.g. one on
+Redis) subclasses WorkQueue, implements its methods and is registered with
+its "module:Class" path; only the chosen backend is imported.
+"""
+import importlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from utils.article import Article
+
+BACKENDS = {
+    'sqlite': 'utils.work_queue:SqliteWorkQueue',
+}
+
+STATES = ('queued', 'leased', 'done', 'failed')
+
+
+class WorkQueue:
+    """Interface every backend implements; items are dicts with id, run, source, kind, url, lease, attempts"""
+
+    @classmethod
+    def from_url(cls, location, **kwargs):
+        """Open the backend at location (the part of the queue URL after 'scheme:')"""
+        raise NotImplementedError
+
+    def put(self, run, source, kind, urls):
+        """Queue URLs of one kind ('listing' or 'detail') for a run; returns the number queued"""
+        raise NotImplementedError
+
+    def lease(self, worker, limit=1, visibility=300):
+        """Up to limit items, each invisible to other workers for visibility seconds"""
+        raise NotImplementedError
+
+    def extend(self, item, visibility):
+        """Keep a long-running item leased for another visibility seconds; False once the lease is lost"""
+        raise NotImplementedError
+
+    def complete(self, item, articles=(), links=()):
+        """Store an item's articles, queue its detail links and mark it done; False once the lease is lost"""
+        raise NotImplementedError
+
+    def fail(self, item, error, retry=True):
+        """Give an item back for another attempt (or park it as failed); False once the lease is lost"""
+        raise NotImplementedError
+
+    def results(self, run):
+        """{source: [articles]} for a run, in the order the items were queued"""
+        raise NotImplementedError
+
+    def pending(self, run=None):
+        """Items queued or leased (for one run, or any)"""
+        raise NotImplementedError
+
+    def stats(self, run=None):
+        """{state: count}"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    url TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    worker TEXT,
+    lease TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    queued_at REAL NOT NULL,
+    UNIQUE (source, kind, url)
+);
+CREATE INDEX IF NOT EXISTS idx_work_items_lease ON work_items (state, lease_until, id);
+CREATE TABLE IF NOT EXISTS work_results (
+    item_id INTEGER PRIMARY KEY,
+    run TEXT NOT NULL,
+    source TEXT NOT NULL,
+    articles TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_work_results_run ON work_results (run);
+"""
+
+
+class SqliteWorkQueue(WorkQueue):
+    """Queue and result sink in one SQLite file; processes on one host (or a shared disk) coordinate through it"""
+
+    def __init__(self, path, max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Autocommit; write transactions are opened explicitly with BEGIN IMMEDIATE
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')  # readers do not block the worker holding the write lock
+        self.db.executescript(SCHEMA)
+
+    @classmethod
+    def from_url(cls, location, **kwargs):
+        return cls(location, **kwargs)
+
+    def _write(self):
+        return _Transaction(self.db, self._lock)
+
+    def put(self, run, source, kind, urls):
+        now = time.time()
+        rows = [(run, source, kind, url, now) for url in dict.fromkeys(urls)]
+        if kind == 'detail':
+            sql = ('INSERT INTO work_items (run, source, kind, url, queued_at) VALUES (?, ?, ?, ?, ?) '
+                   'ON CONFLICT (source, kind, url) DO NOTHING')
+        else:  # listing pages are read again on every run
+            sql = ('INSERT INTO work_items (run, source, kind, url, queued_at) VALUES (?, ?, ?, ?, ?) '
+                   'ON CONFLICT (source, kind, url) DO UPDATE SET run = excluded.run, state = \'queued\', '
+                   'attempts = 0, error = NULL, lease = NULL, queued_at = excluded.queued_at '
+                   'WHERE state != \'leased\'')
+        with self._write() as db:
+            before = db.total_changes
+            db.executemany(sql, rows)
+            queued = db.total_changes - before
+            if kind == 'listing':
+                # Detail URLs still queued by an interrupted run are collected with this one
+                db.execute("UPDATE work_items SET run = ? WHERE source = ? AND state = 'queued'", (run, source))
+            return queued
+
+    def lease(self, worker, limit=1, visibility=300):
+        now = time.time()
+        with self._write() as db:
+            db.execute(
+                "UPDATE work_items SET state = 'failed', error = 'lease expired', lease = NULL "
+                "WHERE state = 'leased' AND lease_until <= ? AND attempts >= ?",
+                (now, self.max_attempts)
+            )
+            rows = db.execute(
+                "SELECT * FROM work_items WHERE state = 'queued' OR (state = 'leased' AND lease_until <= ?) "
+                "ORDER BY id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            items = []
+            for row in rows:
+                item = dict(row)
+                item.update(state='leased', worker=worker, lease=uuid.uuid4().hex,
+                            lease_until=now + visibility, attempts=row['attempts'] + 1)
+                db.execute(
+                    "UPDATE work_items SET state = 'leased', worker = ?, lease = ?, lease_until = ?, "
+                    "attempts = ? WHERE id = ?",
+                    (worker, item['lease'], item['lease_until'], item['attempts'], item['id'])
+                )
+                items.append(item)
+        return items
+
+    def extend(self, item, visibility):
+        lease_until = time.time() + visibility
+        with self._write() as db:
+            updated = db.execute(
+                "UPDATE work_items SET lease_until = ? WHERE id = ? AND lease = ? AND state = 'leased'",
+                (lease_until, item['id'], item['lease'])
+            ).rowcount
+        if updated:
+            item['lease_until'] = lease_until
+        return bool(updated)
+
+    def complete(self, item, articles=(), links=()):
+        with self._write() as db:
+            held = db.execute(
+                "UPDATE work_items SET state = 'done', lease = NULL, error = NULL "
+                "WHERE id = ? AND lease = ? AND state = 'leased'",
+                (item['id'], item['lease'])
+            ).rowcount
+            if not held:
+                return False
+            if articles:
+                db.execute(
+                    'INSERT OR REPLACE INTO work_results (item_id, run, source, articles) VALUES (?, ?, ?, ?)',
+                    (item['id'], item['run'], item['source'], json.dumps([dict(a) for a in articles], ensure_ascii=False))
+                )
+            now = time.time()
+            db.executemany(
+                'INSERT INTO work_items (run, source, kind, url, queued_at) VALUES (?, ?, \'detail\', ?, ?) '
+                'ON CONFLICT (source, kind, url) DO NOTHING',
+                [(item['run'], item['source'], url, now) for url in dict.fromkeys(links)]
+            )
+        return True
+
+    def fail(self, item, error, retry=True):
+        with self._write() as db:
+            return bool(db.execute(
+                "UPDATE work_items SET lease = NULL, error = ?, "
+                "state = CASE WHEN ? AND attempts < ? THEN 'queued' ELSE 'failed' END "
+                "WHERE id = ? AND lease = ? AND state = 'leased'",
+                (error, retry, self.max_attempts, item['id'], item['lease'])
+            ).rowcount)
+
+    def results(self, run):
+        results = {}
+        with self._lock:
+            rows = self.db.execute(
+                'SELECT source, articles FROM work_results WHERE run = ? ORDER BY item_id', (run,)
+            ).fetchall()
+        for row in rows:
+            results.setdefault(row['source'], []).extend(Article.from_dict(a) for a in json.loads(row['articles']))
+        return results
+
+    def pending(self, run=None):
+        query = "SELECT COUNT(*) FROM work_items WHERE state IN ('queued', 'leased')"
+        params = ()
+        if run:
+            query += ' AND run = ?'
+            params = (run,)
+        with self._lock:
+            return self.db.execute(query, params).fetchone()[0]
+
+    def stats(self, run=None):
+        query = 'SELECT state, COUNT(*) AS n FROM work_items'
+        params = ()
+        if run:
+            query += ' WHERE run = ?'
+            params = (run,)
+        with self._lock:
+            rows = self.db.execute(query + ' GROUP BY state', params).fetchall()
+        counts = dict.fromkeys(STATES, 0)
+        counts.update({row['state']: row['n'] for row in rows})
+        return counts
+
+    def close(self):
+        self.db.close()
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT (ROLLBACK on error), one thread at a time"""
+
+    def __init__(self, db, lock):
+        self.db = db
+        self.lock = lock
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            self.db.execute('BEGIN IMMEDIATE')
+        except Exception:
+            self.lock.release()
+            raise
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.db.execute('COMMIT' if exc_type is None else 'ROLLBACK')
+        finally:
+            self.lock.release()
+        return False
+
+
+def open_queue(url, **kwargs):
+    """Work queue for 'scheme:location'; a bare path is a SQLite file"""
+    scheme, sep, location = url.partition(':')
+    if not sep or scheme not in BACKENDS:
+        scheme, location = 'sqlite', url
+    module_name, _, class_name = BACKENDS[scheme].partition(':')
+    backend = getattr(importlib.import_module(module_name), class_name)
+    return backend.from_url(location, **kwargs)